@@ -0,0 +1,81 @@
+"""
+금액 고정소수점 표현 (최소 단위 정수)
+금액을 float 대신 최소 단위(分/센트, 1/100) 정수로 다룹니다.
+파싱은 Decimal로 정확하게 하고, 합계는 정수 연산, 문자열은 출력할 때만 만듭니다.
+
+    parse_minor('1,531.03')  -> 153103
+    try_parse_minor('abc')   -> None   (대사에서 변환 실패 칸 수를 셀 때 사용)
+    format_minor(345800)     -> '3458.00'
+"""
+
+import numbers
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+
+MINOR_DIGITS = 2
+MINOR_UNITS = 10 ** MINOR_DIGITS
+
+# pandas.read_csv가 결측값으로 읽는 문자열 (convert_new_data와 같은 결과를 내기 위해 동일하게 처리)
+NA_VALUES = {
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND',
+    '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null',
+}
+
+_QUANTUM = Decimal(1)
+
+def try_parse_minor(value):
+    """
+    금액 값을 최소 단위 정수로 변환 (쉼표/따옴표 제거, 결측값은 0, 변환 실패는 None)
+
+    Args:
+        value: 문자열, int, float, Decimal, numpy 스칼라
+               (엑셀/pandas 셀 값의 float는 repr 기준으로 변환)
+    """
+    if value is None:
+        return 0
+    if isinstance(value, numbers.Integral):
+        return int(value) * MINOR_UNITS
+    if isinstance(value, float):
+        if value != value:
+            return 0
+        if value in (float('inf'), float('-inf')):
+            return None
+        value = float.__repr__(value)
+    elif isinstance(value, str):
+        if value in NA_VALUES:
+            return 0
+        value = value.replace(',', '').replace('"', '').strip()
+        if value in ('', '-'):
+            # 공백, 엑셀 회계 서식의 0(' - ')
+            return 0
+        # 흔한 형식('274.21', '-3458', '0')은 Decimal 없이 정수 연산으로 처리
+        negative = value[:1] == '-'
+        units, _, cents = (value[1:] if negative else value).partition('.')
+        if units.isdigit() and (not cents or (len(cents) <= MINOR_DIGITS and cents.isdigit())):
+            minor = int(units) * MINOR_UNITS + int(cents.ljust(MINOR_DIGITS, '0') or 0)
+            return -minor if negative else minor
+    try:
+        amount = Decimal(value)
+    except (InvalidOperation, TypeError, ValueError):
+        return None
+    if not amount.is_finite():
+        return None
+    return int((amount * MINOR_UNITS).quantize(_QUANTUM, rounding=ROUND_HALF_UP))
+
+def parse_minor(value):
+    """
+    금액 값을 최소 단위 정수로 변환 (결측값/변환 실패는 0, try_parse_minor 참고)
+    """
+    minor = try_parse_minor(value)
+    return 0 if minor is None else minor
+
+def format_minor(minor):
+    """
+    최소 단위 정수를 소수 둘째 자리 문자열로 (예: -5 -> '-0.05')
+    """
+    sign = '-' if minor < 0 else ''
+    units, cents = divmod(abs(int(minor)), MINOR_UNITS)
+    return f"{sign}{units}.{cents:0{MINOR_DIGITS}d}"
+
+def minor_to_float(minor):
+    """최소 단위 정수 -> float (JSON/차트 출력용)"""
+    return minor / MINOR_UNITS
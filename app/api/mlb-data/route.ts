@@ -1,17 +1,94 @@
-import { NextResponse } from 'next/server';
+import { NextRequest, NextResponse } from 'next/server';
+import crypto from 'crypto';
 import fs from 'fs';
 import path from 'path';
 
-export async function GET() {
+const DATA_DIR = path.join(process.cwd(), 'public', 'data');
+const MONOLITHIC_FILE = path.join(DATA_DIR, 'mlb_china_data.json');
+// python json_shards.py 로 생성되는 브랜드 × 연도 샤드
+const SHARD_DIR = path.join(DATA_DIR, 'mlb_china_data');
+const MANIFEST_FILE = path.join(SHARD_DIR, 'manifest.json');
+
+interface ShardInfo {
+  brand: string;
+  year: number | null;
+  file: string;
+  bytes: number;
+  rows: number;
+  total: number;
+}
+
+interface ShardManifest {
+  source: string;
+  source_sha256?: string | null;  // 샤드를 만든 mlb_china_data.json의 sha256
+  shards: ShardInfo[];
+}
+
+// 파일별 파싱 결과 캐시 (수정 시각이 바뀌면 다시 읽음)
+const cache = new Map<string, { mtimeMs: number; data: any }>();
+
+function readJson(filePath: string) {
+  const { mtimeMs } = fs.statSync(filePath);
+  const cached = cache.get(filePath);
+  if (cached && cached.mtimeMs === mtimeMs) {
+    return cached.data;
+  }
+  const data = JSON.parse(fs.readFileSync(filePath, 'utf8'));
+  cache.set(filePath, { mtimeMs, data });
+  return data;
+}
+
+// 파일 내용의 sha256 (수정 시각/크기가 바뀌면 다시 계산)
+const digestCache = new Map<string, { mtimeMs: number; size: number; digest: string }>();
+
+function fileDigest(filePath: string) {
+  const { mtimeMs, size } = fs.statSync(filePath);
+  const cached = digestCache.get(filePath);
+  if (cached && cached.mtimeMs === mtimeMs && cached.size === size) {
+    return cached.digest;
+  }
+  const digest = crypto.createHash('sha256').update(fs.readFileSync(filePath)).digest('hex');
+  digestCache.set(filePath, { mtimeMs, size, digest });
+  return digest;
+}
+
+// 샤드가 현재 전체 파일에서 만들어졌는지
+// (extract_mlb_data.js 등이 전체 파일만 다시 쓰면 해시가 달라져 전체 파일을 사용)
+function shardsMatchSource(manifest: ShardManifest) {
+  if (!fs.existsSync(MONOLITHIC_FILE)) {
+    return true;
+  }
+  return !!manifest.source_sha256 && manifest.source_sha256 === fileDigest(MONOLITHIC_FILE);
+}
+
+// ?year=2025 또는 ?year=2024,2025
+function parseYears(request: NextRequest): number[] | null {
+  const param = request.nextUrl.searchParams.get('year');
+  if (!param) {
+    return null;
+  }
+  const years = param.split(',').map(Number).filter(y => Number.isInteger(y));
+  return years.length > 0 ? years : null;
+}
+
+export async function GET(request: NextRequest) {
   try {
-    const filePath = path.join(process.cwd(), 'public', 'data', 'mlb_china_data.json');
-    const fileContents = fs.readFileSync(filePath, 'utf8');
-    const data = JSON.parse(fileContents);
-    
-    return NextResponse.json(data);
+    const years = parseYears(request);
+
+    const manifest: ShardManifest | null = fs.existsSync(MANIFEST_FILE) ? readJson(MANIFEST_FILE) : null;
+    if (manifest && shardsMatchSource(manifest)) {
+      const shards = manifest.shards.filter(
+        shard => shard.brand === 'mlb' && (!years || (shard.year !== null && years.includes(shard.year)))
+      );
+      const data = shards.flatMap(shard => readJson(path.join(SHARD_DIR, shard.file)));
+      return NextResponse.json(data);
+    }
+
+    // 샤드가 없거나 전체 파일과 맞지 않으면 전체 파일에서 연도 필터링
+    const data: any[] = readJson(MONOLITHIC_FILE);
+    return NextResponse.json(years ? data.filter(d => years.includes(d.년도)) : data);
   } catch (error) {
     console.error('Error reading MLB data:', error);
     return NextResponse.json({ error: 'Failed to load data' }, { status: 500 });
   }
 }
-
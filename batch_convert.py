@@ -0,0 +1,207 @@
+"""
+여러 워크북/CSV를 한 번에 변환하는 배치 스크립트
+워커 프로세스를 한 번만 띄우고 (import/파서 준비는 워커당 한 번)
+작업을 나눠 처리한 뒤 작업별 결과/소요 시간을 요약 파일로 저장합니다.
+public/data로 가는 작업은 빌드 디렉토리에 쓰고, 모든 작업이 성공했을 때만 한 번에 배포합니다 (publish_data).
+작업마다 따로 만든 임시 디렉토리에 쓴 뒤 출력 디렉토리로 옮기므로 병렬 작업이 같은 파일을 동시에 쓰지 않고,
+두 작업이 같은 출력 디렉토리에 같은 파티션(사업부, YYYYMM)을 만들면 둘 다 실패로 처리합니다
+(어느 쪽이 남을지 실행 순서에 따라 달라지므로 배포하지 않음).
+
+작업 목록 지정 방법:
+    python batch_convert.py "재유니/20*.csv"          # glob 패턴 (여러 개 가능)
+    python batch_convert.py "exports/*.csv.gz"        # 압축 입력(.gz/.zst/.zip)도 그대로 사용
+    python batch_convert.py --jobs jobs.json          # JSON 작업 파일
+
+jobs.json 형식:
+    [
+        {"input": "exports/2024.csv.gz", "year": 2024, "output": "public/data"},
+        {"input": "재유니/2025.csv"}
+    ]
+
+엑셀 원장(.xlsx)은 사용여부 필터와 환산이 필요하므로 excel_data_cleaner.py로 변환합니다
+(작업 목록에 있으면 실행 전에 거부).
+"""
+
+import argparse
+import glob
+import json
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+
+import input_streams
+from fast_convert import OUTPUT_DIR, convert_file
+from publish_data import new_build_dir, staged_output
+
+SUMMARY_FILE = 'batch_summary.json'
+EXCEL_SUFFIXES = ('.xlsx', '.xlsm')
+
+class BatchFailed(Exception):
+    """작업이 하나라도 실패했을 때 배포를 취소하기 위한 예외"""
+
+def load_jobs(patterns=(), jobs_file=None):
+    """
+    glob 패턴 / JSON 작업 파일에서 작업 목록 만들기
+
+    Returns:
+        [{'input', 'year', 'output'}]
+
+    Raises:
+        ValueError: 'input'이 없거나 엑셀 원장(.xlsx/.xlsm)인 작업이 있을 때
+    """
+    jobs = []
+    if jobs_file:
+        with open(jobs_file, 'r', encoding='utf-8') as f:
+            for job in json.load(f):
+                if 'input' not in job:
+                    raise ValueError(f"'input'이 없는 작업이 있습니다: {job}")
+                jobs.append({
+                    'input': job['input'],
+                    'year': job.get('year'),
+                    'output': job.get('output', OUTPUT_DIR),
+                })
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern))
+        if not matches:
+            print(f"⚠️  일치하는 파일이 없습니다: {pattern}")
+        for path in matches:
+            jobs.append({'input': path, 'year': None, 'output': OUTPUT_DIR})
+    excel = [job['input'] for job in jobs if input_streams.inner_name(job['input']).lower().endswith(EXCEL_SUFFIXES)]
+    if excel:
+        raise ValueError(f"엑셀 원장은 excel_data_cleaner.py로 변환하세요 (사용여부 필터/환산 필요): {excel}")
+    return jobs
+
+def run_job(job):
+    """
+    작업 하나 실행 (워커 프로세스에서 호출)
+
+    Returns:
+        작업 정보 + status / files / seconds / error
+    """
+    started = time.perf_counter()
+    result = dict(job, pid=os.getpid())
+    try:
+        written = convert_file(job['input'], job.get('target', job['output']), year=job['year'], verbose=False)
+        result.update(status='ok', files=len(written))
+    except Exception as e:
+        result.update(status='error', files=0, error=f"{type(e).__name__}: {e}")
+    result['seconds'] = round(time.perf_counter() - started, 4)
+    return result
+
+def collect_outputs(jobs, results):
+    """
+    작업별 임시 디렉토리(job['target'])의 파일을 출력 디렉토리(job['destination'])로 옮기기
+    같은 출력 디렉토리에 같은 파일을 만든 작업들은 실패로 바꾸고, 실패가 있으면 옮기지 않음
+
+    Returns:
+        충돌한 (출력 디렉토리, 파일명) 목록
+    """
+    owners = {}
+    for job, result in zip(jobs, results):
+        if result['status'] != 'ok':
+            continue
+        for name in sorted(os.listdir(job['target'])):
+            owners.setdefault((job['destination'], name), []).append((job, result))
+
+    conflicts = [key for key, owned in owners.items() if len(owned) > 1]
+    clashes = {}   # id(result) -> (result, 충돌 파일명 목록, 상대 입력 집합)
+    for key in conflicts:
+        inputs = [result['input'] for _, result in owners[key]]
+        for _, result in owners[key]:
+            _, names, others = clashes.setdefault(id(result), (result, [], set()))
+            names.append(key[1])
+            others.update(i for i in inputs if i != result['input'])
+    for result, names, others in clashes.values():
+        result['status'] = 'error'
+        result['error'] = (f"파티션 충돌 {len(names)}개 (같은 출력을 만든 작업: {', '.join(sorted(others))}, "
+                           f"예: {names[0]})")
+
+    if all(r['status'] == 'ok' for r in results):
+        for (destination, name), ((job, _),) in owners.items():
+            shutil.move(os.path.join(job['target'], name), os.path.join(destination, name))
+    return conflicts
+
+def run_batch(jobs, workers=None):
+    """
+    작업 목록을 워커 풀에서 실행 (결과는 작업 순서대로)
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(jobs) <= 1:
+        return [run_job(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        return list(pool.map(run_job, jobs))
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='여러 입력 파일 일괄 변환')
+    parser.add_argument('patterns', nargs='*', help='입력 파일 glob 패턴')
+    parser.add_argument('--jobs', help='JSON 작업 파일')
+    parser.add_argument('--workers', type=int, default=None, help='워커 프로세스 수 (기본: CPU 코어 수)')
+    parser.add_argument('--summary', default=SUMMARY_FILE, help='결과 요약 파일')
+    args = parser.parse_args()
+
+    try:
+        jobs = load_jobs(args.patterns, args.jobs)
+    except ValueError as e:
+        parser.error(str(e))
+    if not jobs:
+        parser.error('처리할 작업이 없습니다.')
+
+    print("\n" + "="*70)
+    print(f"🚀 배치 변환 시작: {len(jobs)}개 작업")
+    print("="*70 + "\n")
+
+    started = time.perf_counter()
+    results = []
+    try:
+        with ExitStack() as stack:
+            # 출력 디렉토리별 빌드 디렉토리 (블록을 정상적으로 빠져나갈 때 배포)
+            targets = {}
+            for job in jobs:
+                if job['output'] not in targets:
+                    targets[job['output']] = stack.enter_context(staged_output(job['output']))
+                job['destination'] = targets[job['output']]
+                # 작업별 임시 디렉토리 (끝나면 삭제)
+                job['target'] = new_build_dir()
+                stack.callback(shutil.rmtree, job['target'], True)
+
+            results = run_batch(jobs, args.workers)
+            conflicts = collect_outputs(jobs, results)
+            for result in results:
+                result.pop('target', None)
+                result.pop('destination', None)
+            if conflicts:
+                print(f"⚠️  여러 작업이 같은 파티션을 만들었습니다: {len(conflicts)}개 파일")
+            if any(r['status'] != 'ok' for r in results):
+                raise BatchFailed()
+    except BatchFailed:
+        # staged_output은 예외로 끝나면 빌드 디렉토리만 지우고 배포하지 않음
+        print("⚠️  실패한 작업이 있어 배포하지 않았습니다 (public/data는 이전 상태 유지)\n")
+    elapsed = time.perf_counter() - started
+
+    for result in results:
+        if result['status'] == 'ok':
+            print(f"   ✅ {result['input']}: {result['files']}개 파일 ({result['seconds']:.2f}초)")
+        else:
+            print(f"   ❌ {result['input']}: {result['error']}")
+
+    failed = sum(1 for r in results if r['status'] != 'ok')
+    summary = {
+        'jobs': len(results),
+        'failed': failed,
+        'seconds': round(elapsed, 4),
+        'results': results,
+    }
+    with open(args.summary, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2)
+
+    print(f"\n✅ 완료: {len(results) - failed}/{len(results)}개 작업 성공 ({elapsed:.2f}초)")
+    print(f"📁 요약: {args.summary}")
+    if failed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
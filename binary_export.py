@@ -0,0 +1,183 @@
+"""
+브랜드별 대시보드용 바이너리 파일 생성
+브랜드의 월별 파티션 CSV를 하나의 리틀 엔디언 바이너리로 묶어서
+브라우저가 텍스트 파싱 없이 ArrayBuffer를 바로 typed array로 볼 수 있게 합니다.
+(읽는 쪽: lib/costBinary.ts)
+CSV 경로(BrandDashboard)와 같은 행이 되도록 금액이 0인 행은 빼고 문자열은 앞뒤 공백을 제거합니다.
+파티션이 바뀌면 publish_data가 배포 직전에 해당 브랜드의 바이너리를 다시 만들므로
+어떤 변환 스크립트로 갱신해도 CSV와 어긋나지 않습니다.
+
+출력: public/data/cost_{brand}.bin
+
+형식 (모두 리틀 엔디언, 각 구간은 8바이트 경계에서 시작):
+    헤더      magic 'FCBIN\\0\\0\\0' (8바이트)
+              uint32 × 8: 버전, 행 수, 월 수, 컬럼 수, 문자열 수, 문자열 바이트 수, 0, 0
+    컬럼 이름  uint32[컬럼 수]            문자열 번호
+    월        uint32[월 수]              YYYYMM
+    월 오프셋  uint32[월 수 + 1]          월 i의 행 = [오프셋[i], 오프셋[i+1])
+    금액      float64[행 수]             최소 단위 정수 값 (원 = 값 / 100)
+    코드      uint16[컬럼 수 × 행 수]     컬럼 순서대로 이어 붙인 문자열 번호
+    문자열    uint32[문자열 수 + 1]       UTF-8 바이트 오프셋, 이어서 UTF-8 바이트
+
+사용법:
+    python binary_export.py                 # 전체 브랜드
+    python binary_export.py --brands mlb kids
+"""
+
+import argparse
+import os
+import struct
+import time
+
+import numpy as np
+
+from amounts import parse_minor
+from cost_facts import DATA_DIR, FACT_COLUMNS, list_partitions, read_partition
+from publish_data import staged_output
+
+MAGIC = b'FCBIN\0\0\0'
+VERSION = 1
+HEADER = struct.Struct('<8s8I')
+# 금액/년월을 뺀 문자열 컬럼 (코드로 저장)
+BINARY_COLUMNS = [col for col in FACT_COLUMNS if col not in ('금액', '년월')]
+MAX_STRINGS = 1 << 16   # uint16 코드
+
+def binary_filename(brand_id):
+    return f'cost_{brand_id}.bin'
+
+def _padded(data):
+    """8바이트 경계까지 0으로 채우기"""
+    return data + b'\0' * (-len(data) % 8)
+
+def encode_brand(partitions):
+    """
+    브랜드 파티션들을 바이너리 한 덩어리로
+
+    Args:
+        partitions: 한 브랜드의 [(브랜드 ID, YYYYMM, 경로)] (월 순)
+
+    Returns:
+        bytes
+    """
+    strings = {}
+
+    def code(value):
+        return strings.setdefault(value, len(strings))
+
+    column_codes = [code(col) for col in BINARY_COLUMNS]
+    months, offsets, amounts = [], [0], []
+    codes = [[] for _ in BINARY_COLUMNS]
+    for _, yyyymm, path in partitions:
+        rows = read_partition(path)
+        for row in rows:
+            amount = parse_minor(row['금액'])
+            if amount == 0:
+                continue
+            amounts.append(amount)
+            for column, col in zip(codes, BINARY_COLUMNS):
+                column.append(code((row[col] or '').strip()))
+        months.append(int(yyyymm))
+        offsets.append(len(amounts))
+
+    if len(strings) > MAX_STRINGS:
+        raise ValueError(f"문자열이 {len(strings):,}개로 uint16 코드 범위를 넘습니다")
+
+    blobs = [value.encode('utf-8') for value in strings]
+    string_offsets = np.zeros(len(blobs) + 1, dtype='<u4')
+    string_offsets[1:] = np.cumsum([len(b) for b in blobs])
+    blob = b''.join(blobs)
+
+    header = HEADER.pack(MAGIC, VERSION, len(amounts), len(months), len(BINARY_COLUMNS),
+                         len(blobs), len(blob), 0, 0)
+    sections = [
+        header,
+        np.array(column_codes, dtype='<u4').tobytes(),
+        np.array(months, dtype='<u4').tobytes(),
+        np.array(offsets, dtype='<u4').tobytes(),
+        np.array(amounts, dtype='<f8').tobytes(),
+        np.array(codes, dtype='<u2').reshape(-1).tobytes(),
+        string_offsets.tobytes(),
+        blob,
+    ]
+    return b''.join(_padded(section) for section in sections)
+
+def decode_brand(data):
+    """
+    바이너리 → (컬럼 목록, 월 목록, 월 오프셋, 금액(최소 단위), {컬럼: 코드 배열}, 문자열 목록)
+    (lib/costBinary.ts와 같은 순서로 읽음, 검증용)
+    """
+    magic, version, n_rows, n_months, n_columns, n_strings, n_bytes, _, _ = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("cost 바이너리 파일이 아닙니다")
+
+    pos = HEADER.size
+
+    def take(dtype, count):
+        nonlocal pos
+        array = np.frombuffer(data, dtype=dtype, count=count, offset=pos)
+        pos += array.nbytes + (-array.nbytes % 8)
+        return array
+
+    column_codes = take('<u4', n_columns)
+    months = take('<u4', n_months)
+    offsets = take('<u4', n_months + 1)
+    amounts = take('<f8', n_rows)
+    codes = take('<u2', n_columns * n_rows).reshape(n_columns, n_rows)
+    string_offsets = take('<u4', n_strings + 1)
+    blob = data[pos:pos + n_bytes]
+    strings = [blob[a:b].decode('utf-8') for a, b in zip(string_offsets[:-1], string_offsets[1:])]
+
+    columns = [strings[c] for c in column_codes]
+    return (columns, [str(m) for m in months], offsets, amounts.astype(np.int64),
+            dict(zip(columns, codes)), strings)
+
+def write_brand_binary(brand_id, partitions, output_dir=DATA_DIR):
+    """
+    브랜드 하나의 cost_{brand}.bin 저장 (임시 파일 후 교체)
+
+    Returns:
+        (경로, 행 수)
+    """
+    data = encode_brand(sorted(partitions, key=lambda p: p[1]))
+    path = os.path.join(output_dir, binary_filename(brand_id))
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+    return path, HEADER.unpack_from(data)[2]
+
+def write_brand_binaries(data_dir=DATA_DIR, output_dir=None, brands=None):
+    """
+    data_dir 파티션으로 브랜드별 cost_{brand}.bin 저장
+
+    Returns:
+        [(브랜드 ID, 경로, 행 수)]
+    """
+    by_brand = {}
+    for partition in list_partitions(data_dir, brands):
+        by_brand.setdefault(partition[0], []).append(partition)
+    return [(brand_id, *write_brand_binary(brand_id, partitions, output_dir or data_dir))
+            for brand_id, partitions in by_brand.items()]
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='브랜드별 대시보드용 바이너리 파일 생성')
+    parser.add_argument('--brands', nargs='*', help='브랜드 파일 ID (예: mlb kids, 없으면 전체)')
+    parser.add_argument('--data-dir', default=DATA_DIR)
+    parser.add_argument('--output-dir', default=None, help='저장 위치 (기본: --data-dir)')
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    # 빌드 디렉토리에 쓴 뒤 public/data를 한 번에 교체 (publish_data)
+    with staged_output(args.output_dir or args.data_dir, snapshot=False) as target:
+        written = write_brand_binaries(args.data_dir, target, args.brands)
+        sizes = {path: os.path.getsize(path) for _, path, _ in written}
+    if not written:
+        print("❌ 처리할 파티션이 없습니다.")
+        return
+    for brand_id, path, rows in written:
+        print(f"   ✅ {binary_filename(brand_id)}: {rows:,}행 ({sizes[path] / 1024:.1f}KB)")
+    print(f"\n⏱️  {time.perf_counter() - started:.2f}초")
+
+if __name__ == "__main__":
+    main()
@@ -1,24 +1,32 @@
 """
 엑셀 파일 구조 확인 스크립트
+
+사용법:
+    python check_excel_structure.py [--fast] [--workers N]
 """
 
-import pandas as pd
 import sys
 
-def check_excel_file(filename):
+from workbook_reader import print_schema, read_workbook, sniff_workbook, workers_option
+
+def check_excel_file(filename, fast=False, workers=None):
     print(f"\n{'='*60}")
     print(f"파일: {filename}")
     print(f"{'='*60}\n")
     
+    if fast:
+        # 헤더 + 일부 행만 읽는 빠른 모드
+        print_schema(sniff_workbook(filename))
+        return
+    
     try:
-        # 엑셀 파일의 모든 시트 이름 확인
-        excel_file = pd.ExcelFile(filename)
-        print(f"📑 시트 목록: {excel_file.sheet_names}\n")
+        # 엑셀 파일을 한 번 열어서 모든 시트 읽기
+        sheets = read_workbook(filename, workers=workers)
+        print(f"📑 시트 목록: {list(sheets)}\n")
         
         # 각 시트 확인
-        for sheet_name in excel_file.sheet_names:
+        for sheet_name, df in sheets.items():
             print(f"\n--- 시트: {sheet_name} ---")
-            df = pd.read_excel(filename, sheet_name=sheet_name)
             print(f"행 수: {len(df)}")
             print(f"컬럼: {list(df.columns)}\n")
             print("처음 3행:")
@@ -39,10 +47,12 @@ def check_excel_file(filename):
 
 if __name__ == "__main__":
     files = ['2024.1-12.XLSX', '2025.1-10.XLSX']
+    fast = '--fast' in sys.argv
+    workers = workers_option(sys.argv)
     
     for f in files:
         try:
-            check_excel_file(f)
+            check_excel_file(f, fast=fast, workers=workers)
         except Exception as e:
             print(f"파일 {f} 처리 실패: {e}")
 
@@ -0,0 +1,296 @@
+"""
+큰 피벗 CSV 하나를 여러 프로세스로 나눠 변환
+파일을 바이트 위치 기준 행 범위로 나누고, 워커마다 자기 범위만 읽어
+0이 아닌 칸을 희소 행렬(sparse_matrix.SparseCostMatrix)로 만듭니다.
+워커 결과(행 번호, 월 번호, 금액, 차원 코드)는 pickle 대신 공유 메모리 int64 배열로 넘기고,
+차원 라벨(작은 문자열 목록)만 함께 돌려받습니다.
+공유 메모리 이름은 메인 프로세스가 정해서 넘기고, 워커가 실패해도 메인 프로세스가
+finally에서 모든 이름을 unlink 하므로 /dev/shm에 남지 않습니다.
+메인 프로세스는 범위 순서대로 합쳐서 원래 행 순서를 유지합니다.
+워커는 행렬을 만들면서 같이 누적한 자기 범위의 원천 월별 합계(SparseCostMatrix.source_totals)도 돌려주고,
+메인 프로세스가 합친 합계로 파티션을 쓰기 전에 대사합니다 (fast_convert와 같은 검사).
+
+범위 경계는 따옴표 밖의 줄바꿈에만 두므로 따옴표 안에 줄바꿈이 있는 CSV도 안전합니다.
+메인 프로세스는 파일 전체를 읽지 않습니다: 인코딩과 헤더는 앞부분 표본으로 판별하고,
+경계는 워커들이 병렬로 센 구간별 따옴표 개수로 찾습니다.
+
+사용법:
+    python chunk_parallel.py 재유니/2025.csv --workers 4
+    python fast_convert.py 큰파일.csv --workers 4
+"""
+
+import argparse
+import csv
+import io
+import os
+import secrets
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+import input_streams
+from fast_convert import OUTPUT_DIR, ReconciliationError, merge_source_totals
+from publish_data import staged_output
+from sparse_matrix import DIMENSIONS, SparseCostMatrix
+
+MIN_CHUNK_BYTES = 1 << 20   # 범위 하나의 최소 크기 (이보다 작으면 나누지 않음)
+SAMPLE_BYTES = 1 << 16      # 인코딩/헤더 판별에 읽는 앞부분 크기
+BLOCK_BYTES = 1 << 20       # 경계 탐색/따옴표 개수 세기의 읽기 단위
+ENCODINGS = ('utf-8-sig', 'cp949', 'euc-kr')
+
+def detect_encoding(data):
+    """바이트의 인코딩 (fast_convert.read_csv_rows와 같은 순서로 시도)"""
+    for encoding in ENCODINGS:
+        try:
+            data.decode(encoding)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+    raise ValueError("인코딩을 알 수 없습니다")
+
+def read_sample(f):
+    """
+    파일 앞부분(SAMPLE_BYTES 이상, 첫 줄은 전부)을 마지막 줄바꿈까지 읽기
+    (멀티바이트 글자 중간에서 잘려 인코딩 판별이 틀리지 않게)
+    """
+    data = f.read(SAMPLE_BYTES)
+    while b'\n' not in data:
+        block = f.read(SAMPLE_BYTES)
+        if not block:
+            return data
+        data += block
+    if f.read(1):
+        data = data[:data.rfind(b'\n') + 1]
+    return data
+
+def _count_quotes(task):
+    """워커: 바이트 범위 안의 따옴표 개수 (블록 단위로 읽음)"""
+    path, start, end = task
+    count = 0
+    with open(path, 'rb') as f:
+        f.seek(start)
+        while start < end:
+            block = f.read(min(BLOCK_BYTES, end - start))
+            if not block:
+                break
+            count += block.count(b'"')
+            start += len(block)
+    return count
+
+def _next_boundary(f, pos, quotes):
+    """
+    pos부터 앞으로 읽으며 따옴표 밖의 첫 줄바꿈 바로 뒤 위치 찾기 (없으면 None)
+
+    Args:
+        quotes: 본문 시작부터 pos까지의 따옴표 개수
+    """
+    f.seek(pos)
+    while True:
+        block = f.read(BLOCK_BYTES)
+        if not block:
+            return None
+        start = 0
+        while True:
+            newline = block.find(b'\n', start)
+            if newline < 0:
+                break
+            quotes += block.count(b'"', start, newline)
+            if quotes % 2 == 0:
+                return pos + newline + 1
+            start = newline + 1
+        quotes += block.count(b'"', start)
+        pos += len(block)
+
+def split_ranges(path, body_start, size, chunks, pool):
+    """
+    본문(body_start부터 파일 끝까지)을 최대 chunks개의 (시작, 끝) 바이트 범위로 나누기
+    (경계는 따옴표 밖의 줄바꿈 바로 뒤)
+
+    워커들이 대략 나눈 구간의 따옴표 개수를 병렬로 세고, 메인 프로세스는 그 누적 개수로
+    각 대략 위치 뒤의 첫 경계만 찾으므로 파일 전체를 읽지 않습니다.
+    """
+    nominal = [body_start + (size - body_start) * i // chunks for i in range(chunks)]
+    counts = list(pool.map(_count_quotes, [(path, start, end) for start, end in zip(nominal, nominal[1:])]))
+    bounds = [body_start]
+    quotes = 0
+    with open(path, 'rb') as f:
+        for pos, count in zip(nominal[1:], counts):
+            quotes += count
+            boundary = _next_boundary(f, pos, quotes)
+            if boundary is None or boundary >= size:
+                break
+            if boundary > bounds[-1]:   # 아주 긴 따옴표 칸이면 앞 경계가 이미 넘어감
+                bounds.append(boundary)
+    bounds.append(size)
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+
+def _parse_range(task):
+    """
+    워커: 바이트 범위를 희소 행렬로 변환하고 결과 배열을 메인 프로세스가 정한 이름의
+    공유 메모리에 기록 (unlink는 메인 프로세스 담당)
+
+    Returns:
+        (공유 메모리 이름, nnz, 행 수, 차원 라벨 목록, 범위의 원천 월별 합계)
+    """
+    path, start, end, header, encoding, year, name = task
+    with open(path, 'rb') as f:
+        f.seek(start)
+        text = f.read(end - start).decode(encoding)
+    matrix = SparseCostMatrix.from_rows(header, csv.reader(io.StringIO(text, newline='')), year)
+
+    nnz, n_rows = matrix.nnz, matrix.n_rows
+    size = (3 * nnz + len(DIMENSIONS) * n_rows) * 8
+    shm = shared_memory.SharedMemory(name=name, create=True, size=max(size, 8))
+    try:
+        buffer = np.ndarray(3 * nnz + len(DIMENSIONS) * n_rows, dtype=np.int64, buffer=shm.buf)
+        buffer[0:nnz] = matrix.row
+        buffer[nnz:2 * nnz] = matrix.month_index()
+        buffer[2 * nnz:3 * nnz] = matrix.amount
+        buffer[3 * nnz:] = matrix.codes.reshape(-1)
+        del buffer
+    finally:
+        shm.close()
+    return shm.name, nnz, n_rows, matrix.labels, matrix.source_totals
+
+def _collect(result):
+    """공유 메모리 결과를 numpy 배열로 복사 (unlink는 read_parallel의 finally)"""
+    name, nnz, n_rows, labels, totals = result
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        buffer = np.ndarray(3 * nnz + len(DIMENSIONS) * n_rows, dtype=np.int64, buffer=shm.buf)
+        row = buffer[0:nnz].copy()
+        month = buffer[nnz:2 * nnz].copy()
+        amount = buffer[2 * nnz:3 * nnz].copy()
+        codes = buffer[3 * nnz:].reshape(n_rows, len(DIMENSIONS)).copy()
+        del buffer
+    finally:
+        shm.close()
+    return row, month, amount, codes, labels, totals
+
+def _unlink_segments(names):
+    """워커가 만든 공유 메모리 모두 삭제 (만들기 전에 실패한 이름은 건너뜀)"""
+    for name in names:
+        try:
+            shm = shared_memory.SharedMemory(name=name)
+        except FileNotFoundError:
+            continue
+        shm.close()
+        shm.unlink()
+
+def merge_chunks(months, parts):
+    """
+    범위별 결과를 원래 행 순서의 SparseCostMatrix 하나로 합치기
+
+    Args:
+        months: 월 목록 (모든 범위에서 같음)
+        parts: 범위 순서의 (row, month, amount, codes, labels, 원천 월별 합계)
+    """
+    lookups = [{} for _ in DIMENSIONS]
+    rows, month_idx, amounts, codes = [], [], [], []
+    offset = 0
+    for row, month, amount, local_codes, labels, _ in parts:
+        remapped = np.empty_like(local_codes)
+        for d, (lookup, local_labels) in enumerate(zip(lookups, labels)):
+            mapping = np.array([lookup.setdefault(label, len(lookup)) for label in local_labels],
+                               dtype=np.int64)
+            remapped[:, d] = mapping[local_codes[:, d]] if len(local_codes) else local_codes[:, d]
+        rows.append(row + offset)
+        month_idx.append(month)
+        amounts.append(amount)
+        codes.append(remapped)
+        offset += len(local_codes)
+
+    row = np.concatenate(rows) if rows else np.empty(0, dtype=np.int64)
+    month = np.concatenate(month_idx) if month_idx else np.empty(0, dtype=np.int64)
+    amount = np.concatenate(amounts) if amounts else np.empty(0, dtype=np.int64)
+    # 범위 순서로 이어 붙인 뒤 월 기준 안정 정렬 → 월 안에서는 원래 행 순서
+    order = np.argsort(month, kind='stable')
+    month_ptr = np.zeros(len(months) + 1, dtype=np.int64)
+    month_ptr[1:] = np.cumsum(np.bincount(month, minlength=len(months)))
+    all_codes = np.concatenate(codes) if codes else np.empty((0, len(DIMENSIONS)), dtype=np.int64)
+    return SparseCostMatrix(months, month_ptr, row[order].astype(np.int32), amount[order],
+                            all_codes.astype(np.int32), [list(lookup) for lookup in lookups],
+                            merge_source_totals(part[5] for part in parts))
+
+def read_parallel(path, workers=None, year=None):
+    """
+    CSV 하나를 행 범위로 나눠 병렬로 희소 행렬 만들기
+
+    Returns:
+        SparseCostMatrix (단일 프로세스 SparseCostMatrix.from_file과 같은 결과)
+    """
+    if input_streams.compression_of(path):
+        # 압축 스트림은 바이트 위치로 나눌 수 없으므로 한 프로세스에서 풀면서 읽음
+        return SparseCostMatrix.from_file(path, year=year)
+
+    size = os.path.getsize(path)
+    with open(path, 'rb') as f:
+        sample = read_sample(f)
+    # 인코딩은 앞부분 표본으로 판별하고, 뒤쪽 범위가 그 인코딩으로 풀리지 않으면 아래에서 다시 읽음
+    encoding = detect_encoding(sample)
+    body_start = sample.find(b'\n') + 1 if b'\n' in sample else len(sample)
+    header = next(csv.reader([sample[:body_start].decode(encoding).rstrip('\r\n')]), [])
+    del sample
+
+    workers = workers or os.cpu_count() or 1
+    chunks = max(1, min(workers, size // MIN_CHUNK_BYTES))
+    if chunks <= 1:
+        return SparseCostMatrix.from_file(path, year=year)
+
+    months = SparseCostMatrix.from_rows(header, [], year).months
+    # 워커보다 먼저 메인 프로세스의 resource tracker를 띄워 워커와 같은 tracker를 쓰게 함
+    # (fork 워커가 각자 tracker를 띄우면 워커 종료 시 세그먼트를 먼저 지움)
+    resource_tracker.ensure_running()
+    names = []
+    try:
+        with ProcessPoolExecutor(max_workers=chunks) as pool:
+            ranges = split_ranges(path, body_start, size, chunks, pool)
+            if len(ranges) <= 1:
+                return SparseCostMatrix.from_file(path, year=year)
+            prefix = f'fc_{os.getpid()}_{secrets.token_hex(4)}'
+            names = [f'{prefix}_{i}' for i in range(len(ranges))]
+            tasks = [(path, start, end, header, encoding, year, name)
+                     for (start, end), name in zip(ranges, names)]
+            parts = [_collect(result) for result in pool.map(_parse_range, tasks)]
+    except UnicodeDecodeError:
+        # 표본 뒤에 다른 인코딩의 바이트가 있음 → 파일 전체 기준으로 판별하는 단일 프로세스로 읽음
+        return SparseCostMatrix.from_file(path, year=year)
+    finally:
+        # 풀이 끝난 뒤(남은 워커 종료 후) 성공/실패와 관계없이 모든 세그먼트 삭제
+        _unlink_segments(names)
+    return merge_chunks(months, parts)
+
+def convert_parallel(path, output_dir=OUTPUT_DIR, workers=None, year=None, verbose=True):
+    """
+    병렬로 읽어서 cost_{brand}_{yyyymm}.csv 파티션 쓰기 (쓰기 전에 원천/출력 합계 대사)
+
+    Returns:
+        저장한 파일 경로 목록
+
+    Raises:
+        ReconciliationError: 허용 오차를 넘는 차이나 금액 변환 실패 칸이 있을 때 (파일은 쓰지 않음)
+    """
+    return read_parallel(path, workers, year).write_partitions(output_dir, verbose)
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='큰 피벗 CSV 병렬 변환')
+    parser.add_argument('input')
+    parser.add_argument('--workers', type=int, default=None, help='워커 프로세스 수 (기본: CPU 코어 수)')
+    parser.add_argument('--output-dir', default=OUTPUT_DIR)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    try:
+        with staged_output(args.output_dir) as output_dir:
+            written = convert_parallel(args.input, output_dir, args.workers, verbose=False)
+    except ReconciliationError as e:
+        print(f"❌ {args.input}: {e}\n   배포하지 않았습니다")
+        sys.exit(1)
+    print(f"✅ {args.input}: {len(written)}개 파일 ({(time.perf_counter() - started) * 1000:.0f}ms)")
+
+if __name__ == "__main__":
+    main()
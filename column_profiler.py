@@ -0,0 +1,198 @@
+"""
+컬럼 프로파일러
+데이터를 한 번만 훑으면서 컬럼별 값 분포를 계산합니다.
+- 고유 값이 적은 컬럼 (사업부, 대분류 등): value_counts 해시 집계로 정확한 개수
+- 고유 값이 많은 컬럼 (코스트센터, 계정 등): HyperLogLog 고유 값 추정 + 상위 빈도 값 요약
+청크 단위로 처리하므로 메모리 사용량은 청크 크기와 요약 크기로 제한됩니다.
+
+사용법:
+    python column_profiler.py 재유니/2024.csv
+    python column_profiler.py 큰파일.csv --chunksize 200000 -o column_profile.json
+"""
+
+import argparse
+import json
+import math
+import os
+
+import numpy as np
+import pandas as pd
+
+EXACT_LIMIT = 1000      # 고유 값이 이 개수를 넘으면 근사 모드로 전환
+TOP_K = 20              # 보고할 상위 빈도 값 수
+SUMMARY_FACTOR = 10     # 상위 값 요약에 유지할 후보 수 = TOP_K * SUMMARY_FACTOR
+HLL_PRECISION = 14      # HyperLogLog 레지스터 2^14개 (표준오차 약 0.8%)
+CHUNKSIZE = 100_000
+
+def _bit_length(values):
+    """uint64 배열의 비트 길이 (벡터 연산)"""
+    x = values.copy()
+    n = np.zeros(x.shape, dtype=np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        mask = x >= (np.uint64(1) << np.uint64(shift))
+        n[mask] += shift
+        x[mask] >>= np.uint64(shift)
+    return n + (x > 0)
+
+class HyperLogLog:
+    """
+    고유 값 개수 추정기 (해시 배열 단위로 갱신)
+    """
+
+    def __init__(self, precision=HLL_PRECISION):
+        self.p = precision
+        self.m = 1 << precision
+        self.registers = np.zeros(self.m, dtype=np.uint8)
+
+    def add_hashes(self, hashes):
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        if len(hashes) == 0:
+            return
+        idx = (hashes >> np.uint64(64 - self.p)).astype(np.int64)
+        rest = hashes & np.uint64((1 << (64 - self.p)) - 1)
+        rho = (64 - self.p) - _bit_length(rest) + 1
+        np.maximum.at(self.registers, idx, rho.astype(np.uint8))
+
+    def add_values(self, values):
+        self.add_hashes(pd.util.hash_array(np.asarray(values, dtype=object)))
+
+    def estimate(self):
+        m = self.m
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros:
+            return m * math.log(m / zeros)
+        return float(raw)
+
+class ColumnProfile:
+    """
+    컬럼 하나의 누적 프로파일
+
+    처음에는 정확한 value_counts를 유지하다가, 고유 값이 exact_limit을 넘으면
+    HyperLogLog + 상위 후보 요약(병합 가능한 빈도 요약)으로 전환
+    """
+
+    def __init__(self, name, exact_limit=EXACT_LIMIT, top_k=TOP_K):
+        self.name = name
+        self.exact_limit = exact_limit
+        self.top_k = top_k
+        self.capacity = top_k * SUMMARY_FACTOR
+        self.rows = 0
+        self.nulls = 0
+        self.counts = pd.Series(dtype='int64')   # 정확 모드: 값 -> 개수
+        self.hll = None                          # 근사 모드
+        self.error_bound = 0                     # 근사 모드에서 개수가 덜 셀 수 있는 최대치
+
+    @property
+    def exact(self):
+        return self.hll is None
+
+    def update(self, series):
+        self.rows += len(series)
+        self.nulls += int(series.isna().sum())
+
+        chunk_counts = series.dropna().value_counts(sort=False)
+        if len(chunk_counts) == 0:
+            return
+
+        if self.exact:
+            self.counts = self.counts.add(chunk_counts, fill_value=0).astype('int64')
+            if len(self.counts) > self.exact_limit:
+                self.hll = HyperLogLog()
+                self.hll.add_values(self.counts.index.to_numpy())
+                self._trim()
+            return
+
+        self.hll.add_values(chunk_counts.index.to_numpy())
+        self.counts = self.counts.add(chunk_counts, fill_value=0).astype('int64')
+        self._trim()
+
+    def _trim(self):
+        """상위 capacity개 후보만 남기고, 버린 값의 최대 개수를 오차 한도에 누적"""
+        if len(self.counts) <= self.capacity:
+            return
+        ordered = self.counts.sort_values(ascending=False, kind='stable')
+        self.error_bound += int(ordered.iloc[self.capacity])
+        self.counts = ordered.iloc[:self.capacity]
+
+    def to_dict(self):
+        ordered = self.counts.sort_values(ascending=False, kind='stable')
+        result = {
+            'rows': self.rows,
+            'nulls': self.nulls,
+            'mode': 'exact' if self.exact else 'approximate',
+        }
+        if self.exact:
+            result['distinct'] = len(ordered)
+            result['value_counts'] = {str(k): int(v) for k, v in ordered.items()}
+        else:
+            result['distinct_estimate'] = int(round(self.hll.estimate()))
+            result['top'] = [{'value': str(k), 'count': int(v)}
+                             for k, v in ordered.iloc[:self.top_k].items()]
+            result['count_error_bound'] = self.error_bound
+        return result
+
+def profile_chunks(chunks, columns=None, exact_limit=EXACT_LIMIT, top_k=TOP_K):
+    """
+    데이터프레임 청크들을 한 번씩만 훑어서 컬럼별 프로파일 계산
+
+    Returns:
+        {컬럼명: 프로파일 dict}
+    """
+    profiles = {}
+    for chunk in chunks:
+        cols = columns if columns is not None else chunk.columns
+        for col in cols:
+            if col not in profiles:
+                profiles[col] = ColumnProfile(col, exact_limit, top_k)
+            profiles[col].update(chunk[col])
+    return {str(col): profile.to_dict() for col, profile in profiles.items()}
+
+def profile_frame(df, columns=None, exact_limit=EXACT_LIMIT, top_k=TOP_K):
+    """
+    메모리에 있는 데이터프레임 프로파일
+    """
+    return profile_chunks([df], columns, exact_limit, top_k)
+
+def profile_file(path, chunksize=CHUNKSIZE, columns=None, exact_limit=EXACT_LIMIT, top_k=TOP_K):
+    """
+    CSV는 청크 단위로 읽고, 엑셀은 시트별로 읽어서 프로파일
+
+    Returns:
+        {시트 또는 파일명: {컬럼명: 프로파일 dict}}
+    """
+    if path.lower().endswith('.csv'):
+        chunks = pd.read_csv(path, encoding='utf-8-sig', chunksize=chunksize, dtype=str)
+        return {os.path.basename(path): profile_chunks(chunks, columns, exact_limit, top_k)}
+
+    from workbook_reader import read_workbook
+
+    return {sheet: profile_frame(df, columns, exact_limit, top_k)
+            for sheet, df in read_workbook(path).items()}
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='컬럼 값 분포 프로파일링')
+    parser.add_argument('files', nargs='+')
+    parser.add_argument('--chunksize', type=int, default=CHUNKSIZE)
+    parser.add_argument('--exact-limit', type=int, default=EXACT_LIMIT)
+    parser.add_argument('--top-k', type=int, default=TOP_K)
+    parser.add_argument('-o', '--output', default='column_profile.json')
+    args = parser.parse_args()
+
+    result = {}
+    for path in args.files:
+        print(f"📂 프로파일링: {path}")
+        result[path] = profile_file(path, args.chunksize, None, args.exact_limit, args.top_k)
+        for sheet, profiles in result[path].items():
+            for col, profile in profiles.items():
+                distinct = profile.get('distinct', profile.get('distinct_estimate'))
+                print(f"   [{sheet}] {col}: {profile['mode']}, 고유 값 {distinct:,}개")
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+    print(f"\n✅ 저장 완료: {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -21,6 +21,18 @@ import {
 import { ArrowLeft, TrendingUp, TrendingDown, Calendar, DollarSign, Edit, ChevronRight, ChevronDown, Users, Sparkles, Brain, Save, X } from 'lucide-react';
 import Link from 'next/link';
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
+import {
+  CostBinary,
+  CostFilter,
+  fetchCostBinary,
+  sumCost,
+  sumCostBy,
+  sumCostRecords,
+  sumCostRecordsBy,
+  toCostRecords,
+} from '@/lib/costBinary';
+import { CostAnalytics, fetchCostAnalytics, findSeries, seriesRecords, tableRecords } from '@/lib/costAnalytics';
+import { DrilldownIndex, DrilldownNode, fetchDrilldownIndex, fetchDrilldownShard } from '@/lib/drilldownTree';
 
 interface CostData {
   브랜드: string;
@@ -99,6 +111,7 @@ export default function BrandDashboard({
   initialMonth?: string;
 }) {
   const [allData, setAllData] = useState<CostData[]>([]);
+  const [costBinary, setCostBinary] = useState<CostBinary | null>(null); // 있으면 합계는 타입 배열에서 바로 집계
   const [loading, setLoading] = useState(true);
   const [selectedMonth, setSelectedMonth] = useState<string>(initialMonth || 'all');
   const [selectedDepartment, setSelectedDepartment] = useState<string>('all');
@@ -120,6 +133,14 @@ export default function BrandDashboard({
   const [editingBox, setEditingBox] = useState<string | null>(null); // 편집 중인 박스 키
   const [editingBoxData, setEditingBoxData] = useState<{trend?: string; insight?: string; analysis?: string; costItem?: string}>({});
 
+  // cost_analytics.py 사전 계산 통계 (이상치 / 전월 대비 급변)
+  const [analytics, setAnalytics] = useState<CostAnalytics | null>(null);
+
+  // drilldown_tree.py 본부별 트리 (index + 펼친 본부의 샤드)
+  const [drilldownIndex, setDrilldownIndex] = useState<DrilldownIndex | null>(null);
+  const [drilldownShards, setDrilldownShards] = useState<{[shard: string]: DrilldownNode}>({});
+  const [expandedDepts, setExpandedDepts] = useState<{[shard: string]: boolean}>({});
+
   const brandName = BRAND_NAMES[brandId] || brandId;
 
   // 인사이트 로드
@@ -276,6 +297,39 @@ export default function BrandDashboard({
     loadRevenueData();
   }, [brandId, selectedMonth]);
 
+  // 브랜드별 사전 계산 통계 / 드릴다운 index (파일이 없으면 섹션 숨김)
+  useEffect(() => {
+    const brandFileId = brandId === 'mlb-kids' ? 'kids' : brandId;
+    fetchCostAnalytics(brandFileId)
+      .then(setAnalytics)
+      .catch((error) => {
+        console.warn('사전 계산 통계 로드 실패:', error);
+        setAnalytics(null);
+      });
+    setDrilldownShards({});
+    setExpandedDepts({});
+    fetchDrilldownIndex(brandFileId)
+      .then(setDrilldownIndex)
+      .catch((error) => {
+        console.warn('드릴다운 트리 로드 실패:', error);
+        setDrilldownIndex(null);
+      });
+  }, [brandId]);
+
+  // 본부 펼치기/접기 (처음 펼칠 때만 샤드 로드)
+  const toggleDept = async (shard: string) => {
+    const expanded = !expandedDepts[shard];
+    setExpandedDepts((prev) => ({ ...prev, [shard]: expanded }));
+    if (expanded && !drilldownShards[shard]) {
+      try {
+        const node = await fetchDrilldownShard(brandId === 'mlb-kids' ? 'kids' : brandId, shard);
+        setDrilldownShards((prev) => ({ ...prev, [shard]: node }));
+      } catch (error) {
+        console.warn('드릴다운 샤드 로드 실패:', error);
+      }
+    }
+  };
+
   const loadEmployeeData = async () => {
     try {
       const year = selectedMonth && selectedMonth !== 'all' ? selectedMonth.substring(0, 4) : '2025';
@@ -434,8 +488,21 @@ export default function BrandDashboard({
         filePrefix = 'kids'; // cost_kids_YYYYMM.csv
       }
       
-      // 각 월의 CSV 파일 로드 (브랜드만)
-      const filePrefixes = [filePrefix];
+      // binary_export.py로 만든 cost_{brand}.bin이 있으면 텍스트 파싱 없이 한 번에 로드
+      let binaryData: CostBinary | null = null;
+      try {
+        binaryData = await fetchCostBinary(filePrefix);
+      } catch (error) {
+        console.warn('바이너리 데이터 로드 실패, CSV로 대체:', error);
+      }
+      if (binaryData) {
+        // 행 객체는 이 브랜드의 요청한 월만 만듦 (차트/표 합계는 sumCost로 바로 집계)
+        allCsvData.push(...toCostRecords(binaryData, months, { 브랜드: brandName }));
+      }
+      setCostBinary(binaryData);
+      
+      // 각 월의 CSV 파일 로드 (브랜드만, 바이너리가 없을 때)
+      const filePrefixes = binaryData ? [] : [filePrefix];
       
       for (const month of months) {
         for (const prefix of filePrefixes) {
@@ -518,14 +585,21 @@ export default function BrandDashboard({
     return row.브랜드 === brandName;
   });
 
-  // 필터링된 데이터 (통계용 - 월 필터만 적용)
-  const filteredData = brandFilteredData.filter((row) => {
-    if (selectedMonth !== 'all' && row.년월 !== selectedMonth) return false;
-    return true;
-  });
+  // 금액 합계 (브랜드 필터 적용, 바이너리가 있으면 행 객체 없이 타입 배열에서 집계)
+  const sumCostFor = (months: string[], where: CostFilter = {}) =>
+    costBinary
+      ? sumCost(costBinary, months, { ...where, 브랜드: brandName })
+      : sumCostRecords(brandFilteredData, months, where);
+  const sumCostForBy = (months: string[], column: keyof CostData, where: CostFilter = {}) =>
+    costBinary
+      ? sumCostBy(costBinary, months, column, { ...where, 브랜드: brandName })
+      : sumCostRecordsBy(brandFilteredData, months, column, where);
+
+  // 통계용 월 (월 필터만 적용)
+  const statMonths = selectedMonth !== 'all' ? [selectedMonth] : availableMonths;
 
   // 통계 계산
-  const totalCost = filteredData.reduce((sum, row) => sum + row.금액, 0);
+  const totalCost = sumCostFor(statMonths);
   
   // 디버깅 로그
   console.log('========== MLB 비용 계산 디버깅 ==========');
@@ -534,20 +608,12 @@ export default function BrandDashboard({
   console.log('selectedMonth:', selectedMonth);
   console.log('allData 총 개수:', allData.length);
   console.log('brandFilteredData 개수:', brandFilteredData.length);
-  console.log('filteredData 개수:', filteredData.length);
-  console.log('filteredData 샘플 (처음 3개):', filteredData.slice(0, 3));
   console.log('totalCost:', totalCost);
   console.log('totalCost (K단위):', totalCost / 1000);
-  console.log('각 행의 금액 합계 검증:', filteredData.reduce((sum, row) => {
-    console.log(`  - ${row.대분류} / ${row.소분류}: ${row.금액}`);
-    return sum + row.금액;
-  }, 0));
   console.log('==========================================');
-  
-  const uniqueMonths = Array.from(new Set(filteredData.map((d) => d.년월)));
 
   // 월별 데이터 (대분류별 포함) - 브랜드 필터 적용
-  const allCategories = Array.from(new Set(brandFilteredData.map((d) => d.대분류))).filter(c => c && c !== 'nan');
+  const allCategories = Object.keys(sumCostForBy(availableMonths, '대분류')).filter(c => c && c !== 'nan');
   
   // 대분류 정렬 순서 정의
   const categoryOrder = [
@@ -604,28 +670,23 @@ export default function BrandDashboard({
       })
     : availableMonths;
   
+  // 본부 필터
+  const departmentFilter: CostFilter = selectedDepartment !== 'all' ? { 본부: selectedDepartment } : {};
+
   // 월별 비용 추이 그래프용 데이터 (본부 + 대분류 필터 적용)
   const monthlyData = displayMonths.map((month) => {
-    let monthData = brandFilteredData.filter((d) => d.년월 === month);
-    
-    // 본부 필터 적용
-    if (selectedDepartment !== 'all') {
-      monthData = monthData.filter(d => d.본부 === selectedDepartment);
-    }
-    
     const result: any = {
       month: month.substring(4), // YYYYMM에서 MM만
       fullMonth: `${month.substring(0, 4)}-${month.substring(4)}`, // 툴팁용
     };
     
     // 전체 비용
-    result['총비용'] = monthData.reduce((sum, row) => sum + row.금액, 0);
+    result['총비용'] = sumCostFor([month], departmentFilter);
     
     // 대분류별 비용
+    const categoryCosts = sumCostForBy([month], '대분류', departmentFilter);
     categories.forEach((category) => {
-      const categoryCost = monthData
-        .filter((d) => d.대분류 === category)
-        .reduce((sum, row) => sum + row.금액, 0);
+      const categoryCost = categoryCosts[category] || 0;
       if (categoryCost > 0) {
         result[category] = categoryCost;
       }
@@ -635,57 +696,34 @@ export default function BrandDashboard({
   });
 
   // 본부별 데이터
-  const departmentData = Object.entries(
-    filteredData.reduce((acc: any, row) => {
-      acc[row.본부] = (acc[row.본부] || 0) + row.금액;
-      return acc;
-    }, {})
-  ).map(([본부, 비용]) => ({ 본부, 비용: 비용 as number }))
-   .sort((a, b) => b.비용 - a.비용)
-   .slice(0, 10);
+  const departmentData = Object.entries(sumCostForBy(statMonths, '본부'))
+    .map(([본부, 비용]) => ({ 본부, 비용 }))
+    .sort((a, b) => b.비용 - a.비용)
+    .slice(0, 10);
 
   // 계정과목별 데이터
-  const accountData = Object.entries(
-    filteredData.reduce((acc: any, row) => {
-      acc[row.계정과목] = (acc[row.계정과목] || 0) + row.금액;
-      return acc;
-    }, {})
-  ).map(([name, value]) => ({ name, value: value as number }))
-   .sort((a, b) => b.value - a.value)
-   .slice(0, 8);
+  const accountData = Object.entries(sumCostForBy(statMonths, '계정과목'))
+    .map(([name, value]) => ({ name, value }))
+    .sort((a, b) => b.value - a.value)
+    .slice(0, 8);
 
   // 팀별 데이터 (상위 10개)
-  const teamData = Object.entries(
-    filteredData.reduce((acc: any, row) => {
-      acc[row.팀] = (acc[row.팀] || 0) + row.금액;
-      return acc;
-    }, {})
-  )
-    .map(([팀, 비용]) => ({ 팀, 비용: 비용 as number }))
+  const teamData = Object.entries(sumCostForBy(statMonths, '팀'))
+    .map(([팀, 비용]) => ({ 팀, 비용 }))
     .sort((a, b) => b.비용 - a.비용)
     .slice(0, 10);
 
   // 고유 값들 - 브랜드 필터 적용
-  const departments = Array.from(new Set(brandFilteredData.map((d) => d.본부))).filter(d => d && d !== 'nan');
-  const teams = Array.from(
-    new Set(
-      brandFilteredData
-        .filter((d) => selectedDepartment === 'all' || d.본부 === selectedDepartment)
-        .map((d) => d.팀)
-    )
-  ).filter(t => t && t !== 'nan');
+  const departments = Object.keys(sumCostForBy(availableMonths, '본부')).filter(d => d && d !== 'nan');
+  const teams = Object.keys(sumCostForBy(availableMonths, '팀', departmentFilter)).filter(t => t && t !== 'nan');
 
   // YOY 계산 (전년 동월 대비)
   const currentYearMonth = selectedMonth && selectedMonth !== 'all' ? selectedMonth : '202510';
   const previousYearMonth = currentYearMonth.replace('2025', '2024');
   
-  const currentYearCost = brandFilteredData
-    .filter(d => d.년월 === currentYearMonth)
-    .reduce((sum, row) => sum + row.금액, 0);
+  const currentYearCost = sumCostFor([currentYearMonth]);
   
-  const previousYearCost = brandFilteredData
-    .filter(d => d.년월 === previousYearMonth)
-    .reduce((sum, row) => sum + row.금액, 0);
+  const previousYearCost = sumCostFor([previousYearMonth]);
   
   const changeRate = previousYearCost > 0 
     ? (currentYearCost / previousYearCost) * 100
@@ -698,19 +736,9 @@ export default function BrandDashboard({
       const currentMonth = month.substring(4); // MM (01, 02, ...)
       const prevYearMonth = `2024${currentMonth}`; // 2024년 동월
       
-      // 2025년 해당 월 데이터 - 브랜드 필터 적용
-      let current2025Data = brandFilteredData.filter(d => d.년월 === month);
-      if (selectedDepartment !== 'all') {
-        current2025Data = current2025Data.filter(d => d.본부 === selectedDepartment);
-      }
-      const current2025Cost = current2025Data.reduce((sum, row) => sum + row.금액, 0);
-      
-      // 2024년 동월 데이터 - 브랜드 필터 적용
-      let prev2024Data = brandFilteredData.filter(d => d.년월 === prevYearMonth);
-      if (selectedDepartment !== 'all') {
-        prev2024Data = prev2024Data.filter(d => d.본부 === selectedDepartment);
-      }
-      const prev2024Cost = prev2024Data.reduce((sum, row) => sum + row.금액, 0);
+      // 2025년 해당 월 / 2024년 동월 비용 - 브랜드 + 본부 필터 적용
+      const current2025Cost = sumCostFor([month], departmentFilter);
+      const prev2024Cost = sumCostFor([prevYearMonth], departmentFilter);
       
       // YOY 계산 (당년/전년 × 100)
       const yoyRate = prev2024Cost > 0 ? (current2025Cost / prev2024Cost) * 100 : 0;
@@ -771,47 +799,42 @@ export default function BrandDashboard({
   const accumulatedMonths2025 = Array.from({length: currentMonth}, (_, i) => `2025${String(i + 1).padStart(2, '0')}`);
   const accumulatedMonths2024 = Array.from({length: currentMonth}, (_, i) => `2024${String(i + 1).padStart(2, '0')}`);
   
+  // 당월 (선택 월, 기본값 2025년 10월)과 전년 동월
+  const drilldownMonth2025 = selectedMonth !== 'all' ? selectedMonth : '202510';
+  const drilldownMonth2024 = selectedMonth !== 'all' ? selectedMonth.replace('2025', '2024') : '202410';
+  
   const drilldownData = categories.map((대분류) => {
-    // 당월 데이터 (2025, 2024)
-    const data2025Monthly = selectedMonth !== 'all' 
-      ? brandFilteredData.filter(d => d.대분류 === 대분류 && d.년월 === selectedMonth)
-      : brandFilteredData.filter(d => d.대분류 === 대분류 && d.년월 === '202510'); // 기본값
-    const cost2025Monthly = data2025Monthly.reduce((sum, row) => sum + row.금액, 0);
+    const categoryFilter: CostFilter = { 대분류 };
     
-    const data2024Monthly = selectedMonth !== 'all'
-      ? brandFilteredData.filter(d => d.대분류 === 대분류 && d.년월 === selectedMonth.replace('2025', '2024'))
-      : brandFilteredData.filter(d => d.대분류 === 대분류 && d.년월 === '202410');
-    const cost2024Monthly = data2024Monthly.reduce((sum, row) => sum + row.금액, 0);
+    // 당월 데이터 (2025, 2024) - 소분류별 합계
+    const detail2025Monthly = sumCostForBy([drilldownMonth2025], '소분류', categoryFilter);
+    const detail2024Monthly = sumCostForBy([drilldownMonth2024], '소분류', categoryFilter);
+    const cost2025Monthly = sumCostFor([drilldownMonth2025], categoryFilter);
+    const cost2024Monthly = sumCostFor([drilldownMonth2024], categoryFilter);
     
     const diffMonthly = cost2025Monthly - cost2024Monthly;
     const yoyMonthly = cost2024Monthly > 0 ? ((diffMonthly / cost2024Monthly) * 100) : 0;
     
     // YTD 누적 데이터 (1월 ~ 선택된 월까지)
-    const data2025YTD = brandFilteredData.filter(d => d.대분류 === 대분류 && accumulatedMonths2025.includes(d.년월));
-    const cost2025YTD = data2025YTD.reduce((sum, row) => sum + row.금액, 0);
-    
-    const data2024YTD = brandFilteredData.filter(d => d.대분류 === 대분류 && accumulatedMonths2024.includes(d.년월));
-    const cost2024YTD = data2024YTD.reduce((sum, row) => sum + row.금액, 0);
+    const detail2025YTD = sumCostForBy(accumulatedMonths2025, '소분류', categoryFilter);
+    const detail2024YTD = sumCostForBy(accumulatedMonths2024, '소분류', categoryFilter);
+    const cost2025YTD = sumCostFor(accumulatedMonths2025, categoryFilter);
+    const cost2024YTD = sumCostFor(accumulatedMonths2024, categoryFilter);
     
     const diffYTD = cost2025YTD - cost2024YTD;
     const yoyYTD = cost2024YTD > 0 ? ((diffYTD / cost2024YTD) * 100) : 0;
     
     // 소분류 데이터
-    const 소분류들 = Array.from(new Set([...data2025Monthly.map(d => d.소분류), ...data2025YTD.map(d => d.소분류)])).filter(c => c && c !== 'nan' && c.trim() !== '');
+    const 소분류들 = Array.from(new Set([...Object.keys(detail2025Monthly), ...Object.keys(detail2025YTD)])).filter(c => c && c !== 'nan' && c.trim() !== '');
     
     // 디버깅: 대분류별 소분류 확인
     if (대분류 === '감가상각비' || 대분류 === '지급수수료') {
       console.log(`[${대분류}] 소분류 목록:`, 소분류들);
-      console.log(`[${대분류}] data2025Monthly 샘플:`, data2025Monthly.slice(0, 3).map(d => ({ 소분류: d.소분류, 금액: d.금액 })));
     }
     
     const 소분류Data = 소분류들.map((소분류) => {
-      // 당월 - 소분류별로 필터링
-      const detail2025Monthly = data2025Monthly.filter(d => d.소분류 === 소분류 && d.소분류 && d.소분류.trim() !== '');
-      const detailCost2025Monthly = detail2025Monthly.reduce((sum, row) => sum + row.금액, 0);
-      
-      const detail2024Monthly = data2024Monthly.filter(d => d.소분류 === 소분류 && d.소분류 && d.소분류.trim() !== '');
-      const detailCost2024Monthly = detail2024Monthly.reduce((sum, row) => sum + row.금액, 0);
+      const detailCost2025Monthly = detail2025Monthly[소분류] || 0;
+      const detailCost2024Monthly = detail2024Monthly[소분류] || 0;
       
       // 디버깅: 소분류별 값 확인
       if ((대분류 === '감가상각비' || 대분류 === '지급수수료') && 소분류들.length > 0) {
@@ -821,24 +844,9 @@ export default function BrandDashboard({
       const detailDiffMonthly = detailCost2025Monthly - detailCost2024Monthly;
       const detailYoyMonthly = detailCost2024Monthly > 0 ? ((detailDiffMonthly / detailCost2024Monthly) * 100) : 0;
       
-      // YTD - 소분류별로 필터링
-      const detail2025YTD = brandFilteredData.filter(d => 
-        d.대분류 === 대분류 && 
-        d.소분류 === 소분류 && 
-        d.소분류 && 
-        d.소분류.trim() !== '' &&
-        accumulatedMonths2025.includes(d.년월)
-      );
-      const detailCost2025YTD = detail2025YTD.reduce((sum, row) => sum + row.금액, 0);
-      
-      const detail2024YTD = brandFilteredData.filter(d => 
-        d.대분류 === 대분류 && 
-        d.소분류 === 소분류 && 
-        d.소분류 && 
-        d.소분류.trim() !== '' &&
-        accumulatedMonths2024.includes(d.년월)
-      );
-      const detailCost2024YTD = detail2024YTD.reduce((sum, row) => sum + row.금액, 0);
+      // YTD - 소분류별
+      const detailCost2025YTD = detail2025YTD[소분류] || 0;
+      const detailCost2024YTD = detail2024YTD[소분류] || 0;
       
       const detailDiffYTD = detailCost2025YTD - detailCost2024YTD;
       const detailYoyYTD = detailCost2024YTD > 0 ? ((detailDiffYTD / detailCost2024YTD) * 100) : 0;
@@ -1330,10 +1338,14 @@ export default function BrandDashboard({
                             }
                             return { ...m, 분석비용: m.총비용 || 0 };
                           });
+                          // 최근 3개월 평균은 cost_analytics.py 사전 계산 값 (파일이 없으면 차트 데이터에서 계산)
+                          const stats = analytics ? findSeries(analytics, selectedDepartment, selectedCategory) : null;
                           const recentMonths = filteredMonthlyData.slice(-3).filter(m => m.분석비용 > 0);
-                          const avgCost = recentMonths.length > 0 
-                            ? recentMonths.reduce((sum, m) => sum + (m.분석비용 || 0), 0) / recentMonths.length 
-                            : 0;
+                          const avgCost = stats
+                            ? Number(stats['최근3개월평균']) || 0
+                            : recentMonths.length > 0
+                              ? recentMonths.reduce((sum, m) => sum + (m.분석비용 || 0), 0) / recentMonths.length
+                              : 0;
                           const firstMonth = filteredMonthlyData.find(m => m.분석비용 > 0);
                           const lastMonth = [...filteredMonthlyData].reverse().find(m => m.분석비용 > 0);
                           if (!firstMonth || !lastMonth) return '비용 데이터를 분석할 수 없습니다.';
@@ -1361,6 +1373,14 @@ export default function BrandDashboard({
                             }
                             return { ...m, 분석비용: m.총비용 || 0 };
                           });
+                          // 최고/최저 월은 cost_analytics.py 사전 계산 값 사용
+                          const stats = analytics ? findSeries(analytics, selectedDepartment, selectedCategory) : null;
+                          if (stats && Number(stats['최고금액']) > 0) {
+                            const categoryText = selectedCategory !== 'all' ? `${selectedCategory} ` : '';
+                            const monthText = (value: any) => `${String(value).slice(0, 4)}년 ${String(value).slice(4)}월`;
+                            const sameMonth = stats['최저월'] === stats['최고월'];
+                            return `${categoryText}${monthText(stats['최고월'])}에 가장 높은 비용(${formatCurrency(Number(stats['최고금액']))})이 발생했습니다. ${!sameMonth ? `${monthText(stats['최저월'])}(${formatCurrency(Number(stats['최저금액']))})과 비교하여` : ''} 비용 최적화 기회를 찾아보세요.`;
+                          }
                           const maxMonth = filteredMonthlyData.reduce((max, m) => {
                             const maxCost = max.분석비용 || 0;
                             const currentCost = m.분석비용 || 0;
@@ -1388,6 +1408,147 @@ export default function BrandDashboard({
             </div>
           </div>
 
+          {/* 이상치 / 전월 대비 급변 (cost_analytics.py 사전 계산, 본부/대분류 기준) */}
+          {analytics && analytics.levels['본부/대분류'] && (() => {
+            const level = analytics.levels['본부/대분류'];
+            const inMonth = (row: { [column: string]: any }) => selectedMonth === 'all' || row.년월 === selectedMonth;
+            const outliers = tableRecords(level.outliers)
+              .filter(inMonth)
+              .sort((a, b) => Math.abs(Number(b.z)) - Math.abs(Number(a.z)))
+              .slice(0, 10);
+            const change = (row: { [column: string]: any }) => Number(row.금액) - Number(row.전월금액);
+            const jumps = tableRecords(level.jumps)
+              .filter(inMonth)
+              .sort((a, b) => Math.abs(change(b)) - Math.abs(change(a)))
+              .slice(0, 10);
+            if (outliers.length === 0 && jumps.length === 0) return null;
+
+            return (
+              <div className="bg-white rounded-2xl p-6 md:p-8 border border-slate-200 shadow-lg hover:shadow-xl transition-all duration-300">
+                <div className="mb-4">
+                  <h2 className="text-xl md:text-2xl font-bold text-slate-800 mb-1">이상치 및 급변 항목</h2>
+                  <p className="text-sm text-slate-500">
+                    본부/대분류 기준 {selectedMonth === 'all' ? '전체 기간' : `${selectedMonth.slice(0, 4)}년 ${selectedMonth.slice(4)}월`} (상위 10개)
+                  </p>
+                </div>
+                <div className="grid grid-cols-1 lg:grid-cols-2 gap-4">
+                  <div>
+                    <h3 className="text-md font-bold text-slate-700 mb-2">평균 대비 이상치 (z-score)</h3>
+                    <table className="w-full text-sm">
+                      <thead>
+                        <tr className="border-b border-slate-200 text-slate-500">
+                          <th className="py-2 text-left">본부 / 대분류</th>
+                          <th className="py-2 text-left">년월</th>
+                          <th className="py-2 text-right">금액</th>
+                          <th className="py-2 text-right">z</th>
+                        </tr>
+                      </thead>
+                      <tbody>
+                        {outliers.map((row, i) => (
+                          <tr key={i} className="border-b border-slate-100">
+                            <td className="py-2 text-slate-700">{row.본부} / {row.대분류}</td>
+                            <td className="py-2 text-slate-500">{row.년월}</td>
+                            <td className="py-2 text-right text-slate-800">{formatCurrency(Number(row.금액))}</td>
+                            <td className={`py-2 text-right font-medium ${Number(row.z) > 0 ? 'text-red-600' : 'text-blue-600'}`}>
+                              {formatNumber(Number(row.z))}
+                            </td>
+                          </tr>
+                        ))}
+                      </tbody>
+                    </table>
+                  </div>
+                  <div>
+                    <h3 className="text-md font-bold text-slate-700 mb-2">전월 대비 급증/급감</h3>
+                    <table className="w-full text-sm">
+                      <thead>
+                        <tr className="border-b border-slate-200 text-slate-500">
+                          <th className="py-2 text-left">본부 / 대분류</th>
+                          <th className="py-2 text-left">년월</th>
+                          <th className="py-2 text-right">전월</th>
+                          <th className="py-2 text-right">당월</th>
+                          <th className="py-2 text-right">변동률</th>
+                        </tr>
+                      </thead>
+                      <tbody>
+                        {jumps.map((row, i) => (
+                          <tr key={i} className="border-b border-slate-100">
+                            <td className="py-2 text-slate-700">{row.본부} / {row.대분류}</td>
+                            <td className="py-2 text-slate-500">{row.년월}</td>
+                            <td className="py-2 text-right text-slate-600">{formatCurrency(Number(row.전월금액))}</td>
+                            <td className="py-2 text-right text-slate-800">{formatCurrency(Number(row.금액))}</td>
+                            <td className={`py-2 text-right font-medium ${change(row) > 0 ? 'text-red-600' : 'text-blue-600'}`}>
+                              {row.변동률 === null ? '신규' : `${formatNumber(Number(row.변동률) * 100)}%`}
+                            </td>
+                          </tr>
+                        ))}
+                      </tbody>
+                    </table>
+                  </div>
+                </div>
+              </div>
+            );
+          })()}
+
+          {/* 본부별 드릴다운 (drilldown_tree.py, 펼친 본부의 샤드만 로드) */}
+          {drilldownIndex && drilldownIndex.children.length > 0 && (() => {
+            const monthIndex = selectedMonth === 'all'
+              ? drilldownIndex.months.length - 1
+              : drilldownIndex.months.indexOf(selectedMonth);
+            if (monthIndex < 0) return null;
+            const month = drilldownIndex.months[monthIndex];
+
+            return (
+              <div className="bg-white rounded-2xl p-6 md:p-8 border border-slate-200 shadow-lg hover:shadow-xl transition-all duration-300">
+                <div className="mb-4">
+                  <h2 className="text-xl md:text-2xl font-bold text-slate-800 mb-1">본부별 비용 드릴다운</h2>
+                  <p className="text-sm text-slate-500">
+                    {month.slice(0, 4)}년 {month.slice(4)}월 기준 (본부를 클릭하면 대분류별로 펼쳐집니다)
+                  </p>
+                </div>
+                <table className="w-full text-sm">
+                  <thead>
+                    <tr className="border-b border-slate-200 text-slate-500">
+                      <th className="py-2 text-left">본부 / 대분류</th>
+                      <th className="py-2 text-right">당월</th>
+                      <th className="py-2 text-right">YTD</th>
+                    </tr>
+                  </thead>
+                  <tbody>
+                    {drilldownIndex.children.map((dept) => {
+                      const node = drilldownShards[dept.shard];
+                      const expanded = expandedDepts[dept.shard];
+                      return [
+                        <tr
+                          key={dept.shard}
+                          onClick={() => toggleDept(dept.shard)}
+                          className="border-b border-slate-100 cursor-pointer hover:bg-slate-50"
+                        >
+                          <td className="py-2 font-medium text-slate-800">
+                            <span className="inline-flex items-center gap-1">
+                              {expanded ? <ChevronDown className="w-4 h-4" /> : <ChevronRight className="w-4 h-4" />}
+                              {dept.name}
+                            </span>
+                          </td>
+                          <td className="py-2 text-right text-slate-800">{formatCurrency(dept.monthly[monthIndex])}</td>
+                          <td className="py-2 text-right text-slate-600">{formatCurrency(dept.ytd[monthIndex])}</td>
+                        </tr>,
+                        ...(expanded && node?.children ? node.children : [])
+                          .filter((category) => category.ytd[monthIndex] !== 0)
+                          .map((category) => (
+                            <tr key={`${dept.shard}-${category.name}`} className="border-b border-slate-100 bg-slate-50/50">
+                              <td className="py-2 pl-8 text-slate-600">{category.name}</td>
+                              <td className="py-2 text-right text-slate-700">{formatCurrency(category.monthly[monthIndex])}</td>
+                              <td className="py-2 text-right text-slate-500">{formatCurrency(category.ytd[monthIndex])}</td>
+                            </tr>
+                          )),
+                      ];
+                    })}
+                  </tbody>
+                </table>
+              </div>
+            );
+          })()}
+
           {/* 대분류별 상세 분석 (소분류 + 코스트센터) */}
           <div className="bg-white rounded-2xl p-6 md:p-8 border border-slate-200 shadow-lg hover:shadow-xl transition-all duration-300">
             <div className="mb-4 flex items-center justify-between">
@@ -1661,28 +1822,30 @@ export default function BrandDashboard({
             {/* 코스트센터별 비용 AI분석 박스 */}
             <div className="mt-4 pt-4 border-t border-slate-200">
               {(() => {
-                // 분석할 데이터 준비
-                let analysisData2025, analysisData2024;
                 const currentCategory = selectedCategoryDetail || selectedCategory;
+                const hasCategory = Boolean(currentCategory && currentCategory !== 'all');
                 
-                if (currentCategory && currentCategory !== 'all') {
-                  analysisData2025 = brandFilteredData.filter(d => d.대분류 === currentCategory && d.년월.startsWith('2025'));
-                  analysisData2024 = brandFilteredData.filter(d => d.대분류 === currentCategory && d.년월.startsWith('2024'));
-                } else {
-                  analysisData2025 = brandFilteredData.filter(d => d.년월.startsWith('2025'));
-                  analysisData2024 = brandFilteredData.filter(d => d.년월.startsWith('2024'));
-                }
-                
-                // 코스트센터별 비용 계산
-                const costCenterData2025 = analysisData2025.reduce((acc: any, d) => {
-                  acc[d.본부] = (acc[d.본부] || 0) + d.금액;
-                  return acc;
-                }, {});
-                
-                const costCenterData2024 = analysisData2024.reduce((acc: any, d) => {
-                  acc[d.본부] = (acc[d.본부] || 0) + d.금액;
-                  return acc;
-                }, {});
+                // 코스트센터별 연도 합계 (cost_analytics.py 사전 계산 값, 파일이 없으면 행에서 계산)
+                const centerSeries = analytics
+                  ? seriesRecords(analytics, hasCategory ? '본부/대분류' : '본부', hasCategory ? { 대분류: currentCategory as string } : {})
+                  : null;
+                const centerTotals = (year: string): { [center: string]: number } => {
+                  if (centerSeries) {
+                    const totals: { [center: string]: number } = {};
+                    centerSeries.forEach(row => {
+                      totals[String(row['본부'])] = (totals[String(row['본부'])] || 0) + (Number(row[`합계_${year}`]) || 0);
+                    });
+                    return totals;
+                  }
+                  return brandFilteredData
+                    .filter(d => (!hasCategory || d.대분류 === currentCategory) && d.년월.startsWith(year))
+                    .reduce((acc: any, d) => {
+                      acc[d.본부] = (acc[d.본부] || 0) + d.금액;
+                      return acc;
+                    }, {});
+                };
+                const costCenterData2025 = centerTotals('2025');
+                const costCenterData2024 = centerTotals('2024');
                 
                 const costCenters = Array.from(new Set([
                   ...Object.keys(costCenterData2025),
@@ -1706,8 +1869,8 @@ export default function BrandDashboard({
                 );
                 
                 // 총 비용 계산
-                const total2025 = analysisData2025.reduce((sum, d) => sum + d.금액, 0);
-                const total2024 = analysisData2024.reduce((sum, d) => sum + d.금액, 0);
+                const total2025 = Object.values(costCenterData2025).reduce((sum, value) => sum + value, 0);
+                const total2024 = Object.values(costCenterData2024).reduce((sum, value) => sum + value, 0);
                 const yoyPercent = total2024 > 0 ? ((total2025 - total2024) / total2024 * 100).toFixed(1) : '0';
                 const yoyTrend = total2025 > total2024 ? '증가' : total2025 < total2024 ? '감소' : '유지';
                 
@@ -7,6 +7,9 @@ import pandas as pd
 import os
 from pathlib import Path
 
+from dimensions import BRANDS, resolve_brand
+from publish_data import staged_output
+
 def clean_and_convert_excel(excel_file, output_dir='public/data'):
     """
     엑셀 파일을 읽어서 브랜드별로 CSV 파일로 변환
@@ -45,9 +48,6 @@ def clean_and_convert_excel(excel_file, output_dir='public/data'):
         print(f"❌ 파일명에서 연도를 찾을 수 없습니다: {filename}")
         return
     
-    # 브랜드 목록
-    brands = ['MLB', 'MLB Kids', 'Discovery', '공통']
-    
     # 컬럼명 확인 및 정규화
     print("🔍 컬럼 분석:")
     for col in df.columns:
@@ -75,12 +75,13 @@ def clean_and_convert_excel(excel_file, output_dir='public/data'):
             month_col = col
             break
     
-    # 각 브랜드별로 처리
-    for brand in brands:
+    # 각 브랜드별로 처리 (별칭/대소문자는 dimensions.resolve_brand로 통일)
+    resolved = df[brand_col].map(resolve_brand)
+    for brand_safe, (_, _, brand, _) in BRANDS.items():
         print(f"\n🏷️  처리 중: {brand}")
         
         # 브랜드 필터링
-        brand_data = df[df[brand_col].str.contains(brand, na=False, case=False)]
+        brand_data = df[resolved == brand_safe]
         
         if len(brand_data) == 0:
             print(f"   ⚠️  '{brand}' 데이터가 없습니다.")
@@ -97,7 +98,6 @@ def clean_and_convert_excel(excel_file, output_dir='public/data'):
                     continue
                 
                 # 파일명 생성
-                brand_safe = brand.replace(' ', '_').lower()
                 filename = f"cost_{brand_safe}_{year}{month:02d}.csv"
                 filepath = os.path.join(output_dir, filename)
                 
@@ -107,7 +107,6 @@ def clean_and_convert_excel(excel_file, output_dir='public/data'):
         else:
             # 월 컬럼이 없으면 전체 데이터를 하나의 파일로 저장
             print("   ⚠️  '월' 컬럼을 찾을 수 없습니다. 전체 데이터를 하나의 파일로 저장합니다.")
-            brand_safe = brand.replace(' ', '_').lower()
             filename = f"cost_{brand_safe}_{year}_all.csv"
             filepath = os.path.join(output_dir, filename)
             brand_data.to_csv(filepath, index=False, encoding='utf-8-sig')
@@ -125,16 +124,17 @@ def main():
         '2025.1-10.XLSX'
     ]
     
-    # 각 파일 처리
-    for excel_file in excel_files:
-        if os.path.exists(excel_file):
-            try:
-                clean_and_convert_excel(excel_file)
-            except Exception as e:
-                print(f"\n❌ 오류 발생: {excel_file}")
-                print(f"   {str(e)}\n")
-        else:
-            print(f"\n⚠️  파일을 찾을 수 없습니다: {excel_file}\n")
+    # 각 파일 처리 (빌드 디렉토리에 쓴 뒤 public/data를 한 번에 교체)
+    with staged_output('public/data') as output_dir:
+        for excel_file in excel_files:
+            if os.path.exists(excel_file):
+                try:
+                    clean_and_convert_excel(excel_file, output_dir)
+                except Exception as e:
+                    print(f"\n❌ 오류 발생: {excel_file}")
+                    print(f"   {str(e)}\n")
+            else:
+                print(f"\n⚠️  파일을 찾을 수 없습니다: {excel_file}\n")
     
     print("\n" + "="*60)
     print("✅ 변환 완료!")
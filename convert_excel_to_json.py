@@ -3,10 +3,12 @@
 브랜드별로 데이터 분리
 """
 import pandas as pd
-import json
 import os
 from pathlib import Path
 
+from dimensions import BRANDS, resolve_brand
+from json_shards import write_json_with_shards
+
 def convert_excel_to_json():
     """엑셀 파일을 JSON으로 변환"""
     
@@ -29,24 +31,17 @@ def convert_excel_to_json():
     print(f"\n2024년 컬럼: {list(df_2024.columns)}")
     print(f"2025년 컬럼: {list(df_2025.columns)}")
     
-    # 브랜드별로 데이터 분리
-    brand_mapping = {
-        'MLB': 'mlb',
-        'MLB Kids': 'mlb-kids', 
-        'Discovery': 'discovery',
-        '공통': 'common'
-    }
-    
+    # 브랜드별로 데이터 분리 (사업부 별칭은 dimensions.BRANDS 기준으로 통일)
     all_data = {}
     
-    for brand_name, brand_id in brand_mapping.items():
+    for file_id, (_, brand_id, brand_name, _) in BRANDS.items():
         print(f"\n🏷️  {brand_name} 데이터 처리 중...")
         
         brand_data = []
         
         # 2024년 데이터 처리
         if '사업부' in df_2024.columns:
-            df_2024_brand = df_2024[df_2024['사업부'] == brand_name].copy()
+            df_2024_brand = df_2024[df_2024['사업부'].map(resolve_brand) == file_id].copy()
             
             for _, row in df_2024_brand.iterrows():
                 # 각 월별로 데이터 생성
@@ -74,7 +69,7 @@ def convert_excel_to_json():
         
         # 2025년 데이터 처리 (1-10월)
         if '사업부' in df_2025.columns:
-            df_2025_brand = df_2025[df_2025['사업부'] == brand_name].copy()
+            df_2025_brand = df_2025[df_2025['사업부'].map(resolve_brand) == file_id].copy()
             
             for _, row in df_2025_brand.iterrows():
                 for month in range(1, 11):  # 1-10월만
@@ -102,13 +97,14 @@ def convert_excel_to_json():
         print(f"   ✅ {len(brand_data)}개 데이터 생성")
     
     # JSON 파일로 저장
+    # (+ 브랜드 × 연도 샤드, 빌드 디렉토리에 쓴 뒤 public/data 교체)
     output_file = os.path.join(output_dir, 'cost_data.json')
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(all_data, f, ensure_ascii=False, indent=2)
+    manifest = write_json_with_shards(all_data, output_dir, 'cost_data')
     
     print(f"\n{'='*80}")
     print(f"✅ 변환 완료!")
     print(f"📁 파일 저장: {output_file}")
+    print(f"📁 샤드 {len(manifest['shards'])}개: {os.path.join(output_dir, 'cost_data')}/")
     print(f"{'='*80}\n")
     
     # 통계 출력
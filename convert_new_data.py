@@ -1,29 +1,43 @@
 """
 재유니 폴더의 2024.csv와 2025.csv를 변환하여 
 브랜드별 월별 CSV 파일을 생성하는 스크립트
+파일명/월 컬럼 규칙과 금액 파싱은 fast_convert, amounts와 같은 구현을 사용합니다.
 """
 
 import pandas as pd
 import os
-import re
+import sys
 from pathlib import Path
 
-def clean_currency_value(value):
+import input_streams
+from amounts import format_minor, try_parse_minor
+from dimensions import brand_label, source_column
+from fast_convert import (MONTH_PATTERN, ReconciliationError, check_totals, find_month_columns,
+                          partition_filename)
+from publish_data import staged_output
+
+def read_source_csv(csv_file):
     """
-    통화 값을 숫자로 변환 (쉼표 제거, NaN 처리)
+    재유니 CSV 파일 읽기 (utf-8 → cp949 → euc-kr 순서로 시도)
+    .gz / .zst / .zip 입력은 input_streams로 풀면서 읽음 (fast_convert와 같은 경로 규칙)
+    사업부 별칭은 읽는 시점에 표준 라벨로 통일 (예: Discovery → DX)
     """
-    if pd.isna(value):
-        return 0.0
-    if isinstance(value, (int, float)):
-        return float(value)
-    # 문자열인 경우 쉼표 제거
-    value_str = str(value).replace(',', '').replace('"', '').strip()
-    try:
-        return float(value_str)
-    except:
-        return 0.0
+    for encoding in ('utf-8', 'cp949', 'euc-kr'):
+        try:
+            with input_streams.open_binary(csv_file) as f:
+                df = pd.read_csv(f, encoding=encoding)
+            break
+        except UnicodeDecodeError:
+            if encoding == 'euc-kr':
+                raise
+
+    brand_col = source_column(df.columns, '브랜드')
+    if brand_col is not None:
+        labels = {b: brand_label(b) for b in df[brand_col].dropna().unique() if b != '총합계'}
+        df[brand_col] = df[brand_col].map(lambda b: labels.get(b, b))
+    return df
 
-def convert_csv_data(csv_file, year, output_dir='public/data'):
+def convert_csv_data(csv_file, year, output_dir='public/data', df=None, partitions=None, check=True):
     """
     CSV 파일을 읽어서 브랜드별, 월별로 데이터 변환
     
@@ -31,6 +45,15 @@ def convert_csv_data(csv_file, year, output_dir='public/data'):
         csv_file: CSV 파일 경로
         year: 연도 (2024 또는 2025)
         output_dir: CSV 파일을 저장할 디렉토리
+        df: 이미 읽어 둔 데이터프레임 (없으면 csv_file을 읽음)
+        partitions: 변환할 (사업부, YYYYMM) 집합 (없으면 전체 변환)
+        check: 파일을 쓰기 전에 변환하면서 누적한 원천 합계와 출력 합계를 대사
+    
+    Returns:
+        저장한 파일 경로 목록
+    
+    Raises:
+        ReconciliationError: 허용 오차를 넘는 차이나 금액 변환 실패 칸이 있을 때 (파일은 쓰지 않음)
     """
     # 출력 디렉토리 생성
     Path(output_dir).mkdir(parents=True, exist_ok=True)
@@ -40,27 +63,22 @@ def convert_csv_data(csv_file, year, output_dir='public/data'):
     print(f"{'='*70}\n")
     
     # CSV 파일 읽기
-    try:
-        df = pd.read_csv(csv_file, encoding='utf-8')
-    except:
-        try:
-            df = pd.read_csv(csv_file, encoding='cp949')
-        except:
-            df = pd.read_csv(csv_file, encoding='euc-kr')
+    if df is None:
+        df = read_source_csv(csv_file)
     
     print(f"✅ 데이터 로드 완료: {len(df)}행")
     print(f"📋 컬럼: {list(df.columns)}\n")
     
     # 컬럼명 확인
-    brand_col = '사업부(조정)'
+    brand_col = source_column(df.columns, '브랜드')
     dept_col = '부서명'
     category1_col = '대분류'
     category2_col = '중분류'
     # 2024년은 '소분류', 2025년은 'Cost Elem desc'
-    category3_col = 'Cost Elem desc' if 'Cost Elem desc' in df.columns else '소분류'
+    category3_col = source_column(df.columns, '소분류')
     
     # 월 컬럼 찾기
-    month_cols = [col for col in df.columns if '합계 :' in str(col) or re.match(r'.*202[45]\d{2}', str(col))]
+    month_cols = find_month_columns(df.columns)
     print(f"📅 월 컬럼 {len(month_cols)}개 발견:")
     for col in month_cols:
         print(f"   - {col}")
@@ -71,19 +89,19 @@ def convert_csv_data(csv_file, year, output_dir='public/data'):
     brands = [b for b in brands if b not in ['총합계', 'nan'] and pd.notna(b)]
     print(f"🏷️  사업부 목록: {list(brands)}\n")
     
-    # 브랜드명 매핑 (파일명용)
-    brand_mapping = {
-        'DX': 'discovery',
-        'MLB': 'mlb',
-        'MLB Kids': 'mlb-kids',
-        'Discovery': 'discovery',
-        '공통': 'common'
-    }
+    # 월별 원천 합계(총합계/사업부 결측 행 포함)와 출력 합계는 금액 컬럼을 변환하는 같은 단계에서 누적
+    brand_values = df[brand_col]
+    is_grand = brand_values == '총합계'
+    is_output = brand_values.isin(brands)
+    brand_masks = {brand: brand_values == brand for brand in brands}
+    source = {}
+    output = {}
+    pending = []    # (파일 경로, 데이터프레임) - 대사 후 기록
     
     # 각 월별로 처리
     for month_col in month_cols:
         # 월 추출 (예: "합계 : 202401" -> "202401")
-        month_match = re.search(r'(202[45]\d{2})', month_col)
+        month_match = MONTH_PATTERN.search(str(month_col))
         if not month_match:
             continue
         
@@ -93,48 +111,61 @@ def convert_csv_data(csv_file, year, output_dir='public/data'):
         
         print(f"\n📆 처리 중: {year_num}년 {month_num}월")
         
+        # 금액은 최소 단위 정수로 읽음 (변환 실패 칸은 None → 개수만 세고 0으로 처리)
+        parsed = df[month_col].map(try_parse_minor)
+        invalid = parsed.isna()
+        values = parsed.where(~invalid, 0).astype('int64')
+        grand = values[is_grand & ~invalid]
+        source[yyyymm] = {
+            'source': int(values[~is_grand].sum()),
+            'grand_total': int(grand.iloc[-1]) if len(grand) else None,
+            'invalid': int(invalid.sum()),
+        }
+        output[yyyymm] = int(values[is_output].sum())
+        
         # 각 브랜드별로 데이터 분리
         for brand in brands:
-            brand_data = df[df[brand_col] == brand].copy()
-            
-            if len(brand_data) == 0:
+            if partitions is not None and (brand, yyyymm) not in partitions:
                 continue
             
-            # 해당 월의 데이터만 추출
-            result_data = []
+            # 0이 아닌 값만 포함
+            mask = brand_masks[brand] & (values != 0)
+            if not mask.any():
+                continue
             
-            for idx, row in brand_data.iterrows():
-                value = clean_currency_value(row[month_col])
-                
-                # 0이 아닌 값만 포함
-                if value != 0:
-                    result_data.append({
-                        '브랜드': brand,
-                        '본부': row[dept_col],
-                        '팀': row[dept_col],  # 팀과 본부가 같은 것으로 보임
-                        '대분류': row[category1_col],
-                        '중분류': row[category2_col],
-                        '소분류': row[category3_col],
-                        '계정과목': row[category3_col],  # 계정과목으로 소분류 사용
-                        '금액': value,
-                        '년월': yyyymm,
-                        '비고': ''
-                    })
+            brand_data = df[mask]
+            result_df = pd.DataFrame({
+                '브랜드': brand,
+                '본부': brand_data[dept_col],
+                '팀': brand_data[dept_col],  # 팀과 본부가 같은 것으로 보임
+                '대분류': brand_data[category1_col],
+                '중분류': brand_data[category2_col],
+                '소분류': brand_data[category3_col],
+                '계정과목': brand_data[category3_col],  # 계정과목으로 소분류 사용
+                # 소수 둘째 자리 문자열로 기록 (fast_convert와 같은 형식)
+                '금액': values[mask].map(format_minor),
+                '년월': yyyymm,
+                '비고': ''
+            })
             
-            if len(result_data) > 0:
-                # 데이터프레임 생성
-                result_df = pd.DataFrame(result_data)
-                
-                # 파일명 생성
-                brand_safe = brand_mapping.get(brand, brand.replace(' ', '_').lower())
-                filename = f"cost_{brand_safe}_{yyyymm}.csv"
-                filepath = os.path.join(output_dir, filename)
-                
-                # CSV로 저장
-                result_df.to_csv(filepath, index=False, encoding='utf-8-sig')
-                print(f"   ✅ {brand}: {filename} ({len(result_df)}개 행)")
+            # 파일명 생성
+            filename = partition_filename(brand, yyyymm)
+            pending.append((os.path.join(output_dir, filename), result_df))
+            print(f"   ✅ {brand}: {filename} ({len(result_df)}개 행)")
     
     print(f"\n{'='*70}")
+    
+    # 파일을 쓰기 전에 대사 (부분 갱신이어도 합계는 파일 전체 기준)
+    if check:
+        check_totals(source, output)
+    
+    # CSV로 저장
+    written_files = []
+    for filepath, result_df in pending:
+        result_df.to_csv(filepath, index=False, encoding='utf-8-sig')
+        written_files.append(filepath)
+    
+    return written_files
 
 def main():
     """메인 함수"""
@@ -150,18 +181,24 @@ def main():
     
     total_files = 0
     
-    for csv_file, year in csv_files:
-        if os.path.exists(csv_file):
-            try:
-                convert_csv_data(csv_file, year)
-                print(f"✅ {csv_file} 처리 완료!\n")
-            except Exception as e:
-                print(f"\n❌ 오류 발생: {csv_file}")
-                print(f"   {str(e)}\n")
-                import traceback
-                traceback.print_exc()
-        else:
-            print(f"\n⚠️  파일을 찾을 수 없습니다: {csv_file}\n")
+    # 빌드 디렉토리에 변환한 뒤 public/data를 한 번에 교체 (publish_data)
+    with staged_output('public/data') as output_dir:
+        for csv_file, year in csv_files:
+            if os.path.exists(csv_file):
+                try:
+                    convert_csv_data(csv_file, year, output_dir)
+                    print(f"✅ {csv_file} 처리 완료!\n")
+                except ReconciliationError as e:
+                    # 빌드 디렉토리를 버리고 배포하지 않음
+                    print(f"\n❌ {csv_file}: {e}\n   배포하지 않았습니다 (public/data는 이전 상태 유지)")
+                    sys.exit(1)
+                except Exception as e:
+                    print(f"\n❌ 오류 발생: {csv_file}")
+                    print(f"   {str(e)}\n")
+                    import traceback
+                    traceback.print_exc()
+            else:
+                print(f"\n⚠️  파일을 찾을 수 없습니다: {csv_file}\n")
     
     # 생성된 파일 목록 확인
     if os.path.exists('public/data'):
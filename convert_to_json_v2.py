@@ -2,11 +2,13 @@
 엑셀 데이터를 JSON으로 변환 (로그 포함)
 """
 import pandas as pd
-import json
 import os
 import sys
 from pathlib import Path
 
+from dimensions import BRANDS, resolve_brand
+from json_shards import write_json_with_shards
+
 # 로그 파일 열기
 log_file = open('conversion_log.txt', 'w', encoding='utf-8')
 
@@ -44,23 +46,16 @@ try:
         log(f"\n❌ '사업부' 컬럼을 찾을 수 없습니다.")
         log(f"   사용 가능한 컬럼: {list(df_2024.columns)}")
     
-    # 브랜드별로 데이터 분리
-    brand_mapping = {
-        'MLB': 'mlb',
-        'MLB Kids': 'mlb-kids', 
-        'Discovery': 'discovery',
-        '공통': 'common'
-    }
-    
+    # 브랜드별로 데이터 분리 (사업부 별칭은 dimensions.BRANDS 기준으로 통일)
     all_data = {}
     
-    for brand_name, brand_id in brand_mapping.items():
+    for file_id, (_, brand_id, brand_name, _) in BRANDS.items():
         log(f"\n🏷️  {brand_name} 데이터 처리 중...")
         
         brand_data = []
         
         # 2024년 데이터 처리
-        df_2024_brand = df_2024[df_2024['사업부'] == brand_name].copy()
+        df_2024_brand = df_2024[df_2024['사업부'].map(resolve_brand) == file_id].copy()
         log(f"   2024년: {len(df_2024_brand)}개 행")
         
         for _, row in df_2024_brand.iterrows():
@@ -86,7 +81,7 @@ try:
                         })
         
         # 2025년 데이터 처리
-        df_2025_brand = df_2025[df_2025['사업부'] == brand_name].copy()
+        df_2025_brand = df_2025[df_2025['사업부'].map(resolve_brand) == file_id].copy()
         log(f"   2025년: {len(df_2025_brand)}개 행")
         
         for _, row in df_2025_brand.iterrows():
@@ -115,13 +110,14 @@ try:
         log(f"   ✅ 총 {len(brand_data):,}개 데이터 생성")
     
     # JSON 파일로 저장
+    # (+ 브랜드 × 연도 샤드, 빌드 디렉토리에 쓴 뒤 public/data 교체)
     output_file = os.path.join(output_dir, 'cost_data.json')
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(all_data, f, ensure_ascii=False, indent=2)
+    manifest = write_json_with_shards(all_data, output_dir, 'cost_data')
     
     log(f"\n{'='*80}")
     log(f"✅ 변환 완료!")
     log(f"📁 파일 저장: {output_file}")
+    log(f"📁 샤드 {len(manifest['shards'])}개: {os.path.join(output_dir, 'cost_data')}/")
     log(f"{'='*80}\n")
     
     # 통계 출력
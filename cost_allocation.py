@@ -0,0 +1,218 @@
+"""
+공통비 배부 스크립트
+cost_common_{yyyymm}.csv의 공통 비용을 월별 배부 기준에 따라
+MLB / MLB Kids / Discovery로 나눠 브랜드별 배부 파티션을 만듭니다.
+
+배부 기준 (--driver):
+    headcount  인원수_YYYY.csv (MLB, KIDS, DX 컬럼)
+    sales      실판매출_YYYY.csv (MLB, KIDS, DISCOVERY 컬럼)
+    fixed      --fixed mlb=60,kids=20,discovery=20
+
+계산: 공통 비용 벡터(최소 단위 정수) × 월별 브랜드 비율 행렬을 한 번의 브로드캐스트 곱으로 계산하고,
+반올림 차이는 비율이 가장 큰 브랜드에 더해서 배부 합계가 원래 금액과 정확히 같게 맞춥니다.
+배부 기준 합계가 0인 월의 비용은 배부하지 않고 경고를 출력합니다.
+
+출력: public/data/cost_alloc_{brand}_{yyyymm}.csv (직접비 파티션과 같은 컬럼, 비고 = 공통배부(기준))
+
+사용법:
+    python cost_allocation.py                      # 인원수 기준
+    python cost_allocation.py --driver sales
+    python cost_allocation.py --driver fixed --fixed mlb=60,kids=20,discovery=20
+"""
+
+import argparse
+import csv
+import glob
+import os
+import re
+import time
+
+import numpy as np
+
+from amounts import format_minor, parse_minor
+from cost_facts import DATA_DIR, FACT_COLUMNS, list_partitions, read_partition
+from publish_data import staged_output
+
+COMMON_BRAND_ID = 'common'
+
+# 배부 대상 브랜드 ID -> (브랜드명, 인원수 컬럼, 실판매출 컬럼)
+TARGETS = {
+    'mlb': ('MLB', 'MLB', 'MLB'),
+    'kids': ('KIDS', 'KIDS', 'KIDS'),
+    'discovery': ('DX', 'DX', 'DISCOVERY'),
+}
+DRIVERS = ['headcount', 'sales', 'fixed']
+DRIVER_LABELS = {'headcount': '인원수', 'sales': '실판매출', 'fixed': '고정비율'}
+ALLOCATION_PATTERN = re.compile(r'^cost_alloc_[a-z-]+_\d{6}\.csv$')
+
+MONTH_NAMES = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+HEADCOUNT_MONTH = re.compile(r'(\d{2})년\s*(\d{1,2})월')
+
+def _read_csv(path):
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        reader = csv.reader(f)
+        header = [col.strip() for col in next(reader, [])]
+        return header, list(reader)
+
+def load_headcount(driver_dir=DATA_DIR):
+    """
+    인원수_YYYY.csv → {YYYYMM: [브랜드별 인원수]} (TARGETS 순서)
+    """
+    weights = {}
+    for path in sorted(glob.glob(os.path.join(driver_dir, '인원수_*.csv'))):
+        header, rows = _read_csv(path)
+        cols = [header.index(target[1]) for target in TARGETS.values()]
+        for row in rows:
+            match = HEADCOUNT_MONTH.search(row[0]) if row else None
+            if not match:
+                continue
+            yyyymm = f"20{match.group(1)}{int(match.group(2)):02d}"
+            weights[yyyymm] = [float(row[i].replace('명', '').replace(',', '').strip() or 0)
+                               if i < len(row) else 0.0 for i in cols]
+    return weights
+
+def load_sales(driver_dir=DATA_DIR):
+    """
+    실판매출_YYYY.csv → {YYYYMM: [브랜드별 매출]} (TARGETS 순서, 빈 칸은 0)
+    """
+    weights = {}
+    for path in sorted(glob.glob(os.path.join(driver_dir, '실판매출_*.csv'))):
+        year = re.search(r'(20\d{2})', os.path.basename(path)).group(1)
+        header, rows = _read_csv(path)
+        cols = [header.index(target[2]) for target in TARGETS.values()]
+        for row in rows:
+            if not row or row[0].strip() not in MONTH_NAMES:
+                continue
+            yyyymm = f"{year}{MONTH_NAMES.index(row[0].strip()) + 1:02d}"
+            weights[yyyymm] = [float(parse_minor(row[i])) if i < len(row) else 0.0 for i in cols]
+    return weights
+
+def parse_fixed(spec):
+    """
+    'mlb=60,kids=20,discovery=20' → [60, 20, 20] (TARGETS 순서)
+    """
+    values = dict.fromkeys(TARGETS, 0.0)
+    for part in spec.split(','):
+        brand_id, _, value = part.partition('=')
+        if brand_id.strip() not in values:
+            raise ValueError(f"알 수 없는 브랜드: {brand_id} (가능: {', '.join(TARGETS)})")
+        values[brand_id.strip()] = float(value)
+    return list(values.values())
+
+def share_matrix(months, driver, fixed=None, driver_dir=DATA_DIR):
+    """
+    월 × 브랜드 배부 비율 행렬 (각 행의 합 = 1, 기준 합계가 0인 월은 NaN)
+    """
+    if driver == 'fixed':
+        weights = np.tile(np.array(parse_fixed(fixed or ''), dtype=np.float64), (len(months), 1))
+    else:
+        table = load_headcount(driver_dir) if driver == 'headcount' else load_sales(driver_dir)
+        weights = np.array([table.get(m, [0.0] * len(TARGETS)) for m in months], dtype=np.float64)
+        weights = weights.reshape(len(months), len(TARGETS))
+
+    totals = weights.sum(axis=1, keepdims=True)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(totals > 0, weights / totals, np.nan)
+
+def allocate(amounts, shares):
+    """
+    비용 × 브랜드 비율 브로드캐스트 곱 (최소 단위 정수, 행 합계 보존)
+
+    Args:
+        amounts: 비용 라인 금액 int64 배열 (n,)
+        shares: 라인별 브랜드 비율 (n × 브랜드 수)
+
+    Returns:
+        int64 배열 (n × 브랜드 수)
+    """
+    allocated = np.rint(amounts[:, None] * shares).astype(np.int64)
+    residual = amounts - allocated.sum(axis=1)
+    allocated[np.arange(len(amounts)), np.argmax(shares, axis=1)] += residual
+    return allocated
+
+def load_common_lines(data_dir=DATA_DIR):
+    """
+    공통 파티션 행과 (월 목록, 라인별 월 번호, 금액 배열)
+    """
+    lines, month_of, amounts = [], [], []
+    months = []
+    for _, yyyymm, path in list_partitions(data_dir, [COMMON_BRAND_ID]):
+        months.append(yyyymm)
+        for row in read_partition(path):
+            lines.append(row)
+            month_of.append(len(months) - 1)
+            amounts.append(parse_minor(row['금액']))
+    return lines, months, np.array(month_of, dtype=np.int64), np.array(amounts, dtype=np.int64)
+
+def write_allocations(lines, months, month_of, allocated, driver, output_dir=DATA_DIR):
+    """
+    cost_alloc_{brand}_{yyyymm}.csv 저장 (이전 배부 파일은 삭제)
+
+    Returns:
+        {brand_id: 행 수}
+    """
+    for path in glob.glob(os.path.join(output_dir, 'cost_alloc_*_*.csv')):
+        os.remove(path)
+
+    note = f'공통배부({DRIVER_LABELS[driver]})'
+    counts = {}
+    for j, (brand_id, (brand_name, _, _)) in enumerate(TARGETS.items()):
+        column = allocated[:, j]
+        for m, yyyymm in enumerate(months):
+            selected = np.flatnonzero((month_of == m) & (column != 0))
+            if not len(selected):
+                continue
+            filepath = os.path.join(output_dir, f'cost_alloc_{brand_id}_{yyyymm}.csv')
+            with open(filepath, 'w', encoding='utf-8-sig', newline='') as f:
+                writer = csv.writer(f, lineterminator=os.linesep)
+                writer.writerow(FACT_COLUMNS)
+                for i, amount in zip(selected.tolist(), column[selected].tolist()):
+                    line = lines[i]
+                    writer.writerow([brand_name, line['본부'], line['팀'], line['대분류'], line['중분류'],
+                                     line['소분류'], line['계정과목'], format_minor(amount), yyyymm, note])
+            counts[brand_id] = counts.get(brand_id, 0) + len(selected)
+    return counts
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='공통비 배부')
+    parser.add_argument('--driver', choices=DRIVERS, default='headcount')
+    parser.add_argument('--fixed', help="고정 비율 (예: 'mlb=60,kids=20,discovery=20')")
+    parser.add_argument('--data-dir', default=DATA_DIR, help='파티션/배부 기준 파일 위치')
+    parser.add_argument('--output-dir', default=DATA_DIR)
+    args = parser.parse_args()
+
+    if args.driver == 'fixed' and not args.fixed:
+        parser.error('--driver fixed에는 --fixed가 필요합니다')
+
+    print("\n" + "="*70)
+    print(f"🔀 공통비 배부 ({DRIVER_LABELS[args.driver]} 기준)")
+    print("="*70)
+
+    started = time.perf_counter()
+    lines, months, month_of, amounts = load_common_lines(args.data_dir)
+    if not lines:
+        print("❌ 공통 비용 파티션이 없습니다.")
+        return
+
+    shares = share_matrix(months, args.driver, args.fixed, args.data_dir)
+    missing = [m for m, row in zip(months, shares) if np.isnan(row).any()]
+    if missing:
+        print(f"⚠️  배부 기준이 없는 월은 배부하지 않습니다: {', '.join(missing)}")
+
+    line_shares = shares[month_of]
+    valid = ~np.isnan(line_shares).any(axis=1)
+    allocated = np.zeros((len(amounts), len(TARGETS)), dtype=np.int64)
+    allocated[valid] = allocate(amounts[valid], line_shares[valid])
+
+    # 빌드 디렉토리에 쓴 뒤 public/data를 한 번에 교체 (이전 배부 파일은 새 릴리스에서 제외)
+    with staged_output(args.output_dir, managed=ALLOCATION_PATTERN, snapshot=False) as target:
+        counts = write_allocations(lines, months, month_of, allocated, args.driver, target)
+    print(f"✅ 공통 비용 {len(lines):,}행, 합계 {format_minor(int(amounts[valid].sum()))} 배부")
+    for j, brand_id in enumerate(TARGETS):
+        if brand_id in counts:
+            print(f"   ✅ {brand_id}: {counts[brand_id]:,}행, 합계 {format_minor(int(allocated[:, j].sum()))}")
+    print(f"\n⏱️  {time.perf_counter() - started:.2f}초")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+"""
+본부/계정 시리즈별 통계 및 이상치 사전 계산 스크립트
+대시보드가 브라우저에서 매번 reduce로 계산하던 값(최고/최저 월, 최근 평균, 연도별 합계 등)을 미리 계산해 둡니다.
+파티션이 바뀐 브랜드의 파일은 배포할 때 publish_data가 다시 계산하므로 따로 실행하지 않아도 됩니다.
+
+시리즈 × 월 행렬 하나에 대해 벡터 연산으로 한 번에 계산:
+- 합계, 평균, 표준편차, 최고/최저 월, 최근 3개월 평균
+- 연도별 합계 (전년 동기 합계 포함)
+- z-score 이상치, 전월 대비 급증/급감
+
+금액은 최소 단위 정수(cost_facts.load_facts)로 합산하고 JSON에 쓸 때만 원 단위로 바꿉니다.
+
+출력: public/data/analytics_{brand}.json
+    {"brand", "months", "levels": {레벨: {"series": 표, "outliers": 표, "jumps": 표}}}
+    표 = {"columns": [...], "rows": [[...], ...]}
+
+사용법:
+    python cost_analytics.py
+"""
+
+import json
+import os
+import re
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from amounts import MINOR_UNITS
+from cost_facts import DATA_DIR, load_facts
+from publish_data import staged_output
+
+# 시리즈 단위: 레벨 이름 -> 그룹 컬럼
+SERIES_LEVELS = {
+    '전체': [],
+    '대분류': ['대분류'],
+    '본부': ['본부'],
+    '본부/대분류': ['본부', '대분류'],
+    '본부/계정과목': ['본부', '대분류', '계정과목'],
+}
+
+RECENT_MONTHS = 3          # 최근 평균에 사용할 개월 수
+Z_THRESHOLD = 2.5          # |z| 이상이면 이상치
+JUMP_RATIO = 0.5           # 전월 대비 ±50% 이상 변동
+JUMP_MIN_AMOUNT = 10000   # 변동 금액(원)이 이보다 작으면 무시
+ANALYTICS_PATTERN = re.compile(r'^analytics_[a-z-]+\.json$')
+
+# 최소 단위 → 원 단위로 바꿔서 출력할 컬럼 (접두어)
+AMOUNT_COLUMNS = ('합계', '평균', '표준편차', '최고금액', '최저금액', f'최근{RECENT_MONTHS}개월평균',
+                  '동기합계', '금액', '전월금액')
+
+def analytics_filename(brand_id):
+    """브랜드 통계 파일명 (public/data 기준)"""
+    return f'analytics_{brand_id}.json'
+
+def build_matrix(facts, keys, months=None):
+    """
+    (brand_id + keys) 시리즈 × 전체 월 밀집 행렬
+    months를 지정하면 그 월 목록을 열로 사용 (일부 브랜드만 다시 계산해도 전체 계산과 같은 결과)
+    브랜드에 데이터가 있는 월의 빈 칸은 0, 브랜드 데이터가 없는 월은 NaN
+    합계는 int64 최소 단위로 구한 뒤 NaN 표시를 위해 float64로 바꿈 (2**53 미만이므로 정확)
+
+    Returns:
+        (시리즈 인덱스 DataFrame, 월 목록, 최소 단위 float64 행렬)
+    """
+    pivot = facts.pivot_table(index=['brand_id'] + keys, columns='년월', values='금액',
+                              aggfunc='sum', fill_value=0)
+    months = sorted(facts['년월'].unique() if months is None else months)
+    pivot = pivot.reindex(columns=months, fill_value=0)
+    index = pivot.index.to_frame(index=False)
+
+    brand_months = pd.crosstab(facts['brand_id'], facts['년월']).reindex(columns=months, fill_value=0) > 0
+    active = brand_months.reindex(index['brand_id']).to_numpy()
+    matrix = np.where(active, pivot.to_numpy(dtype=np.float64), np.nan)
+    return index, months, matrix
+
+def compute_series_stats(index, months, matrix):
+    """
+    시리즈별 통계 (모든 시리즈를 한 번에 계산)
+    """
+    month_arr = np.array(months)
+    years = np.array([m[:4] for m in months])
+    n_months = matrix.shape[1]
+
+    with np.errstate(invalid='ignore'), warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        mean = np.nanmean(matrix, axis=1)
+        std = np.nanstd(matrix, axis=1)
+        recent = np.nanmean(matrix[:, -RECENT_MONTHS:], axis=1) if n_months else mean
+
+    stats = index.copy()
+    stats['합계'] = np.nansum(matrix, axis=1)
+    stats['평균'] = mean
+    stats['표준편차'] = std
+    stats['최고월'] = month_arr[np.nanargmax(matrix, axis=1)]
+    stats['최고금액'] = np.nanmax(matrix, axis=1)
+    stats['최저월'] = month_arr[np.nanargmin(matrix, axis=1)]
+    stats['최저금액'] = np.nanmin(matrix, axis=1)
+    stats[f'최근{RECENT_MONTHS}개월평균'] = recent
+
+    # 연도별 합계 + 최신 연도와 같은 기간의 전년 합계
+    year_list = sorted(set(years))
+    for year in year_list:
+        stats[f'합계_{year}'] = np.nansum(matrix[:, years == year], axis=1)
+    if len(year_list) >= 2:
+        latest, prev = year_list[-1], year_list[-2]
+        latest_mm = {m[4:] for m in months if m.startswith(latest)}
+        same_period = np.array([m.startswith(prev) and m[4:] in latest_mm for m in months])
+        stats[f'동기합계_{prev}'] = np.nansum(matrix[:, same_period], axis=1)
+
+    return stats
+
+def detect_outliers(index, months, matrix):
+    """
+    z-score 이상치 (시리즈 평균/표준편차 기준)
+    """
+    mean = np.nanmean(matrix, axis=1, keepdims=True)
+    std = np.nanstd(matrix, axis=1, keepdims=True)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        z = np.where(std > 0, (matrix - mean) / std, 0.0)
+    rows, cols = np.nonzero(np.nan_to_num(np.abs(z)) >= Z_THRESHOLD)
+
+    outliers = index.iloc[rows].reset_index(drop=True)
+    outliers['년월'] = np.array(months)[cols]
+    outliers['금액'] = matrix[rows, cols]
+    outliers['z'] = z[rows, cols]
+    return outliers
+
+def detect_jumps(index, months, matrix):
+    """
+    전월 대비 급증/급감 (변동률 JUMP_RATIO 이상, 변동액 JUMP_MIN_AMOUNT 이상)
+    """
+    prev = matrix[:, :-1]
+    curr = matrix[:, 1:]
+    diff = curr - prev
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = np.where(prev != 0, diff / np.abs(prev), np.inf * np.sign(diff))
+    mask = (np.nan_to_num(np.abs(ratio) >= JUMP_RATIO)
+            & (np.nan_to_num(np.abs(diff)) >= JUMP_MIN_AMOUNT * MINOR_UNITS))
+    rows, cols = np.nonzero(mask)
+
+    jumps = index.iloc[rows].reset_index(drop=True)
+    jumps['년월'] = np.array(months)[cols + 1]
+    jumps['전월금액'] = prev[rows, cols]
+    jumps['금액'] = curr[rows, cols]
+    jumps['변동률'] = np.where(np.isfinite(ratio[rows, cols]), ratio[rows, cols], np.nan)
+    return jumps
+
+def to_table(df, digits=2):
+    """
+    DataFrame -> {"columns": [...], "rows": [[...]]}
+    (금액 컬럼은 최소 단위 → 원 단위, 실수는 소수 둘째 자리 반올림)
+    """
+    df = df.drop(columns=['brand_id'], errors='ignore')
+    rounded = df.copy()
+    for col in rounded.columns:
+        if str(col).startswith(AMOUNT_COLUMNS):
+            rounded[col] = rounded[col] / MINOR_UNITS
+        if pd.api.types.is_float_dtype(rounded[col]):
+            rounded[col] = rounded[col].round(digits)
+    rows = rounded.astype(object).where(rounded.notna(), None).values.tolist()
+    return {'columns': [str(c) for c in rounded.columns], 'rows': rows}
+
+def compute_analytics(facts, months=None):
+    """
+    브랜드별 분석 결과 계산
+
+    Args:
+        facts: load_facts 결과 (일부 브랜드만 있어도 됨)
+        months: 전체 파티션의 월 목록 (없으면 facts의 월)
+
+    Returns:
+        {brand_id: 결과 dict}
+    """
+    results = {}
+    for brand_id in sorted(facts['brand_id'].unique()):
+        brand_months = sorted(facts.loc[facts['brand_id'] == brand_id, '년월'].unique())
+        results[brand_id] = {'brand': brand_id, 'months': brand_months, 'levels': {}}
+
+    for level, keys in SERIES_LEVELS.items():
+        index, columns, matrix = build_matrix(facts, keys, months)
+        stats = compute_series_stats(index, columns, matrix)
+        outliers = detect_outliers(index, columns, matrix)
+        jumps = detect_jumps(index, columns, matrix)
+
+        for brand_id, result in results.items():
+            result['levels'][level] = {
+                'series': to_table(stats[stats['brand_id'] == brand_id]),
+                'outliers': to_table(outliers[outliers['brand_id'] == brand_id]),
+                'jumps': to_table(jumps[jumps['brand_id'] == brand_id]),
+            }
+
+    return results
+
+def write_analytics(results, output_dir=DATA_DIR):
+    """
+    compute_analytics 결과를 브랜드별 analytics_{brand}.json으로 저장
+
+    Returns:
+        [(브랜드 ID, 경로)]
+    """
+    written = []
+    for brand_id, result in results.items():
+        output_file = os.path.join(output_dir, analytics_filename(brand_id))
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, separators=(',', ':'))
+        written.append((brand_id, output_file))
+    return written
+
+def main(data_dir=DATA_DIR, output_dir=DATA_DIR):
+    """메인 함수"""
+    print("\n" + "="*70)
+    print("📊 시리즈 통계/이상치 사전 계산")
+    print("="*70)
+
+    facts = load_facts(data_dir)
+    print(f"✅ 데이터 로드 완료: {len(facts):,}행")
+    if facts.empty:
+        print("❌ 처리할 데이터가 없습니다.")
+        return
+
+    results = compute_analytics(facts)
+    # 빌드 디렉토리에 쓴 뒤 public/data를 한 번에 교체 (publish_data)
+    with staged_output(output_dir, managed=ANALYTICS_PATTERN, snapshot=False) as target:
+        for brand_id, _ in write_analytics(results, target):
+            level_counts = ', '.join(f"{level} {len(v['series']['rows'])}개"
+                                     for level, v in results[brand_id]['levels'].items())
+            print(f"   ✅ {analytics_filename(brand_id)} ({level_counts})")
+
+if __name__ == "__main__":
+    main()
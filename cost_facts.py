@@ -0,0 +1,73 @@
+"""
+public/data의 브랜드/월 파티션 (cost_{brand}_{yyyymm}.csv) 읽기 도구
+분석/집계 스크립트들이 공통으로 사용합니다.
+"""
+
+import csv
+import os
+import re
+
+DATA_DIR = 'public/data'
+
+# cost_mlb_202401.csv, cost_kids_202510.csv ...
+PARTITION_PATTERN = re.compile(r'^cost_([a-z-]+)_(\d{6})\.csv$')
+
+FACT_COLUMNS = ['브랜드', '본부', '팀', '대분류', '중분류', '소분류', '계정과목', '금액', '년월', '비고']
+DIMENSION_COLUMNS = ['본부', '대분류', '중분류', '소분류']
+
+def list_partitions(data_dir=DATA_DIR, brands=None):
+    """
+    파티션 파일 목록
+
+    Args:
+        data_dir: 파티션 디렉토리
+        brands: 포함할 브랜드 파일 ID 목록 (예: ['mlb', 'kids'], 없으면 전체)
+
+    Returns:
+        [(브랜드 ID, YYYYMM, 경로)] (브랜드, 월 순 정렬)
+    """
+    partitions = []
+    if not os.path.isdir(data_dir):
+        return partitions
+    for name in os.listdir(data_dir):
+        match = PARTITION_PATTERN.match(name)
+        if not match:
+            continue
+        brand_id, yyyymm = match.groups()
+        if brands is not None and brand_id not in brands:
+            continue
+        partitions.append((brand_id, yyyymm, os.path.join(data_dir, name)))
+    return sorted(partitions)
+
+def read_partition(path):
+    """
+    파티션 CSV 하나를 dict 행 목록으로 읽기 (표준 라이브러리만 사용)
+    """
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        return list(csv.DictReader(f))
+
+def load_facts(data_dir=DATA_DIR, brands=None):
+    """
+    파티션들을 하나의 long-form 데이터프레임으로 읽기
+    (brand_id 컬럼 추가, 년월은 문자열, 문자열 컬럼의 빈 값은 '',
+     금액은 amounts.parse_minor로 읽은 int64 최소 단위 정수)
+    """
+    import pandas as pd
+
+    from amounts import parse_minor
+
+    frames = []
+    for brand_id, yyyymm, path in list_partitions(data_dir, brands):
+        df = pd.read_csv(path, encoding='utf-8-sig', dtype={'년월': str, '금액': str})
+        df['brand_id'] = brand_id
+        frames.append(df)
+
+    if not frames:
+        return pd.DataFrame(columns=FACT_COLUMNS + ['brand_id'])
+
+    facts = pd.concat(frames, ignore_index=True)
+    for col in FACT_COLUMNS:
+        if col != '금액':
+            facts[col] = facts[col].fillna('').astype(str)
+    facts['금액'] = facts['금액'].map(parse_minor).astype('int64')
+    return facts
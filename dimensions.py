@@ -0,0 +1,177 @@
+"""
+공통 차원 테이블 (대리 키)
+브랜드 / 본부 / 대분류 / 중분류 / 소분류 라벨에 연도와 관계없이 고정된 정수 키를 부여합니다.
+키는 dimensions.json에 저장되어 다음 실행에도 그대로 유지되고, 처음 보는 라벨만 새 키를 받습니다.
+(키는 다시 쓰지 않으므로 라벨이 사라져도 다른 라벨이 그 키를 받지 않음)
+
+입력 시점에 한 번만 통일하는 것:
+    브랜드 별칭    Discovery → DX, MLB Kids → KIDS (파일 ID discovery, kids)
+    연도별 컬럼    2024 '소분류' / 2025 'Cost Elem desc', '사업부(조정)' / '사업부'
+
+브랜드 매핑은 이 모듈의 BRANDS 하나만 사용합니다 (변환 스크립트마다 따로 두지 않음).
+
+사용법:
+    python dimensions.py                 # public/data 파티션의 라벨을 dimensions.json에 등록
+    python dimensions.py --show 브랜드    # 차원 테이블 출력
+"""
+
+import argparse
+import json
+import os
+
+DIMENSIONS_FILE = 'dimensions.json'
+DIMENSION_NAMES = ['브랜드', '본부', '대분류', '중분류', '소분류']
+
+# 브랜드 파일 ID -> (대리 키, 대시보드 ID, 표준 라벨, 원천 라벨 별칭)
+# 표준 라벨은 파티션 '브랜드' 컬럼에 쓰는 값 (대시보드 BRAND_NAMES와 같음)
+BRANDS = {
+    'mlb': (1, 'mlb', 'MLB', ('MLB',)),
+    'kids': (2, 'mlb-kids', 'KIDS', ('KIDS', 'MLB Kids', 'MLB KIDS')),
+    'discovery': (3, 'discovery', 'DX', ('DX', 'Discovery')),
+    'common': (4, 'common', '공통', ('공통',)),
+}
+
+# 차원 -> 원천 컬럼 후보 (앞쪽 우선, 연도별로 컬럼 이름이 다름)
+SOURCE_COLUMNS = {
+    '브랜드': ('사업부(조정)', '사업부'),
+    '본부': ('부서명',),
+    '대분류': ('대분류',),
+    '중분류': ('중분류',),
+    '소분류': ('Cost Elem desc', '소분류'),
+}
+
+def _fold(label):
+    return str(label).strip().casefold()
+
+# 별칭/파일 ID/대시보드 ID/표준 라벨 (대소문자, 앞뒤 공백 무시) -> 브랜드 파일 ID
+_BRAND_ALIASES = {
+    _fold(alias): file_id
+    for file_id, (_, dashboard_id, label, aliases) in BRANDS.items()
+    for alias in (file_id, dashboard_id, label, *aliases)
+}
+
+def resolve_brand(label):
+    """
+    원천 브랜드 라벨 → 브랜드 파일 ID (알 수 없는 라벨이면 None)
+    """
+    if label is None:
+        return None
+    return _BRAND_ALIASES.get(_fold(label))
+
+def brand_file_id(label):
+    """
+    파티션 파일명용 브랜드 ID (예: DX → discovery, 모르는 브랜드는 소문자/밑줄)
+    """
+    return resolve_brand(label) or str(label).replace(' ', '_').lower()
+
+def brand_label(label):
+    """
+    원천 브랜드 라벨 → 표준 라벨 (예: Discovery → DX, 모르는 브랜드는 그대로)
+    """
+    file_id = resolve_brand(label)
+    return BRANDS[file_id][2] if file_id else str(label).strip()
+
+def source_column(columns, dimension):
+    """
+    columns 중 차원에 해당하는 원천 컬럼 이름 (없으면 None)
+    """
+    return next((col for col in SOURCE_COLUMNS[dimension] if col in columns), None)
+
+class DimensionStore:
+    """
+    차원별 {라벨: 대리 키} 테이블 (dimensions.json에 저장)
+    """
+
+    def __init__(self, tables=None):
+        self.tables = {dim: dict((tables or {}).get(dim, {})) for dim in DIMENSION_NAMES}
+        # 알려진 브랜드는 코드에 고정된 키 사용
+        for file_id, (key, _, _, _) in BRANDS.items():
+            self.tables['브랜드'][file_id] = key
+        self._labels = {dim: {key: label for label, key in table.items()}
+                        for dim, table in self.tables.items()}
+        self.changed = False
+
+    @classmethod
+    def load(cls, path=DIMENSIONS_FILE):
+        """저장된 테이블 읽기 (파일이 없으면 빈 테이블)"""
+        if not os.path.exists(path):
+            return cls()
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def save(self, path=DIMENSIONS_FILE):
+        """바뀐 내용이 있을 때만 저장 (임시 파일 후 교체)"""
+        if not self.changed and os.path.exists(path):
+            return False
+        tmp = path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.tables, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, path)
+        self.changed = False
+        return True
+
+    def key(self, dimension, label):
+        """
+        라벨의 대리 키 (처음 보는 라벨이면 새 키 부여, 브랜드는 별칭 해석 후)
+        """
+        label = '' if label is None else str(label).strip()
+        if dimension == '브랜드':
+            label = brand_file_id(label)
+        table = self.tables[dimension]
+        key = table.get(label)
+        if key is None:
+            key = max(self._labels[dimension], default=0) + 1
+            table[label] = key
+            self._labels[dimension][key] = label
+            self.changed = True
+        return key
+
+    def label(self, dimension, key):
+        """대리 키 → 라벨 (브랜드는 파일 ID)"""
+        return self._labels[dimension][key]
+
+    def labels(self, dimension):
+        """키 순서의 (키, 라벨) 목록"""
+        return sorted(self._labels[dimension].items())
+
+def register_partitions(store, data_dir=None):
+    """
+    파티션 파일의 라벨을 모두 등록
+
+    Returns:
+        읽은 파티션 수
+    """
+    from cost_facts import DATA_DIR, DIMENSION_COLUMNS, list_partitions, read_partition
+
+    partitions = list_partitions(data_dir or DATA_DIR)
+    for brand_id, _, path in partitions:
+        store.key('브랜드', brand_id)
+        for row in read_partition(path):
+            for col in DIMENSION_COLUMNS:
+                store.key(col, row[col])
+    return len(partitions)
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='공통 차원 테이블 (대리 키)')
+    parser.add_argument('--data-dir', default=None, help='파티션 디렉토리 (기본: public/data)')
+    parser.add_argument('--file', default=DIMENSIONS_FILE)
+    parser.add_argument('--show', choices=DIMENSION_NAMES, help='차원 테이블 출력')
+    args = parser.parse_args()
+
+    store = DimensionStore.load(args.file)
+    if args.show:
+        for key, label in store.labels(args.show):
+            print(f"{key:>6}  {label}")
+        return
+
+    before = {dim: len(store.tables[dim]) for dim in DIMENSION_NAMES}
+    count = register_partitions(store, args.data_dir)
+    saved = store.save(args.file)
+    print(f"✅ 파티션 {count}개 등록 ({args.file}{'' if saved else ', 변경 없음'})")
+    for dim in DIMENSION_NAMES:
+        added = len(store.tables[dim]) - before[dim]
+        print(f"   {dim}: {len(store.tables[dim]):,}개" + (f" (+{added})" if added else ""))
+
+if __name__ == "__main__":
+    main()
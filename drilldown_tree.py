@@ -0,0 +1,156 @@
+"""
+드릴다운 트리 샤드 생성 스크립트
+브랜드 → 본부 → 대분류 → 중분류 → 소분류 집계 트리를 미리 만들어
+브랜드/본부 단위의 작은 JSON 파일로 나눠 저장합니다.
+대시보드는 index.json만 먼저 받고, 펼친 본부의 샤드만 추가로 받으면 됩니다.
+파티션이 바뀐 브랜드의 샤드는 배포할 때 publish_data가 다시 만들므로 따로 실행하지 않아도 됩니다.
+
+출력: public/data/drilldown/{brand}/
+    index.json  {"brand", "months", "monthly", "ytd",
+                 "children": [{"name", "monthly", "ytd", "shard", "rows"}]}
+    {hash}.json 본부 하나의 서브트리 {"name", "monthly", "ytd", "children": [...]}
+                (대분류 → 중분류 → 소분류, 소분류 노드는 children 없음)
+                파일명은 브랜드/본부 경로의 해시라 정렬 순서가 바뀌어도 같은 본부는 같은 파일
+                (내용이 같으면 publish_data가 기존 파일을 재사용, 브라우저 캐시도 유지)
+
+monthly/ytd 배열은 months 순서와 같고, ytd는 같은 연도 1월부터의 누계입니다.
+
+사용법:
+    python drilldown_tree.py
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+
+from amounts import minor_to_float, parse_minor
+from cost_facts import DATA_DIR, list_partitions, read_partition
+from publish_data import staged_output
+
+DRILLDOWN_DIR = 'drilldown'      # public/data 기준
+OUTPUT_DIR = os.path.join(DATA_DIR, DRILLDOWN_DIR)
+LEVELS = ['본부', '대분류', '중분류', '소분류']
+# output_dir 기준 경로 전체 (이번에 만들지 않은 브랜드/샤드는 배포에서 제외)
+SHARD_PATTERN = re.compile(r'.')
+
+def shard_filename(brand_id, dept):
+    """본부 샤드 파일명 (브랜드/본부 경로의 sha1 앞 12자리)"""
+    digest = hashlib.sha1(f'{brand_id}/{dept}'.encode('utf-8')).hexdigest()
+    return f'{digest[:12]}.json'
+
+def _new_node():
+    return {'amounts': {}, 'children': {}, 'rows': 0}
+
+def build_tree(partitions):
+    """
+    파티션 행으로 트리 구성
+
+    Returns:
+        {brand_id: (월 목록, 루트 노드)}
+    """
+    trees = {}
+    for brand_id, yyyymm, path in partitions:
+        months, root = trees.setdefault(brand_id, (set(), _new_node()))
+        months.add(yyyymm)
+        for row in read_partition(path):
+            amount = parse_minor(row['금액'])
+            node = root
+            node['amounts'][yyyymm] = node['amounts'].get(yyyymm, 0) + amount
+            node['rows'] += 1
+            for level in LEVELS:
+                node = node['children'].setdefault(row[level], _new_node())
+                node['amounts'][yyyymm] = node['amounts'].get(yyyymm, 0) + amount
+                node['rows'] += 1
+    return {brand_id: (sorted(months), root) for brand_id, (months, root) in trees.items()}
+
+def _series(node, months):
+    """월별 금액 배열과 연도별 누계 배열"""
+    monthly = [node['amounts'].get(m, 0) for m in months]
+    ytd = []
+    running, year = 0, None
+    for month, amount in zip(months, monthly):
+        if month[:4] != year:
+            running, year = 0, month[:4]
+        running += amount
+        ytd.append(running)
+    return [minor_to_float(v) for v in monthly], [minor_to_float(v) for v in ytd]
+
+def _children_sorted(node):
+    """합계 절댓값이 큰 순서로 자식 정렬"""
+    return sorted(node['children'].items(),
+                  key=lambda item: (-abs(sum(item[1]['amounts'].values())), item[0]))
+
+def serialize(name, node, months):
+    """
+    노드와 하위 트리를 JSON용 dict로 변환
+    """
+    monthly, ytd = _series(node, months)
+    result = {'name': name, 'monthly': monthly, 'ytd': ytd}
+    if node['children']:
+        result['children'] = [serialize(child_name, child, months)
+                              for child_name, child in _children_sorted(node)]
+    return result
+
+def write_shards(trees, output_dir=OUTPUT_DIR):
+    """
+    브랜드별 index.json + 본부별 샤드 저장
+
+    Returns:
+        {brand_id: (샤드 수, 전체 바이트 수)}
+    """
+    stats = {}
+    for brand_id, (months, root) in trees.items():
+        brand_dir = os.path.join(output_dir, brand_id)
+        if os.path.isdir(brand_dir):
+            shutil.rmtree(brand_dir)
+        os.makedirs(brand_dir)
+
+        monthly, ytd = _series(root, months)
+        index = {'brand': brand_id, 'months': months, 'monthly': monthly, 'ytd': ytd, 'children': []}
+        total_bytes = 0
+
+        for dept, node in _children_sorted(root):
+            shard_name = shard_filename(brand_id, dept)
+            payload = json.dumps(serialize(dept, node, months), ensure_ascii=False, separators=(',', ':'))
+            with open(os.path.join(brand_dir, shard_name), 'w', encoding='utf-8') as f:
+                f.write(payload)
+            total_bytes += len(payload.encode('utf-8'))
+
+            dept_monthly, dept_ytd = _series(node, months)
+            index['children'].append({
+                'name': dept,
+                'monthly': dept_monthly,
+                'ytd': dept_ytd,
+                'shard': shard_name,
+                'rows': node['rows'],
+            })
+
+        payload = json.dumps(index, ensure_ascii=False, separators=(',', ':'))
+        with open(os.path.join(brand_dir, 'index.json'), 'w', encoding='utf-8') as f:
+            f.write(payload)
+        total_bytes += len(payload.encode('utf-8'))
+        stats[brand_id] = (len(index['children']), total_bytes)
+    return stats
+
+def main(data_dir=DATA_DIR, output_dir=OUTPUT_DIR):
+    """메인 함수"""
+    print("\n" + "="*70)
+    print("🌳 드릴다운 트리 샤드 생성")
+    print("="*70)
+
+    trees = build_tree(list_partitions(data_dir))
+    if not trees:
+        print("❌ 처리할 데이터가 없습니다.")
+        return
+
+    # 빌드 디렉토리에 쓴 뒤 public/data를 한 번에 교체 (publish_data)
+    with staged_output(output_dir, managed=SHARD_PATTERN, snapshot=False) as target:
+        stats = write_shards(trees, target)
+    for brand_id, (shards, total_bytes) in stats.items():
+        print(f"   ✅ {brand_id}: 본부 샤드 {shards}개 ({total_bytes / 1024:.1f}KB)")
+    print(f"\n📁 저장 위치: {output_dir}/")
+
+if __name__ == "__main__":
+    main()
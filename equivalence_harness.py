@@ -0,0 +1,367 @@
+"""
+변환기 동등성/성능 비교 하네스
+
+기존 변환기(legacy)와 대체 변환기(candidate)를 같은 입력으로 실행해서
+- 출력 행을 하나씩 비교하고 (브랜드, 월, 차원, 금액[센트 단위])
+- 브랜드/월별 합계를 대사하고
+- 실행 시간과 메모리 사용량 비율을 보고합니다.
+  (시간은 추적 없이 실행한 결과, 메모리 최대값은 같은 프로세스 변환기는 tracemalloc으로 따로 한 번 더 실행한 결과,
+   별도 프로세스 변환기는 그 자식 프로세스의 최대 RSS)
+
+등록된 변환기 (ENGINES):
+    CSV 입력 (재유니 피벗 CSV)       : convert_new_data, fast_convert
+    엑셀 입력 (XLSX 두 개가 있는 폴더): final_convert, convert_excel_to_json, convert_to_json_v2
+
+사용법:
+    python equivalence_harness.py                                  # 재유니/2024.csv, 2025.csv
+    python equivalence_harness.py --input 재유니/2025.csv --repeat 5
+    python equivalence_harness.py --generate 20000                 # 생성한 데이터로 비교
+    python equivalence_harness.py --legacy final_convert --candidate convert_excel_to_json --input 엑셀폴더
+"""
+
+import argparse
+import contextlib
+import csv
+import importlib
+import io
+import json
+import os
+import random
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from amounts import parse_minor
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+PARTITION_PATTERN = re.compile(r'^cost_([a-z-]+)_(\d{6})\.csv$')
+
+# ---------------------------------------------------------------------------
+# 변환기 실행
+# ---------------------------------------------------------------------------
+
+def _run_convert_new_data(input_path, output_dir):
+    from convert_new_data import convert_csv_data
+
+    year_match = re.search(r'(20\d{2})', os.path.basename(input_path))
+    convert_csv_data(input_path, int(year_match.group(1)) if year_match else None, output_dir)
+
+def _run_fast_convert(input_path, output_dir):
+    from fast_convert import convert_file
+
+    convert_file(input_path, output_dir, verbose=False)
+
+def _run_in_workdir(input_dir, output_dir, command):
+    """
+    XLSX 경로가 고정된 스크립트를 입력 폴더의 XLSX를 복사한 임시 작업 폴더에서 실행
+    (결과 public/data/*.json을 output_dir로 복사)
+    """
+    with tempfile.TemporaryDirectory() as workdir:
+        for name in os.listdir(input_dir):
+            if name.lower().endswith('.xlsx'):
+                shutil.copy2(os.path.join(input_dir, name), os.path.join(workdir, name))
+        produced = os.path.join(workdir, 'public', 'data')
+        os.makedirs(produced)
+        peak = _run_child([sys.executable] + command, workdir)
+        for name in os.listdir(produced):
+            if name.endswith('.json'):
+                shutil.copy2(os.path.join(produced, name), os.path.join(output_dir, name))
+    return peak
+
+def _run_child(command, cwd):
+    """
+    자식 프로세스를 실행하고 그 프로세스의 최대 RSS(바이트) 반환
+    os.wait4의 rusage(ru_maxrss)는 기다린 자식 하나의 값이라
+    getrusage(RUSAGE_CHILDREN)처럼 앞서 실행한 변환기의 최대값이 섞이지 않음 (wait4가 없는 OS는 None)
+    """
+    if not hasattr(os, 'wait4'):
+        subprocess.run(command, cwd=cwd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return None
+    process = subprocess.Popen(command, cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    _, status, usage = os.wait4(process.pid, 0)
+    process.returncode = os.waitstatus_to_exitcode(status)
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, command)
+    # Linux는 KB, macOS는 바이트 단위
+    return usage.ru_maxrss * (1 if sys.platform == 'darwin' else 1024)
+
+def _script_runner(script):
+    def run(input_dir, output_dir):
+        return _run_in_workdir(input_dir, output_dir, [os.path.join(REPO_DIR, script)])
+    return run
+
+def _run_convert_excel_to_json(input_dir, output_dir):
+    # __main__에서 예외를 삼키므로 함수를 직접 호출해서 실패를 감지
+    code = (f"import sys; sys.path.insert(0, {REPO_DIR!r}); "
+            "from convert_excel_to_json import convert_excel_to_json; convert_excel_to_json()")
+    return _run_in_workdir(input_dir, output_dir, ['-c', code])
+
+# 이름 -> (입력 종류, 실행 함수, 같은 프로세스에서 실행 여부)
+# (별도 프로세스 실행 함수는 자식 프로세스의 최대 RSS(바이트)를 반환)
+ENGINES = {
+    'convert_new_data': ('csv', _run_convert_new_data, True),
+    'fast_convert': ('csv', _run_fast_convert, True),
+    'final_convert': ('xlsx_dir', _script_runner('final_convert.py'), False),
+    'convert_excel_to_json': ('xlsx_dir', _run_convert_excel_to_json, False),
+    'convert_to_json_v2': ('xlsx_dir', _script_runner('convert_to_json_v2.py'), False),
+}
+
+def run_engine(name, input_path, output_dir):
+    """
+    변환기 한 번 실행 (결과는 output_dir)
+
+    같은 프로세스 변환기는 추적 없이 한 번 실행해서 시간을 재고,
+    tracemalloc을 켜고 임시 폴더에 한 번 더 실행해서 메모리 최대값을 잽니다 (추적 오버헤드가 시간에 섞이지 않게).
+    별도 프로세스 변환기는 한 번 실행해서 시간과 자식 프로세스의 최대 RSS를 같이 잽니다.
+
+    Returns:
+        {'seconds', 'peak_mb'} (최대 RSS를 알 수 없는 OS면 peak_mb=None)
+    """
+    _, runner, in_process = ENGINES[name]
+    if not in_process:
+        started = time.perf_counter()
+        peak = runner(input_path, output_dir)
+        seconds = time.perf_counter() - started
+        return {'seconds': seconds, 'peak_mb': peak / 1024 / 1024 if peak is not None else None}
+
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        runner(input_path, output_dir)
+    seconds = time.perf_counter() - started
+
+    with tempfile.TemporaryDirectory(prefix=f'harness-{name}-traced-') as traced_dir:
+        tracemalloc.start()
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                runner(input_path, traced_dir)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return {'seconds': seconds, 'peak_mb': peak / 1024 / 1024}
+
+# ---------------------------------------------------------------------------
+# 출력 정규화
+# ---------------------------------------------------------------------------
+
+def load_output(output_dir):
+    """
+    변환 결과 폴더를 비교용 행 목록으로 읽기
+
+    Returns:
+        [(브랜드 ID, YYYYMM, 차원 튜플, 센트 금액)] (출력 순서 유지)
+    """
+    rows = []
+    for name in sorted(os.listdir(output_dir)):
+        path = os.path.join(output_dir, name)
+        match = PARTITION_PATTERN.match(name)
+        if match:
+            brand_id, yyyymm = match.groups()
+            with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+                for row in csv.DictReader(f):
+                    dims = (row['본부'], row['대분류'], row['중분류'], row['소분류'])
+                    rows.append((brand_id, row['년월'] or yyyymm, dims, parse_minor(row['금액'])))
+        elif name == 'cost_data.json':
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            for brand_id, records in data.items():
+                for record in records:
+                    yyyymm = str(record.get('연월', record.get('년월', ''))).replace('-', '')
+                    dims = tuple(f"{k}={v}" for k, v in sorted(record.items())
+                                 if k not in ('금액', '연월', '년월', '비고'))
+                    rows.append((brand_id, yyyymm, dims, parse_minor(record['금액'])))
+    return rows
+
+def compare_outputs(legacy_rows, candidate_rows, limit=20):
+    """
+    행 단위 비교 + 브랜드/월 합계 대사
+
+    Returns:
+        결과 dict (identical, 행 수, 순서 일치 여부, 누락/추가 행 예시, 합계 불일치)
+    """
+    from collections import Counter
+
+    legacy_counter = Counter(legacy_rows)
+    candidate_counter = Counter(candidate_rows)
+    only_legacy = list((legacy_counter - candidate_counter).elements())
+    only_candidate = list((candidate_counter - legacy_counter).elements())
+
+    def totals(rows):
+        result = {}
+        for brand_id, yyyymm, _, cents in rows:
+            result[(brand_id, yyyymm)] = result.get((brand_id, yyyymm), 0) + cents
+        return result
+
+    legacy_totals, candidate_totals = totals(legacy_rows), totals(candidate_rows)
+    total_mismatches = [
+        {'brand': b, 'month': m, 'legacy': legacy_totals.get((b, m), 0), 'candidate': candidate_totals.get((b, m), 0)}
+        for b, m in sorted(set(legacy_totals) | set(candidate_totals))
+        if legacy_totals.get((b, m), 0) != candidate_totals.get((b, m), 0)
+    ]
+
+    return {
+        'identical': not only_legacy and not only_candidate,
+        'same_order': legacy_rows == candidate_rows,
+        'legacy_rows': len(legacy_rows),
+        'candidate_rows': len(candidate_rows),
+        'only_legacy': [list(r[:2]) + list(r[2]) + [r[3]] for r in only_legacy[:limit]],
+        'only_candidate': [list(r[:2]) + list(r[2]) + [r[3]] for r in only_candidate[:limit]],
+        'only_legacy_count': len(only_legacy),
+        'only_candidate_count': len(only_candidate),
+        'partitions': len(legacy_totals),
+        'total_mismatches': total_mismatches,
+    }
+
+# ---------------------------------------------------------------------------
+# 테스트 데이터 생성
+# ---------------------------------------------------------------------------
+
+def generate_pivot_csv(path, rows, year=2025, months=10, density=0.3, seed=0):
+    """
+    재유니 피벗 CSV와 같은 형식의 데이터 생성 (대부분 0, 쉼표 포함 금액)
+    """
+    rng = random.Random(seed)
+    brands = ['MLB', 'KIDS', 'DX', '공통']
+    depts = ['MD', 'VMD', '마케팅', '영업', '총무', '재무', 'IT', 'Business Development']
+    categories = {
+        '인건비': ['급여,성과급'], '복리후생비': ['공적금', '사회보험'], '광고비': ['마케팅', '샘플사용'],
+        '출장비': ['국내출장비', '해외출장비'], '감가상각비': ['비품', '시설'],
+    }
+    category3 = 'Cost Elem desc' if year >= 2025 else '소분류'
+    header = ['사업부(조정)', '부서명', '대분류', '중분류', category3] + \
+             [f'합계 : {year}{m:02d}' for m in range(1, months + 1)]
+
+    with open(path, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        for i in range(rows):
+            category1 = rng.choice(list(categories))
+            category2 = rng.choice(categories[category1])
+            values = []
+            for _ in range(months):
+                if rng.random() < density:
+                    amount = rng.uniform(-5000, 500000)
+                    values.append(f"{amount:,.2f}")
+                else:
+                    values.append('0')
+            writer.writerow([rng.choice(brands), rng.choice(depts), category1, category2,
+                             f'{category1}_{category2}_{i % 50}'] + values)
+
+# ---------------------------------------------------------------------------
+# 실행
+# ---------------------------------------------------------------------------
+
+def run_comparison(legacy, candidate, input_path, repeat=1):
+    """
+    두 변환기를 같은 입력으로 repeat번 실행하고 비교
+
+    Returns:
+        보고서 dict
+    """
+    if ENGINES[legacy][0] != ENGINES[candidate][0]:
+        raise ValueError(f"입력 형식이 다른 변환기는 비교할 수 없습니다: {legacy}, {candidate}")
+
+    for name in (legacy, candidate):
+        if ENGINES[name][2]:
+            importlib.import_module(name)   # import 시간은 측정에서 제외
+
+    timings = {legacy: [], candidate: []}
+    outputs = {}
+    for _ in range(repeat):
+        for name in (legacy, candidate):
+            output_dir = tempfile.mkdtemp(prefix=f'harness-{name}-')
+            try:
+                timings[name].append(run_engine(name, input_path, output_dir))
+                outputs[name] = load_output(output_dir)
+            finally:
+                shutil.rmtree(output_dir, ignore_errors=True)
+
+    def best(name, key):
+        values = [t[key] for t in timings[name] if t[key] is not None]
+        return min(values) if values else None
+
+    report = {
+        'input': input_path,
+        'legacy': legacy,
+        'candidate': candidate,
+        'repeat': repeat,
+        'legacy_seconds': best(legacy, 'seconds'),
+        'candidate_seconds': best(candidate, 'seconds'),
+        'legacy_peak_mb': best(legacy, 'peak_mb'),
+        'candidate_peak_mb': best(candidate, 'peak_mb'),
+    }
+    report['speedup'] = report['legacy_seconds'] / report['candidate_seconds'] if report['candidate_seconds'] else None
+    if report['legacy_peak_mb'] and report['candidate_peak_mb']:
+        report['memory_ratio'] = report['candidate_peak_mb'] / report['legacy_peak_mb']
+    else:
+        report['memory_ratio'] = None
+    report.update(compare_outputs(outputs[legacy], outputs[candidate]))
+    return report
+
+def print_report(report):
+    """보고서 출력"""
+    status = '✅ 동일' if report['identical'] else '❌ 불일치'
+    print(f"\n📂 {report['input']}: {report['legacy']} vs {report['candidate']} → {status}")
+    print(f"   행 수: {report['legacy_rows']:,} / {report['candidate_rows']:,} "
+          f"(순서 {'일치' if report['same_order'] else '다름'}), 파티션 {report['partitions']}개")
+    print(f"   시간: {report['legacy_seconds']:.3f}초 / {report['candidate_seconds']:.3f}초"
+          + (f" (속도 {report['speedup']:.1f}배)" if report['speedup'] else ''))
+    if report['memory_ratio'] is not None:
+        print(f"   메모리 최대: {report['legacy_peak_mb']:.1f}MB / {report['candidate_peak_mb']:.1f}MB "
+              f"(비율 {report['memory_ratio']:.2f})")
+    if not report['identical']:
+        print(f"   legacy에만 있는 행 {report['only_legacy_count']}개, "
+              f"candidate에만 있는 행 {report['only_candidate_count']}개")
+        for row in report['only_legacy'][:5]:
+            print(f"     - {row}")
+        for row in report['only_candidate'][:5]:
+            print(f"     + {row}")
+    for mismatch in report['total_mismatches'][:10]:
+        print(f"   ⚠️  합계 불일치 {mismatch['brand']} {mismatch['month']}: "
+              f"{mismatch['legacy'] / 100:,.2f} / {mismatch['candidate'] / 100:,.2f}")
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='변환기 동등성/성능 비교')
+    parser.add_argument('--legacy', default='convert_new_data', choices=sorted(ENGINES))
+    parser.add_argument('--candidate', default='fast_convert', choices=sorted(ENGINES))
+    parser.add_argument('--input', action='append', help='입력 파일 (엑셀 변환기는 XLSX가 있는 폴더)')
+    parser.add_argument('--generate', type=int, metavar='ROWS', help='ROWS행짜리 피벗 CSV를 생성해서 비교')
+    parser.add_argument('--repeat', type=int, default=1, help='반복 횟수 (가장 빠른 결과 사용)')
+    parser.add_argument('-o', '--output', help='보고서 JSON 저장 경로')
+    args = parser.parse_args()
+
+    sys.path.insert(0, REPO_DIR)
+
+    temp_dir = None
+    inputs = args.input or []
+    if args.generate:
+        temp_dir = tempfile.mkdtemp(prefix='harness-input-')
+        path = os.path.join(temp_dir, '2025.csv')
+        generate_pivot_csv(path, args.generate)
+        inputs.append(path)
+    if not inputs:
+        inputs = [p for p in ('재유니/2024.csv', '재유니/2025.csv') if os.path.exists(p)]
+
+    try:
+        reports = [run_comparison(args.legacy, args.candidate, path, args.repeat) for path in inputs]
+    finally:
+        if temp_dir:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    for report in reports:
+        print_report(report)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(reports, f, ensure_ascii=False, indent=2)
+        print(f"\n📁 보고서 저장: {args.output}")
+
+    if not all(r['identical'] and not r['total_mismatches'] for r in reports):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,9 @@ import pandas as pd
 import os
 from datetime import datetime
 
+from amounts import format_minor, minor_to_float, parse_minor
+from fx_normalize import REPORTING_AMOUNT_COL, REPORTING_CURRENCY, load_fx_rates, normalize_currency
+
 # 파일 경로 설정
 INPUT_DIR = r"d:\OneDrive - F&F\바탕 화면\hmcursor"
 OUTPUT_DIR = r"C:\Users\AD0815\cost-dashboard\public\data"
@@ -16,17 +19,16 @@ FILE_2025 = "2025.1-10.XLSX"
 # 출력 디렉토리 생성
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
-def clean_amount(value):
-    """금액 데이터 정제 (쉼표 제거 및 숫자 변환)"""
-    if pd.isna(value) or value == 0:
-        return 0
-    if isinstance(value, str):
-        # 쉼표 제거
-        value = value.replace(',', '')
-    try:
-        return float(value)
-    except:
-        return 0
+AMOUNT_COLUMNS = ['금액', REPORTING_AMOUNT_COL]
+
+def to_csv_frame(df):
+    """
+    CSV 저장용 복사본 (최소 단위 정수 금액을 소수 둘째 자리 문자열로, 환율이 없는 행은 빈 칸)
+    """
+    out = df.copy()
+    for col in AMOUNT_COLUMNS:
+        out[col] = [format_minor(v) if pd.notna(v) else '' for v in out[col]]
+    return out
 
 def process_excel_file(file_path, sheet_name, year):
     """엑셀 파일을 읽어서 월별로 분리하여 정제"""
@@ -53,7 +55,12 @@ def process_excel_file(file_path, sheet_name, year):
     
     print(f"✓ 발견된 월별 컬럼: {month_columns}")
     
-    # 각 월별로 데이터 변환
+    # 환율표 (실행 중 한 번만 읽고 캐시)
+    fx_rates = load_fx_rates()
+    if fx_rates is None:
+        print(f"⚠️  환율표가 없어 {REPORTING_CURRENCY} 이외 통화는 환산하지 않습니다.")
+    
+    # 각 월별로 데이터 변환 (환산은 월을 모두 모은 뒤 한 번에)
     monthly_data = []
     
     for month_col in month_columns:
@@ -73,8 +80,8 @@ def process_excel_file(file_path, sheet_name, year):
                            '금액', '통화', '사용여부', '영업비구분', '사업부', '본부', 
                            '대분류', '팀']
         
-        # 금액 정제
-        month_df['금액'] = month_df['금액'].apply(clean_amount)
+        # 금액 정제 (최소 단위 정수, 쉼표 제거/변환 실패는 0)
+        month_df['금액'] = month_df['금액'].map(parse_minor)
         
         # 사용여부가 '사용'인 데이터만 필터링
         month_df = month_df[month_df['사용여부'] == '사용'].copy()
@@ -87,25 +94,32 @@ def process_excel_file(file_path, sheet_name, year):
         month_df['년'] = year_str
         month_df['월'] = month_str
         
-        # 불필요한 컬럼 제거
-        month_df = month_df.drop(['코스트센터', '계정과목코드', '통화', '사용여부'], axis=1)
-        
-        # 컬럼 순서 재정렬
-        month_df = month_df[['년월', '년', '월', '법인', '본부', '팀', '계정과목', 
-                            '금액', '영업비구분', '사업부', '대분류']]
-        
-        print(f"  ✓ 정제 완료: {len(month_df)}행")
-        
-        # 월별 파일로 저장
-        output_file = os.path.join(OUTPUT_DIR, f"cost_{year_month}.csv")
-        month_df.to_csv(output_file, index=False, encoding='utf-8-sig')
-        print(f"  ✓ 저장 완료: {output_file}")
-        
         monthly_data.append(month_df)
     
     # 전체 데이터 통합
     all_data = pd.concat(monthly_data, ignore_index=True)
     
+    # 보고 통화 금액 계산 (파일 전체를 통화/월 기준 환율 as-of merge 한 번으로)
+    all_data = normalize_currency(all_data, rates=fx_rates)
+    # 환산 금액도 최소 단위 정수로 반올림 (통화가 없거나 환율이 없으면 결측)
+    all_data[REPORTING_AMOUNT_COL] = all_data[REPORTING_AMOUNT_COL].round().astype('Int64')
+    
+    # 불필요한 컬럼 제거
+    all_data = all_data.drop(['코스트센터', '계정과목코드', '사용여부'], axis=1)
+    
+    # 컬럼 순서 재정렬
+    all_data = all_data[['년월', '년', '월', '법인', '본부', '팀', '계정과목', 
+                         '금액', '통화', REPORTING_AMOUNT_COL, '영업비구분', '사업부', '대분류']]
+    
+    # 월별 파일로 저장
+    by_month = dict(tuple(all_data.groupby('년월', sort=False)))
+    for month_col in month_columns:
+        year_month = str(month_col)
+        month_df = by_month.get(f"{year_month[:4]}-{year_month[4:6]}", all_data.iloc[0:0])
+        output_file = os.path.join(OUTPUT_DIR, f"cost_{year_month}.csv")
+        to_csv_frame(month_df).to_csv(output_file, index=False, encoding='utf-8-sig')
+        print(f"  ✓ {year_month} 정제 완료: {len(month_df)}행 → {output_file}")
+    
     return all_data, len(month_columns)
 
 def generate_summary(all_data):
@@ -130,12 +144,27 @@ def generate_summary(all_data):
         print(f"  ... 외 {len(all_data['본부'].unique()) - 10}개")
     
     print(f"\n계정과목 목록 ({len(all_data['계정과목'].unique())}개):")
-    top_accounts = all_data.groupby('계정과목')['금액'].sum().sort_values(ascending=False).head(10)
+    top_accounts = all_data.groupby('계정과목')[REPORTING_AMOUNT_COL].sum().sort_values(ascending=False).head(10)
     for account, amount in top_accounts.items():
-        print(f"  - {account}: ₩{amount:,.0f}")
-    
-    print(f"\n총 비용: ₩{all_data['금액'].sum():,.0f}")
-    print(f"평균 월별 비용: ₩{all_data.groupby('년월')['금액'].sum().mean():,.0f}")
+        print(f"  - {account}: {minor_to_float(amount):,.0f} {REPORTING_CURRENCY}")
+    
+    print(f"\n통화별 원금액:")
+    for currency, amount in all_data.groupby('통화')['금액'].sum().items():
+        print(f"  - {currency or '(통화 없음)'}: {minor_to_float(amount):,.0f}")
+    
+    # 통화가 없거나 환율이 없어 환산하지 못한 행은 보고 통화 합계에서 빠짐
+    unconverted = all_data[all_data[REPORTING_AMOUNT_COL].isna()]
+    if len(unconverted):
+        no_currency = int((unconverted['통화'] == '').sum())
+        print(f"\n⚠️  {REPORTING_CURRENCY} 환산 제외: {len(unconverted):,}행 "
+              f"(통화 없음 {no_currency:,}행, 환율 없음 {len(unconverted) - no_currency:,}행)")
+        for currency, amount in unconverted.groupby('통화')['금액'].sum().items():
+            print(f"  - {currency or '(통화 없음)'}: {minor_to_float(amount):,.0f}")
+        print("  아래 총 비용/평균 월별 비용과 위 계정과목 합계에는 포함되지 않았습니다.")
+    
+    print(f"\n총 비용: {minor_to_float(all_data[REPORTING_AMOUNT_COL].sum()):,.0f} {REPORTING_CURRENCY}")
+    monthly = all_data.groupby('년월')[REPORTING_AMOUNT_COL].sum()
+    print(f"평균 월별 비용: {minor_to_float(monthly.mean()):,.0f} {REPORTING_CURRENCY}")
 
 def main():
     """메인 실행 함수"""
@@ -170,7 +199,7 @@ def main():
         
         # 통합 파일 저장
         output_all = os.path.join(OUTPUT_DIR, "cost_all.csv")
-        all_data.to_csv(output_all, index=False, encoding='utf-8-sig')
+        to_csv_frame(all_data).to_csv(output_all, index=False, encoding='utf-8-sig')
         print(f"\n✓ 통합 파일 저장 완료: {output_all}")
         
         # 요약 정보 출력
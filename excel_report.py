@@ -0,0 +1,206 @@
+"""
+브랜드별 비용 리포트 엑셀 생성
+public/data 파티션을 브랜드별 워크북으로 내보냅니다.
+openpyxl write-only 모드로 행을 바로 디스크에 쓰므로 리포트가 커져도 메모리가 늘지 않습니다.
+(메모리에는 대분류/중분류/소분류 × 월 합계만 보관)
+
+시트:
+    월별     대분류/중분류/소분류 × 월 피벗 + 합계 (대분류 소계, 총계 포함)
+    전년대비  최신 연도 누계 vs 전년 동기 누계, 증감, 증감률
+    누계     연도별 1월부터의 누적 금액
+
+출력: reports/{brand}_비용리포트.xlsx
+
+사용법:
+    python excel_report.py                      # 전체 브랜드, 전체 연도
+    python excel_report.py --brands mlb kids --years 2025
+"""
+
+import argparse
+import os
+import time
+
+from amounts import minor_to_float, parse_minor
+from cost_facts import DATA_DIR, list_partitions, read_partition
+
+REPORT_DIR = 'reports'
+KEY_COLUMNS = ['대분류', '중분류', '소분류']
+NUMBER_FORMAT = '#,##0.00'
+PERCENT_FORMAT = '0.0%'
+
+def aggregate_brand(partitions):
+    """
+    브랜드 파티션들을 {(대분류, 중분류, 소분류): {YYYYMM: 최소 단위 합계}}로 집계
+
+    Returns:
+        (월 목록, 집계 dict)
+    """
+    months, series = set(), {}
+    for _, yyyymm, path in partitions:
+        months.add(yyyymm)
+        for row in read_partition(path):
+            key = tuple(row[col] for col in KEY_COLUMNS)
+            amounts = series.setdefault(key, {})
+            amounts[yyyymm] = amounts.get(yyyymm, 0) + parse_minor(row['금액'])
+    return sorted(months), series
+
+def _grouped(series):
+    """대분류별로 묶은 (대분류, [(키, 월별 금액)]) 목록 (키 순 정렬)"""
+    groups = {}
+    for key in sorted(series):
+        groups.setdefault(key[0], []).append((key, series[key]))
+    return groups.items()
+
+class _SheetWriter:
+    """write-only 시트에 서식 있는 행을 쓰는 도우미"""
+
+    def __init__(self, wb, title, header):
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Font, PatternFill
+
+        self._cell = WriteOnlyCell
+        self.ws = wb.create_sheet(title)
+        self.ws.freeze_panes = 'D2'
+        self.bold = Font(bold=True)
+        self.subtotal_fill = PatternFill('solid', fgColor='EEF2F7')
+        self.total_fill = PatternFill('solid', fgColor='D9E1F2')
+        self.row([*header], style='header')
+
+    def row(self, values, style=None, formats=None):
+        cells = []
+        for i, value in enumerate(values):
+            cell = self._cell(self.ws, value=value)
+            if isinstance(value, (int, float)):
+                cell.number_format = (formats or {}).get(i, NUMBER_FORMAT)
+            if style:
+                cell.font = self.bold
+                if style == 'subtotal':
+                    cell.fill = self.subtotal_fill
+                elif style == 'total':
+                    cell.fill = self.total_fill
+            cells.append(cell)
+        self.ws.append(cells)
+
+def write_monthly_sheet(wb, months, series):
+    """월별 피벗 시트"""
+    sheet = _SheetWriter(wb, '월별', KEY_COLUMNS + months + ['합계'])
+    grand = [0] * len(months)
+    for category1, items in _grouped(series):
+        subtotal = [0] * len(months)
+        for key, amounts in items:
+            values = [amounts.get(m, 0) for m in months]
+            subtotal = [a + b for a, b in zip(subtotal, values)]
+            sheet.row([*key, *map(minor_to_float, values), minor_to_float(sum(values))])
+        grand = [a + b for a, b in zip(grand, subtotal)]
+        sheet.row([f'{category1} 소계', '', '', *map(minor_to_float, subtotal), minor_to_float(sum(subtotal))], 'subtotal')
+    sheet.row(['총계', '', '', *map(minor_to_float, grand), minor_to_float(sum(grand))], 'total')
+
+def write_yoy_sheet(wb, months, series):
+    """최신 연도 누계 vs 전년 동기 누계 시트 (전년 데이터가 없으면 생략)"""
+    latest = months[-1][:4]
+    prev = str(int(latest) - 1)
+    latest_months = [m for m in months if m.startswith(latest)]
+    prev_months = [prev + m[4:] for m in latest_months]
+    if not any(m in months for m in prev_months):
+        return False
+
+    header = KEY_COLUMNS + [f'{prev} 동기', f'{latest} 누계', '증감', '증감률']
+    sheet = _SheetWriter(wb, '전년대비', header)
+    percent = {6: PERCENT_FORMAT}
+
+    def values(before, after):
+        rate = (after - before) / abs(before) if before else None
+        return [minor_to_float(before), minor_to_float(after), minor_to_float(after - before), rate]
+
+    grand_before = grand_after = 0
+    for category1, items in _grouped(series):
+        sub_before = sub_after = 0
+        for key, amounts in items:
+            before = sum(amounts.get(m, 0) for m in prev_months)
+            after = sum(amounts.get(m, 0) for m in latest_months)
+            sub_before, sub_after = sub_before + before, sub_after + after
+            sheet.row([*key, *values(before, after)], formats=percent)
+        grand_before, grand_after = grand_before + sub_before, grand_after + sub_after
+        sheet.row([f'{category1} 소계', '', '', *values(sub_before, sub_after)], 'subtotal', percent)
+    sheet.row(['총계', '', '', *values(grand_before, grand_after)], 'total', percent)
+    return True
+
+def _ytd(values, months):
+    """연도가 바뀌면 0부터 다시 누적"""
+    running, year, result = 0, None, []
+    for month, value in zip(months, values):
+        if month[:4] != year:
+            running, year = 0, month[:4]
+        running += value
+        result.append(running)
+    return result
+
+def write_ytd_sheet(wb, months, series):
+    """연도별 누계 시트"""
+    sheet = _SheetWriter(wb, '누계', KEY_COLUMNS + months)
+    grand = [0] * len(months)
+    for category1, items in _grouped(series):
+        subtotal = [0] * len(months)
+        for key, amounts in items:
+            values = [amounts.get(m, 0) for m in months]
+            subtotal = [a + b for a, b in zip(subtotal, values)]
+            sheet.row([*key, *map(minor_to_float, _ytd(values, months))])
+        grand = [a + b for a, b in zip(grand, subtotal)]
+        sheet.row([f'{category1} 소계', '', '', *map(minor_to_float, _ytd(subtotal, months))], 'subtotal')
+    sheet.row(['총계', '', '', *map(minor_to_float, _ytd(grand, months))], 'total')
+
+def write_brand_pack(brand_id, partitions, output_dir=REPORT_DIR):
+    """
+    브랜드 워크북 하나 저장
+
+    Returns:
+        저장한 파일 경로 (데이터가 없으면 None)
+    """
+    from openpyxl import Workbook
+
+    months, series = aggregate_brand(partitions)
+    if not series:
+        return None
+
+    wb = Workbook(write_only=True)
+    write_monthly_sheet(wb, months, series)
+    write_yoy_sheet(wb, months, series)
+    write_ytd_sheet(wb, months, series)
+
+    os.makedirs(output_dir, exist_ok=True)
+    output_file = os.path.join(output_dir, f'{brand_id}_비용리포트.xlsx')
+    wb.save(output_file)
+    return output_file
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='브랜드별 비용 리포트 엑셀 생성')
+    parser.add_argument('--brands', nargs='*', help='브랜드 파일 ID (예: mlb kids, 없으면 전체)')
+    parser.add_argument('--years', nargs='*', help='포함할 연도 (없으면 전체)')
+    parser.add_argument('--data-dir', default=DATA_DIR)
+    parser.add_argument('--output-dir', default=REPORT_DIR)
+    args = parser.parse_args()
+
+    print("\n" + "="*70)
+    print("📗 브랜드별 비용 리포트 생성")
+    print("="*70)
+
+    started = time.perf_counter()
+    by_brand = {}
+    for partition in list_partitions(args.data_dir, args.brands):
+        if args.years and partition[1][:4] not in args.years:
+            continue
+        by_brand.setdefault(partition[0], []).append(partition)
+
+    if not by_brand:
+        print("❌ 처리할 데이터가 없습니다.")
+        return
+
+    for brand_id, partitions in by_brand.items():
+        output_file = write_brand_pack(brand_id, partitions, args.output_dir)
+        if output_file:
+            print(f"   ✅ {output_file} ({os.path.getsize(output_file) / 1024:.0f}KB)")
+    print(f"\n⏱️  {time.perf_counter() - started:.2f}초")
+
+if __name__ == "__main__":
+    main()
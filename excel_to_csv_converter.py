@@ -1,18 +1,23 @@
 """
 엑셀 파일을 브랜드별 CSV로 변환하는 스크립트
 2024.1-12.XLSX, 2025.1-10.XLSX 파일을 처리
+
+사용법:
+    python excel_to_csv_converter.py [--workers N]   # N개 프로세스로 시트를 나눠 읽기
 """
 
-import pandas as pd
 import os
 from pathlib import Path
 import sys
 
-def convert_excel_to_csv():
+from dimensions import BRANDS, resolve_brand
+from publish_data import staged_output
+from workbook_reader import read_workbook, workers_option
+
+def convert_excel_to_csv(output_dir='public/data', workers=None):
     """엑셀 파일을 CSV로 변환"""
     
     # 출력 디렉토리
-    output_dir = 'public/data'
     Path(output_dir).mkdir(parents=True, exist_ok=True)
     
     # 엑셀 파일 목록
@@ -34,14 +39,13 @@ def convert_excel_to_csv():
         print("-" * 70)
         
         try:
-            # 엑셀 파일 읽기
-            xls = pd.ExcelFile(excel_file)
-            print(f"   시트 목록: {xls.sheet_names}\n")
+            # 엑셀 파일 읽기 (한 번 열어서 모든 시트 파싱)
+            sheets = read_workbook(excel_file, workers=workers)
+            print(f"   시트 목록: {list(sheets)}\n")
             
             # 각 시트 처리
-            for sheet_name in xls.sheet_names:
+            for sheet_name, df in sheets.items():
                 print(f"\n   📄 시트: {sheet_name}")
-                df = pd.read_excel(excel_file, sheet_name=sheet_name)
                 
                 print(f"      - 행 수: {len(df)}")
                 print(f"      - 컬럼: {list(df.columns)[:5]}...")  # 처음 5개만
@@ -76,21 +80,11 @@ def convert_excel_to_csv():
                         month_col = col
                         break
                 
-                # 브랜드별로 분리
-                brand_mapping = {
-                    'MLB': 'mlb',
-                    'MLB Kids': 'mlb-kids',
-                    'MLB KIDS': 'mlb-kids',
-                    'Discovery': 'discovery',
-                    '공통': 'common',
-                }
+                # 브랜드별로 분리 (별칭/대소문자는 dimensions.resolve_brand로 통일)
+                resolved = df[brand_col].map(resolve_brand)
                 
-                for brand_name, brand_id in brand_mapping.items():
-                    # 브랜드 필터링 (대소문자 구분 없이)
-                    brand_mask = df[brand_col].astype(str).str.contains(
-                        brand_name, case=False, na=False
-                    )
-                    brand_data = df[brand_mask].copy()
+                for file_id, (_, brand_id, brand_name, _) in BRANDS.items():
+                    brand_data = df[resolved == file_id].copy()
                     
                     if len(brand_data) == 0:
                         continue
@@ -127,11 +121,13 @@ def convert_excel_to_csv():
     print("\n" + "="*70)
     print("✅ 변환 완료!")
     print("="*70)
-    print(f"\n📁 생성된 CSV 파일은 '{output_dir}' 폴더에 저장되었습니다.\n")
+    print(f"\n📁 생성된 CSV 파일은 'public/data' 폴더에 배포됩니다.\n")
 
 if __name__ == "__main__":
     try:
-        convert_excel_to_csv()
+        # 빌드 디렉토리에 쓴 뒤 public/data를 한 번에 교체 (publish_data)
+        with staged_output('public/data', snapshot=False) as output_dir:
+            convert_excel_to_csv(output_dir, workers_option(sys.argv))
     except KeyboardInterrupt:
         print("\n\n중단되었습니다.")
         sys.exit(0)
@@ -1,10 +1,13 @@
 /**
  * MLB 중국본사 영업비 데이터 추출
  * 필터: 영업비구분="중국본사", 사업부="MLB"
+ * 저장 후 python json_shards.py 로 브랜드 × 연도 샤드도 다시 생성
+ * (실패하면 /api/mlb-data 가 manifest의 원본 해시를 보고 전체 파일로 대체)
  */
 
 const XLSX = require('xlsx');
 const fs = require('fs');
+const { execFileSync } = require('child_process');
 
 console.log('='.repeat(80));
 console.log('MLB 중국본사 영업비 데이터 추출 시작');
@@ -86,7 +89,16 @@ try {
 
   // JSON 저장
   const outputFile = 'public/data/mlb_china_data.json';
-  fs.writeFileSync(outputFile, JSON.stringify(mlbData, null, 2), 'utf-8');
+  // 배포된 파일은 이전 릴리스와 하드링크를 공유하므로 임시 파일 후 교체 (publish_data.py)
+  fs.writeFileSync(`${outputFile}.tmp`, JSON.stringify(mlbData, null, 2), 'utf-8');
+  fs.renameSync(`${outputFile}.tmp`, outputFile);
+
+  // 샤드 갱신 (json_shards.py)
+  try {
+    execFileSync(process.env.PYTHON || 'python', ['json_shards.py', outputFile], { stdio: 'inherit' });
+  } catch (error) {
+    console.warn(`⚠️  샤드 갱신 실패 (API는 전체 파일 사용): ${error.message}`);
+  }
 
   console.log(`\n${'='.repeat(80)}`);
   console.log(`✅ 완료!`);
@@ -0,0 +1,361 @@
+"""
+재유니 CSV → 브랜드별 월별 CSV 경량 변환 스크립트
+convert_new_data.py와 같은 cost_{brand}_{yyyymm}.csv를 만들지만
+표준 라이브러리(csv)만 사용하므로 pandas import 없이 바로 시작합니다.
+금액은 최소 단위 정수(amounts.parse_minor)로 읽고 소수 둘째 자리로 씁니다.
+엑셀(.xlsx) 입력일 때만 openpyxl을 필요한 시점에 import 합니다.
+명령줄 실행은 빌드 디렉토리에 쓴 뒤 publish_data로 public/data를 한 번에 교체합니다.
+.gz / .zst / .zip 입력은 임시 파일 없이 풀면서 읽습니다 (input_streams).
+변환하면서 같은 루프에서 누적한 월별 원천 합계와 총합계 행, 출력 합계를 대사하고,
+허용 오차를 넘거나 금액으로 읽을 수 없는 칸이 있으면 파일을 쓰기 전에 ReconciliationError로 중단합니다.
+
+사용법:
+    python fast_convert.py                       # 재유니/2024.csv, 재유니/2025.csv 변환
+    python fast_convert.py 재유니/2025.csv        # 지정한 파일만 변환
+    python fast_convert.py 2025.1-10.XLSX --sheet 2025년
+    python fast_convert.py 재유니/2025.csv.gz exports.zip::2024.csv
+    python fast_convert.py 큰파일.csv --workers 4   # 파일 하나를 행 범위로 나눠 병렬 변환 (chunk_parallel)
+"""
+
+import csv
+import io
+import os
+import re
+import sys
+import time
+
+import input_streams
+from amounts import NA_VALUES, format_minor, parse_minor, try_parse_minor
+from dimensions import SOURCE_COLUMNS, brand_file_id, brand_label, source_column
+from publish_data import staged_output
+
+OUTPUT_DIR = 'public/data'
+
+# 사업부 컬럼: 재유니 CSV는 '사업부(조정)', 원본 엑셀은 '사업부'
+BRAND_COLUMNS = SOURCE_COLUMNS['브랜드']
+DEPT_COL = '부서명'
+CATEGORY1_COL = '대분류'
+CATEGORY2_COL = '중분류'
+
+OUTPUT_COLUMNS = ['브랜드', '본부', '팀', '대분류', '중분류', '소분류', '계정과목', '금액', '년월', '비고']
+
+MONTH_PATTERN = re.compile(r'(20\d{2}(?:0[1-9]|1[0-2]))')   # YYYYMM (연도 제한 없음)
+
+GRAND_TOTAL_LABEL = '총합계'
+# 대사 허용 오차: max(절대 허용(최소 단위), 원천 합계 × 상대 허용)
+RECONCILE_ABS_TOLERANCE = 100
+RECONCILE_REL_TOLERANCE = 1e-6
+
+class ReconciliationError(Exception):
+    """원천 합계와 출력 파티션 합계가 허용 오차를 넘게 다르거나 금액 변환 실패 칸이 있을 때 발생
+    (report: 불일치 월 목록)"""
+
+    def __init__(self, report):
+        self.report = report
+        super().__init__("원천/출력 합계 불일치\n" + format_reconciliation(report))
+
+def partition_filename(brand, yyyymm):
+    """
+    브랜드/월 파티션의 출력 파일명 (예: cost_mlb_202401.csv)
+    """
+    return f"cost_{brand_file_id(brand)}_{yyyymm}.csv"
+
+def is_missing(value):
+    """pandas 결측값 규칙과 같은 판정"""
+    if value is None:
+        return True
+    if isinstance(value, float):
+        return value != value
+    return isinstance(value, str) and value in NA_VALUES
+
+def find_month_columns(columns):
+    """
+    월 컬럼 찾기 (예: "합계 : 202401", "202401")
+    """
+    return [col for col in columns if '합계 :' in str(col) or MONTH_PATTERN.search(str(col))]
+
+def read_csv_rows(path):
+    """
+    CSV를 (헤더, 행 목록)으로 읽기 (utf-8 → cp949 → euc-kr 순서로 시도)
+    """
+    for encoding in ('utf-8-sig', 'cp949', 'euc-kr'):
+        try:
+            with input_streams.open_text(path, encoding) as f:
+                reader = csv.reader(f)
+                header = next(reader, [])
+                return header, list(reader)
+        except UnicodeDecodeError:
+            continue
+    raise ValueError(f"인코딩을 알 수 없습니다: {path}")
+
+def read_excel_rows(path, sheet=None):
+    """
+    엑셀 시트를 (헤더, 행 목록)으로 읽기 (openpyxl은 이때만 import)
+    """
+    from openpyxl import load_workbook
+
+    source = input_streams.open_seekable(path) if input_streams.compression_of(path) else path
+    wb = load_workbook(source, read_only=True, data_only=True)
+    try:
+        ws = wb[sheet] if sheet else wb.worksheets[0]
+        rows = ws.iter_rows(values_only=True)
+        header = ['' if col is None else str(col).strip() for col in next(rows, ())]
+        return header, [list(row) for row in rows]
+    finally:
+        wb.close()
+        if source is not path:
+            source.close()
+
+def read_rows(path, sheet=None):
+    """
+    입력 형식에 맞게 (헤더, 행 목록) 읽기 (압축 입력은 압축 안의 파일 이름으로 판단)
+    """
+    if input_streams.inner_name(path).lower().endswith(('.xlsx', '.xlsm')):
+        return read_excel_rows(path, sheet)
+    return read_csv_rows(path)
+
+def _cell_text(value):
+    """출력용 문자열 (결측값은 빈 칸)"""
+    if is_missing(value):
+        return ''
+    return value if isinstance(value, str) else str(value)
+
+def format_reconciliation(report):
+    """대사 결과를 짧은 표로"""
+    lines = [f"   {'년월':<8}{'원천 행 합계':>20}{'총합계 행':>20}{'출력 합계':>20}{'차이':>14}"]
+    for item in report:
+        grand = '' if item['grand_total'] is None else format_minor(item['grand_total'])
+        lines.append(f"   {item['yyyymm']:<8}{format_minor(item['source']):>20}{grand:>20}"
+                     f"{format_minor(item['output']):>20}{format_minor(item['diff']):>14}  {item['reason']}")
+    return "\n".join(lines)
+
+def empty_month_totals():
+    """월 하나의 원천 합계 {'source', 'grand_total'(없으면 None), 'invalid'} (최소 단위 정수)"""
+    return {'source': 0, 'grand_total': None, 'invalid': 0}
+
+def tally_source(month, cell, is_grand):
+    """
+    원천 칸 하나를 월 합계에 반영 (변환 루프가 칸을 읽을 때 같이 호출, 다시 읽지 않음)
+    사업부가 비어 있는 행도 원천 합계에 포함, 총합계 행은 따로 보관, 금액으로 읽을 수 없는 칸은 개수만 셈
+
+    Args:
+        month: empty_month_totals() 형식 dict (갱신됨)
+
+    Returns:
+        금액(최소 단위 정수) (변환 실패 칸이나 총합계 행이면 None)
+    """
+    value = try_parse_minor(cell)
+    if value is None:
+        month['invalid'] += 1
+    elif is_grand:
+        month['grand_total'] = value
+        return None
+    else:
+        month['source'] += value
+    return value
+
+def merge_source_totals(parts):
+    """
+    행 범위별 원천 월별 합계 합치기 (chunk_parallel)
+    """
+    merged = {}
+    for part in parts:
+        for yyyymm, totals in part.items():
+            month = merged.setdefault(yyyymm, empty_month_totals())
+            month['source'] += totals['source']
+            month['invalid'] += totals['invalid']
+            if totals['grand_total'] is not None:
+                month['grand_total'] = totals['grand_total']
+    return merged
+
+def reconcile(month_totals, abs_tolerance=RECONCILE_ABS_TOLERANCE, rel_tolerance=RECONCILE_REL_TOLERANCE):
+    """
+    월별 원천 합계 / 총합계 행 / 출력 파티션 합계 비교
+
+    Args:
+        month_totals: {YYYYMM: {'source', 'grand_total'(없으면 None), 'output', 'invalid'(선택)}}
+                      (최소 단위 정수)
+
+    Returns:
+        (불일치 목록, 허용 오차 안의 차이 목록)
+    """
+    mismatches, within = [], []
+    for yyyymm, totals in month_totals.items():
+        tolerance = max(abs_tolerance, abs(totals['source']) * rel_tolerance)
+        if totals.get('invalid'):
+            mismatches.append(dict(totals, yyyymm=yyyymm, diff=0,
+                                   reason=f"금액 변환 실패 {totals['invalid']}칸"))
+        checks = [('출력 ≠ 원천 행', totals['output'] - totals['source'])]
+        if totals['grand_total'] is not None:
+            checks.append(('원천 행 ≠ 총합계', totals['source'] - totals['grand_total']))
+        for reason, diff in checks:
+            if diff == 0:
+                continue
+            item = dict(totals, yyyymm=yyyymm, diff=diff, reason=reason)
+            (mismatches if abs(diff) > tolerance else within).append(item)
+    return mismatches, within
+
+def check_totals(source, output, verbose=True):
+    """
+    월별 원천 합계와 출력 합계를 대사하고 불일치가 있으면 예외
+
+    Args:
+        source: {YYYYMM: empty_month_totals() 형식} (변환 루프에서 tally_source로 누적)
+        output: {YYYYMM: 출력 합계} (변환 루프에서 기록할 금액을 누적)
+
+    Raises:
+        ReconciliationError
+    """
+    month_totals = {yyyymm: dict(totals, output=output.get(yyyymm, 0))
+                    for yyyymm, totals in sorted(source.items())}
+    for yyyymm in sorted(set(output) - set(source)):
+        month_totals[yyyymm] = dict(empty_month_totals(), output=output[yyyymm])
+    mismatches, within = reconcile(month_totals)
+    if verbose and within:
+        print("   ⚠️  허용 오차 안의 합계 차이\n" + format_reconciliation(within))
+    if mismatches:
+        raise ReconciliationError(mismatches)
+
+def render_partition(result_rows):
+    """파티션 CSV 내용 (헤더 포함, 줄바꿈은 os.linesep)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator=os.linesep)
+    writer.writerow(OUTPUT_COLUMNS)
+    writer.writerows(result_rows)
+    return buffer.getvalue()
+
+def write_rendered(rendered):
+    """
+    render_partition 결과 [(경로, 내용)] 기록 (utf-8 BOM)
+    """
+    for filepath, text in rendered:
+        with open(filepath, 'w', encoding='utf-8-sig', newline='') as f:
+            f.write(text)
+
+def convert_rows(header, rows, output_dir=OUTPUT_DIR, partitions=None, year=None, verbose=True,
+                 check=True):
+    """
+    피벗 형식의 행들을 브랜드별, 월별 CSV로 변환
+    행을 한 번만 훑으면서 파티션 행과 월별 원천 합계 / 출력 합계를 같이 만들고
+    파일을 쓰기 전에 두 합계를 대사합니다 (입력/출력을 다시 읽지 않음).
+
+    Args:
+        header: 컬럼명 목록
+        rows: 행 목록 (값 리스트, 한 번만 순회하므로 iterator도 가능)
+        output_dir: CSV 파일을 저장할 디렉토리
+        partitions: 변환할 (사업부 표준 라벨, YYYYMM) 집합 (없으면 전체 변환,
+                    합계 대사는 지정해도 파일 전체 기준)
+        year: 지정하면 해당 연도의 월 컬럼만 변환
+        check: 파일을 쓰기 전에 원천 합계와 출력 합계를 대사
+
+    Returns:
+        저장한 파일 경로 목록
+
+    Raises:
+        ReconciliationError: 허용 오차를 넘는 차이나 금액 변환 실패 칸이 있을 때 (파일은 쓰지 않음)
+    """
+    col_index = {col: i for i, col in enumerate(header)}
+    brand_col = next((col for col in BRAND_COLUMNS if col in col_index), None)
+    if brand_col is None:
+        raise KeyError(f"사업부 컬럼을 찾을 수 없습니다: {header}")
+    category3_col = source_column(col_index, '소분류')
+
+    brand_i = col_index[brand_col]
+    dim_i = [col_index[DEPT_COL], col_index[CATEGORY1_COL], col_index[CATEGORY2_COL], col_index[category3_col]]
+
+    months = []
+    for month_col in find_month_columns(header):
+        month_match = MONTH_PATTERN.search(str(month_col))
+        if month_match and (year is None or month_match.group(1).startswith(str(year))):
+            months.append((month_match.group(1), col_index[month_col]))
+    source = {yyyymm: empty_month_totals() for yyyymm, _ in months}
+    output = dict.fromkeys(source, 0)
+
+    labels = {}     # 원천 사업부 -> 표준 라벨 (별칭 통일, 등장 순서 = 출력 순서)
+    groups = {}     # (YYYYMM, 표준 라벨) -> 파티션 행 목록
+    for row in rows:
+        brand = row[brand_i] if brand_i < len(row) else None
+        is_grand = brand == GRAND_TOTAL_LABEL
+        label = None
+        if not is_grand and not is_missing(brand):
+            label = labels.get(brand) or labels.setdefault(brand, brand_label(brand))
+        dims = None
+        for yyyymm, i in months:
+            value = tally_source(source[yyyymm], row[i] if i < len(row) else None, is_grand)
+            if not value or label is None:
+                continue
+            output[yyyymm] += value
+            if partitions is not None and (label, yyyymm) not in partitions:
+                continue
+            if dims is None:
+                dept, category1, category2, category3 = (_cell_text(row[j]) for j in dim_i)
+                dims = [dept, dept, category1, category2, category3, category3]
+            groups.setdefault((yyyymm, label), []).append([label, *dims, format_minor(value), yyyymm, ''])
+
+    # 월 → 사업부 등장 순서로 출력
+    brand_order = {label: n for n, label in enumerate(dict.fromkeys(labels.values()))}
+    month_order = {yyyymm: n for n, (yyyymm, _) in enumerate(months)}
+    rendered = {}   # 파일 경로 -> 내용
+    for (yyyymm, label), result_rows in sorted(groups.items(),
+                                               key=lambda item: (month_order[item[0][0]], brand_order[item[0][1]])):
+        filename = partition_filename(label, yyyymm)
+        rendered[os.path.join(output_dir, filename)] = render_partition(result_rows)
+        if verbose:
+            print(f"   ✅ {label}: {filename} ({len(result_rows)}개 행)")
+
+    if check:
+        check_totals(source, output, verbose)
+
+    os.makedirs(output_dir, exist_ok=True)
+    write_rendered(rendered.items())
+    return list(rendered)
+
+def convert_file(path, output_dir=OUTPUT_DIR, sheet=None, partitions=None, year=None, verbose=True,
+                 check=True):
+    """
+    파일 하나 변환 (CSV는 표준 라이브러리, 엑셀은 openpyxl)
+
+    Returns:
+        저장한 파일 경로 목록
+    """
+    header, rows = read_rows(path, sheet)
+    return convert_rows(header, rows, output_dir, partitions, year, verbose, check)
+
+def main():
+    """메인 함수"""
+    started = time.perf_counter()
+    args = sys.argv[1:]
+    sheet = None
+    if '--sheet' in args:
+        i = args.index('--sheet')
+        sheet = args[i + 1]
+        del args[i:i + 2]
+    workers = None
+    if '--workers' in args:
+        i = args.index('--workers')
+        workers = int(args[i + 1])
+        del args[i:i + 2]
+    files = args or [input_streams.find_input(p) for p in ('재유니/2024.csv', '재유니/2025.csv')]
+
+    total = 0
+    try:
+        with staged_output(OUTPUT_DIR) as output_dir:
+            for path in files:
+                if not input_streams.exists(path):
+                    print(f"⚠️  파일을 찾을 수 없습니다: {path}")
+                    continue
+                print(f"📂 처리 중: {path}")
+                if workers and path.lower().endswith('.csv') and not input_streams.compression_of(path):
+                    from chunk_parallel import convert_parallel
+                    total += len(convert_parallel(path, output_dir, workers=workers))
+                else:
+                    total += len(convert_file(path, output_dir, sheet=sheet))
+    except ReconciliationError as e:
+        print(f"❌ {e}\n   배포하지 않았습니다 ({OUTPUT_DIR}는 이전 상태 유지)")
+        sys.exit(1)
+
+    elapsed = time.perf_counter() - started
+    print(f"\n✅ 변환 완료: {total}개 파일 ({elapsed * 1000:.0f}ms)")
+
+if __name__ == "__main__":
+    main()
@@ -2,9 +2,11 @@
 엑셀 데이터를 JSON으로 최종 변환
 """
 import pandas as pd
-import json
 import os
 
+from dimensions import BRANDS, resolve_brand
+from json_shards import write_json_with_shards
+
 print("="*80)
 print("엑셀 데이터 변환 시작")
 print("="*80)
@@ -29,20 +31,12 @@ print("2025년 데이터 처리 중...")
 df_2025 = pd.read_excel('2025.1-10.XLSX', sheet_name='2025년')
 print(f"행 수: {len(df_2025)}")
 
-# 브랜드 매핑
-brand_map = {
-    'MLB': 'mlb',
-    'MLB Kids': 'mlb-kids',
-    'Discovery': 'discovery',
-    '공통': 'common'
-}
-
-# 2024년 처리
-for brand_name, brand_id in brand_map.items():
+# 2024년 처리 (사업부 별칭은 dimensions.BRANDS 기준으로 통일)
+for file_id, (_, brand_id, brand_name, _) in BRANDS.items():
     print(f"\n{brand_name} 처리 중...")
     
     # 브랜드 필터링
-    df_brand = df_2024[df_2024['사업부'] == brand_name]
+    df_brand = df_2024[df_2024['사업부'].map(resolve_brand) == file_id]
     print(f"  2024년: {len(df_brand)}개 행")
     
     count = 0
@@ -68,7 +62,7 @@ for brand_name, brand_id in brand_map.items():
                     count += 1
     
     # 2025년 처리
-    df_brand = df_2025[df_2025['사업부'] == brand_name]
+    df_brand = df_2025[df_2025['사업부'].map(resolve_brand) == file_id]
     print(f"  2025년: {len(df_brand)}개 행")
     
     for _, row in df_brand.iterrows():
@@ -94,10 +88,9 @@ for brand_name, brand_id in brand_map.items():
     
     print(f"  총 {count:,}개 데이터")
 
-# JSON 저장
+# JSON + 브랜드 × 연도 샤드 저장 (빌드 디렉토리에 쓴 뒤 public/data 교체)
 output_file = 'public/data/cost_data.json'
-with open(output_file, 'w', encoding='utf-8') as f:
-    json.dump(all_data, f, ensure_ascii=False, indent=2)
+write_json_with_shards(all_data, 'public/data', 'cost_data')
 
 print(f"\n{'='*80}")
 print(f"✅ 완료! {output_file} 저장됨")
@@ -0,0 +1,94 @@
+"""
+통화 환산 (보고 통화 기준 금액 계산)
+
+환율표를 읽어 각 비용 행의 (통화, 년월)에 해당 시점의 환율을 as-of merge로 붙이고
+원래 금액과 보고 통화 금액을 함께 보관합니다.
+환율은 통화별로 "기준일 이전의 가장 최근 환율"을 사용합니다.
+
+환율표 (기본: 재유니/fx_rates.csv):
+    통화,기준일,환율
+    KRW,2024-01-01,0.0054
+    USD,2024-01-01,7.10
+    ...
+    환율 = 통화 1단위당 보고 통화 금액 (보고 통화 자신은 표에 없어도 1로 처리)
+
+통화가 비어 있는 행은 보고 통화로 간주하지 않고 환산하지 않습니다 (보고 통화 금액 NaN, 경고).
+"""
+
+import os
+import warnings
+
+import pandas as pd
+
+FX_RATES_FILE = os.path.join('재유니', 'fx_rates.csv')
+REPORTING_CURRENCY = 'CNY'
+REPORTING_AMOUNT_COL = '보고통화금액'
+
+# 실행 중 환율표 캐시: (경로, 수정시각) -> DataFrame
+_rate_cache = {}
+
+def load_fx_rates(path=FX_RATES_FILE):
+    """
+    환율표 읽기 (같은 파일은 실행 중 한 번만 읽음)
+
+    Returns:
+        ['통화', '_fx_date', '환율'] 데이터프레임 (기준일 순 정렬), 파일이 없으면 None
+    """
+    if not os.path.exists(path):
+        return None
+    key = (os.path.abspath(path), os.path.getmtime(path))
+    if key not in _rate_cache:
+        rates = pd.read_csv(path, encoding='utf-8-sig', dtype={'통화': str})
+        rates['통화'] = rates['통화'].str.strip().str.upper()
+        rates['_fx_date'] = pd.to_datetime(rates['기준일'].astype(str))
+        rates['환율'] = pd.to_numeric(rates['환율'], errors='coerce')
+        _rate_cache[key] = (rates.dropna(subset=['_fx_date', '환율'])
+                                 [['통화', '_fx_date', '환율']]
+                                 .sort_values('_fx_date', kind='stable')
+                                 .reset_index(drop=True))
+    return _rate_cache[key]
+
+def normalize_currency(df, amount_col='금액', currency_col='통화', month_col='년월',
+                       rates=None, reporting_currency=REPORTING_CURRENCY):
+    """
+    보고 통화 금액 컬럼(REPORTING_AMOUNT_COL) 추가
+
+    Args:
+        df: 비용 데이터 (금액, 통화, 년월 컬럼 포함. 년월은 'YYYY-MM' 또는 'YYYYMM')
+        rates: load_fx_rates() 결과 (None이면 기본 환율표 사용)
+
+    Returns:
+        원래 행 순서를 유지한 데이터프레임
+        (통화가 비어 있거나 환율을 찾지 못한 행의 보고 통화 금액은 NaN, 통화는 '')
+    """
+    if rates is None:
+        rates = load_fx_rates()
+
+    result = df.copy()
+    currency = result[currency_col].fillna('').astype(str).str.strip().str.upper()
+    result[currency_col] = currency
+
+    fx_date = pd.to_datetime(result[month_col].astype(str).str.replace('-', '', regex=False),
+                             format='%Y%m', errors='coerce')
+
+    if rates is None or rates.empty:
+        rate = pd.Series(float('nan'), index=result.index)
+    else:
+        left = pd.DataFrame({'통화': currency, '_fx_date': fx_date, '_row': range(len(result))})
+        left = left.dropna(subset=['_fx_date']).sort_values('_fx_date', kind='stable')
+        merged = pd.merge_asof(left, rates, on='_fx_date', by='통화', direction='backward')
+        rate = pd.Series(float('nan'), index=range(len(result)))
+        rate.iloc[merged['_row'].to_numpy()] = merged['환율'].to_numpy()
+        rate.index = result.index
+
+    rate = rate.where(currency != reporting_currency, 1.0)
+    result[REPORTING_AMOUNT_COL] = result[amount_col] * rate
+
+    no_currency = int((currency == '').sum())
+    if no_currency:
+        warnings.warn(f"통화가 비어 있어 환산하지 않은 행: {no_currency}개")
+    missing = result.loc[rate.isna() & (currency != ''), [currency_col, month_col]].drop_duplicates()
+    if len(missing):
+        pairs = ', '.join(f"{c}/{m}" for c, m in missing.itertuples(index=False))
+        warnings.warn(f"환율을 찾을 수 없는 통화/월: {pairs}")
+    return result
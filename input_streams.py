@@ -0,0 +1,109 @@
+"""
+압축된 입력 파일 스트림 열기
+.gz / .zst / .zip 입력을 임시 파일 없이 바로 풀면서 읽습니다.
+zstandard 패키지(선택 설치, SETUP_GUIDE.md 참고)는 .zst 파일을 열 때만 import 합니다.
+
+    open_text('재유니/2025.csv.gz', 'utf-8-sig')   # CSV 파서에 바로 넘길 텍스트 스트림
+    open_binary('2025.1-10.XLSX.zip')                # 엑셀 리더용 바이너리 스트림
+    find_input('재유니/2025.csv')                    # 2025.csv, 2025.csv.gz, ... 중 있는 파일
+
+.zip은 CSV/엑셀 파일이 하나만 들어 있어야 하며,
+여러 개면 'archive.zip::2025.csv'처럼 파일 이름을 지정합니다.
+"""
+
+import gzip
+import io
+import os
+import zipfile
+
+COMPRESSED_SUFFIXES = ('.gz', '.zst', '.zip')
+MEMBER_SEPARATOR = '::'
+DATA_SUFFIXES = ('.csv', '.xlsx', '.xlsm')
+
+def split_member(path):
+    """'archive.zip::2025.csv' → ('archive.zip', '2025.csv'), 일반 경로는 (경로, None)"""
+    if MEMBER_SEPARATOR in path:
+        archive, member = path.split(MEMBER_SEPARATOR, 1)
+        return archive, member
+    return path, None
+
+def compression_of(path):
+    """압축 형식 ('gz', 'zst', 'zip') 또는 None"""
+    archive, _ = split_member(path)
+    for suffix in COMPRESSED_SUFFIXES:
+        if archive.lower().endswith(suffix):
+            return suffix[1:]
+    return None
+
+def _zip_member(zf, member):
+    if member:
+        return member
+    names = [n for n in zf.namelist() if n.lower().endswith(DATA_SUFFIXES) and not n.startswith('__MACOSX/')]
+    if len(names) != 1:
+        raise ValueError(f"zip 안의 데이터 파일이 {len(names)}개입니다 (archive.zip::파일이름 으로 지정): {names}")
+    return names[0]
+
+def inner_name(path):
+    """
+    압축을 푼 파일 이름 (예: 재유니/2025.csv.gz → 2025.csv, a.zip::b/2025.csv → 2025.csv)
+    """
+    archive, member = split_member(path)
+    kind = compression_of(path)
+    if kind == 'zip':
+        if member is None:
+            with zipfile.ZipFile(archive) as zf:
+                member = _zip_member(zf, None)
+        return os.path.basename(member)
+    name = os.path.basename(archive)
+    return name[:-len(kind) - 1] if kind else name
+
+def exists(path):
+    """압축 멤버 지정('::')을 포함한 경로의 존재 여부"""
+    return os.path.exists(split_member(path)[0])
+
+def open_binary(path):
+    """
+    압축을 풀면서 읽는 바이너리 스트림
+    """
+    archive, member = split_member(path)
+    kind = compression_of(path)
+    if kind == 'gz':
+        return gzip.open(archive, 'rb')
+    if kind == 'zst':
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError(f".zst 입력을 읽으려면 zstandard 패키지가 필요합니다 (pip install zstandard): {path}") from e
+
+        return zstandard.ZstdDecompressor().stream_reader(open(archive, 'rb'), closefd=True)
+    if kind == 'zip':
+        # ZipFile을 닫아도 열린 멤버 스트림이 닫힐 때까지 파일 핸들은 유지됨
+        with zipfile.ZipFile(archive) as zf:
+            return zf.open(_zip_member(zf, member))
+    return open(archive, 'rb')
+
+def open_seekable(path):
+    """
+    임의 위치 읽기가 필요한 리더(openpyxl 등)용 스트림
+    (.gz/.zst는 메모리로 풀어서 BytesIO로 반환, 디스크에는 쓰지 않음)
+    """
+    kind = compression_of(path)
+    if kind in ('gz', 'zst'):
+        with open_binary(path) as f:
+            return io.BytesIO(f.read())
+    return open_binary(path)
+
+def open_text(path, encoding='utf-8-sig'):
+    """
+    압축을 풀면서 읽는 텍스트 스트림 (csv 모듈용으로 newline='')
+    """
+    return io.TextIOWrapper(open_binary(path), encoding=encoding, newline='')
+
+def find_input(path):
+    """
+    path 또는 압축된 같은 파일 (path.gz, path.zst, path.zip) 중 처음 찾은 경로 (없으면 path)
+    """
+    for candidate in [path] + [path + suffix for suffix in COMPRESSED_SUFFIXES]:
+        if os.path.exists(candidate):
+            return candidate
+    return path
@@ -0,0 +1,149 @@
+"""
+JSON 데이터를 브랜드 × 연도 샤드로 나눠 저장
+API 라우트/클라이언트가 필요한 브랜드·연도만 읽을 수 있도록
+전체 JSON 하나 대신 작은 파일들과 manifest.json을 함께 만듭니다.
+
+출력: {output_dir}/{name}/
+    manifest.json   {"source", "source_sha256", "shards": [{"brand", "year", "file", "bytes", "rows", "total"}]}
+    {brand}_{year}.json   해당 브랜드/연도 레코드 배열
+
+입력 형식:
+    cost_data.json       {brand_id: [레코드, ...]}
+    mlb_china_data.json  [레코드, ...]  (브랜드는 --brand로 지정, 기본 mlb)
+레코드 연도는 '년도' 또는 '연월'('YYYY-MM') 값으로 정합니다.
+source_sha256은 샤드를 만든 원본 {name}.json의 해시입니다. 원본만 다시 쓰인 경우
+(extract_mlb_data.js 등) API 라우트가 해시 불일치를 보고 원본 파일을 대신 읽습니다.
+
+사용법:
+    python json_shards.py                                  # public/data/mlb_china_data.json
+    python json_shards.py public/data/cost_data.json
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+
+from amounts import minor_to_float, parse_minor
+from publish_data import file_digest, staged_output
+
+DATA_DIR = 'public/data'
+MANIFEST_FILE = 'manifest.json'
+
+def record_year(record):
+    """레코드의 연도 (알 수 없으면 None)"""
+    if record.get('년도') not in (None, ''):
+        return int(record['년도'])
+    month = str(record.get('연월') or record.get('년월') or '')
+    return int(month[:4]) if month[:4].isdigit() else None
+
+def split_records(data, brand='mlb'):
+    """
+    {(브랜드, 연도): [레코드]}로 나누기 (입력 순서 유지)
+
+    Args:
+        data: {brand_id: [레코드]} 또는 [레코드]
+        brand: data가 배열일 때 사용할 브랜드 ID
+    """
+    by_brand = data if isinstance(data, dict) else {brand: data}
+    shards = {}
+    for brand_id, records in by_brand.items():
+        for record in records:
+            shards.setdefault((brand_id, record_year(record)), []).append(record)
+    return shards
+
+def _write_atomic(path, payload):
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        f.write(payload)
+    os.replace(tmp, path)
+
+def write_json_shards(data, output_dir=DATA_DIR, name='cost_data', brand='mlb', source_path=None):
+    """
+    브랜드 × 연도 샤드와 manifest.json 저장 (이전 실행의 남은 샤드는 삭제)
+
+    Args:
+        source_path: data를 읽은 원본 JSON 파일 (manifest의 source_sha256)
+
+    Returns:
+        manifest dict
+    """
+    shard_dir = os.path.join(output_dir, name)
+    os.makedirs(shard_dir, exist_ok=True)
+
+    manifest = {'source': f'{name}.json',
+                'source_sha256': file_digest(source_path) if source_path else None,
+                'shards': []}
+    written = set()
+    for (brand_id, year), records in sorted(split_records(data, brand).items(),
+                                            key=lambda item: (item[0][0], item[0][1] or 0)):
+        file_name = f"{brand_id}_{year if year is not None else 'unknown'}.json"
+        payload = json.dumps(records, ensure_ascii=False, separators=(',', ':'))
+        _write_atomic(os.path.join(shard_dir, file_name), payload)
+        written.add(file_name)
+        manifest['shards'].append({
+            'brand': brand_id,
+            'year': year,
+            'file': file_name,
+            'bytes': len(payload.encode('utf-8')),
+            'rows': len(records),
+            'total': minor_to_float(sum(parse_minor(r.get('금액')) for r in records)),
+        })
+
+    # manifest를 마지막에 바꿔서 읽는 쪽이 항상 존재하는 샤드만 보도록 함
+    _write_atomic(os.path.join(shard_dir, MANIFEST_FILE),
+                  json.dumps(manifest, ensure_ascii=False, indent=2))
+    for file_name in os.listdir(shard_dir):
+        if file_name.endswith('.json') and file_name != MANIFEST_FILE and file_name not in written:
+            os.remove(os.path.join(shard_dir, file_name))
+    return manifest
+
+def _shard_pattern(name):
+    """output_dir 기준 샤드 폴더 경로 패턴 (이번에 만들지 않은 샤드는 배포에서 제외)"""
+    return re.compile(rf'^{re.escape(name)}/')
+
+def write_json_with_shards(data, output_dir=DATA_DIR, name='cost_data', brand='mlb'):
+    """
+    {name}.json 원본과 브랜드 × 연도 샤드를 함께 저장
+    (public/data면 빌드 디렉토리에 쓴 뒤 publish_data로 한 번에 교체)
+
+    Returns:
+        manifest dict
+    """
+    with staged_output(output_dir, managed=_shard_pattern(name), snapshot=False) as target:
+        source_path = os.path.join(target, f'{name}.json')
+        with open(source_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        return write_json_shards(data, target, name, brand, source_path)
+
+def print_manifest(manifest):
+    """샤드 요약 출력"""
+    for shard in manifest['shards']:
+        print(f"   ✅ {shard['file']:<24} {shard['rows']:>7,}행  {shard['bytes'] / 1024:>8.1f}KB  "
+              f"합계 {shard['total']:,.2f}")
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='JSON 데이터를 브랜드 × 연도 샤드로 나누기')
+    parser.add_argument('input', nargs='?', default=os.path.join(DATA_DIR, 'mlb_china_data.json'))
+    parser.add_argument('--brand', default='mlb', help='배열 형식 입력의 브랜드 ID')
+    parser.add_argument('--output-dir', help='샤드 폴더 위치 (기본: 입력 파일과 같은 폴더)')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.input):
+        print(f"❌ 파일을 찾을 수 없습니다: {args.input}")
+        sys.exit(1)
+
+    with open(args.input, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    name = os.path.splitext(os.path.basename(args.input))[0]
+    output_dir = args.output_dir or os.path.dirname(args.input) or '.'
+    print(f"\n📂 {args.input} → {os.path.join(output_dir, name)}/")
+    with staged_output(output_dir, managed=_shard_pattern(name), snapshot=False) as target:
+        manifest = write_json_shards(data, target, name, args.brand, args.input)
+    print_manifest(manifest)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+// python cost_analytics.py 로 생성되는 브랜드별 사전 계산 통계 (public/data/analytics_{brand}.json) 읽기
+// 형식은 cost_analytics.py 상단 설명 참고 (금액 컬럼은 원 단위)
+// 레벨: 전체 / 대분류 / 본부 / 본부/대분류 / 본부/계정과목
+
+export type AnalyticsValue = string | number | null;
+
+export interface AnalyticsTable {
+  columns: string[];
+  rows: AnalyticsValue[][];
+}
+
+export interface AnalyticsLevel {
+  series: AnalyticsTable;
+  outliers: AnalyticsTable;
+  jumps: AnalyticsTable;
+}
+
+export interface CostAnalytics {
+  brand: string;
+  months: string[];
+  levels: { [level: string]: AnalyticsLevel };
+}
+
+// 파일이 없으면 null (통계 섹션을 표시하지 않음)
+export async function fetchCostAnalytics(brandFileId: string): Promise<CostAnalytics | null> {
+  const response = await fetch(`/data/analytics_${brandFileId}.json`);
+  if (!response.ok) {
+    return null;
+  }
+  return response.json();
+}
+
+// {"columns", "rows"} 표 → 컬럼 이름을 키로 하는 행 객체 목록
+export function tableRecords(table: AnalyticsTable): { [column: string]: AnalyticsValue }[] {
+  return table.rows.map(row => {
+    const record: { [column: string]: AnalyticsValue } = {};
+    table.columns.forEach((column, i) => {
+      record[column] = row[i];
+    });
+    return record;
+  });
+}
+
+// 레벨의 시리즈 통계 중 조건(컬럼 = 값)에 맞는 행 목록 (합계, 최고월/최저월, 최근3개월평균, 합계_YYYY ...)
+export function seriesRecords(
+  analytics: CostAnalytics,
+  level: string,
+  where: { [column: string]: string } = {}
+): { [column: string]: AnalyticsValue }[] {
+  const series = analytics.levels[level]?.series;
+  if (!series) {
+    return [];
+  }
+  const conditions = Object.entries(where);
+  return tableRecords(series).filter(record => conditions.every(([column, value]) => record[column] === value));
+}
+
+// 본부/대분류 필터 ('all'이면 필터 없음)에 맞는 시리즈 하나 (없으면 null)
+export function findSeries(
+  analytics: CostAnalytics,
+  department: string,
+  category: string
+): { [column: string]: AnalyticsValue } | null {
+  const where: { [column: string]: string } = {};
+  if (department !== 'all') {
+    where['본부'] = department;
+  }
+  if (category !== 'all') {
+    where['대분류'] = category;
+  }
+  const level = department !== 'all' ? (category !== 'all' ? '본부/대분류' : '본부') : category !== 'all' ? '대분류' : '전체';
+  return seriesRecords(analytics, level, where)[0] || null;
+}
@@ -0,0 +1,232 @@
+// python binary_export.py 로 생성되는 브랜드별 바이너리 (public/data/cost_{brand}.bin) 읽기
+// 형식은 binary_export.py 상단 설명 참고 (리틀 엔디언, 각 구간 8바이트 정렬)
+
+const MAGIC = 'FCBIN';
+const VERSION = 1;
+const HEADER_BYTES = 8 + 8 * 4;
+
+export interface CostRecord {
+  브랜드: string;
+  본부: string;
+  팀: string;
+  대분류: string;
+  중분류: string;
+  소분류: string;
+  계정과목: string;
+  금액: number;
+  년월: string;
+  비고: string;
+}
+
+export interface CostBinary {
+  columns: string[];
+  months: string[];
+  monthOffsets: Uint32Array;  // 월 i의 행 = [monthOffsets[i], monthOffsets[i + 1])
+  amounts: Float64Array;      // 최소 단위 (원 = 값 / 100)
+  codes: { [column: string]: Uint16Array };
+  strings: string[];
+}
+
+// 호스트 엔디언과 관계없이 리틀 엔디언으로 읽기 위한 확인
+const LITTLE_ENDIAN = new Uint8Array(new Uint16Array([1]).buffer)[0] === 1;
+
+export function parseCostBinary(buffer: ArrayBuffer): CostBinary {
+  const view = new DataView(buffer);
+  const decoder = new TextDecoder('utf-8');
+  const magic = decoder.decode(new Uint8Array(buffer, 0, MAGIC.length));
+  if (magic !== MAGIC || view.getUint32(8, true) !== VERSION) {
+    throw new Error('cost 바이너리 파일이 아닙니다');
+  }
+  const [nRows, nMonths, nColumns, nStrings, nBytes] = [12, 16, 20, 24, 28].map(
+    offset => view.getUint32(offset, true)
+  );
+
+  let pos = HEADER_BYTES;
+  const take = <T>(make: (offset: number, count: number) => T, bytesPer: number, count: number): T => {
+    const array = make(pos, count);
+    pos += Math.ceil((bytesPer * count) / 8) * 8;
+    return array;
+  };
+  const u32 = (offset: number, count: number) =>
+    LITTLE_ENDIAN
+      ? new Uint32Array(buffer, offset, count)
+      : Uint32Array.from({ length: count }, (_, i) => view.getUint32(offset + i * 4, true));
+  const u16 = (offset: number, count: number) =>
+    LITTLE_ENDIAN
+      ? new Uint16Array(buffer, offset, count)
+      : Uint16Array.from({ length: count }, (_, i) => view.getUint16(offset + i * 2, true));
+  const f64 = (offset: number, count: number) =>
+    LITTLE_ENDIAN
+      ? new Float64Array(buffer, offset, count)
+      : Float64Array.from({ length: count }, (_, i) => view.getFloat64(offset + i * 8, true));
+
+  const columnCodes = take(u32, 4, nColumns);
+  const months = take(u32, 4, nMonths);
+  const monthOffsets = take(u32, 4, nMonths + 1);
+  const amounts = take(f64, 8, nRows);
+  const allCodes = take(u16, 2, nColumns * nRows);
+  const stringOffsets = take(u32, 4, nStrings + 1);
+
+  const blob = new Uint8Array(buffer, pos, nBytes);
+  const strings = Array.from({ length: nStrings }, (_, i) =>
+    decoder.decode(blob.subarray(stringOffsets[i], stringOffsets[i + 1]))
+  );
+
+  const columns = Array.from(columnCodes, code => strings[code]);
+  const codes: { [column: string]: Uint16Array } = {};
+  columns.forEach((column, i) => {
+    codes[column] = allCodes.subarray(i * nRows, (i + 1) * nRows);
+  });
+
+  return { columns, months: Array.from(months, String), monthOffsets, amounts, codes, strings };
+}
+
+// 파일이 없으면 null (CSV 파티션으로 대체)
+export async function fetchCostBinary(brandFileId: string): Promise<CostBinary | null> {
+  const response = await fetch(`/data/cost_${brandFileId}.bin`);
+  if (!response.ok) {
+    return null;
+  }
+  return parseCostBinary(await response.arrayBuffer());
+}
+
+// 행 조건 (컬럼 = 값, 모두 만족해야 함)
+export type CostFilter = { [column: string]: string };
+
+// 월 하나의 행 범위 [시작, 끝) (파일에 없는 월이면 null)
+export function monthRange(data: CostBinary, month: string): [number, number] | null {
+  const m = data.months.indexOf(month);
+  return m < 0 ? null : [data.monthOffsets[m], data.monthOffsets[m + 1]];
+}
+
+// 문자열 → 번호 (파일마다 한 번만 만듦)
+const stringIndexes = new WeakMap<CostBinary, Map<string, number>>();
+
+function stringCode(data: CostBinary, value: string): number | undefined {
+  let index = stringIndexes.get(data);
+  if (!index) {
+    index = new Map(data.strings.map((text, i) => [text, i] as [string, number]));
+    stringIndexes.set(data, index);
+  }
+  return index.get(value);
+}
+
+// 조건을 코드 비교로 바꿈 (값이 파일에 없으면 null = 일치하는 행 없음)
+function compileFilter(data: CostBinary, where: CostFilter): ((row: number) => boolean) | null {
+  const tests: [Uint16Array, number][] = [];
+  for (const [column, value] of Object.entries(where)) {
+    const code = stringCode(data, value);
+    if (code === undefined || !data.codes[column]) {
+      return null;
+    }
+    tests.push([data.codes[column], code]);
+  }
+  return row => tests.every(([columnCodes, code]) => columnCodes[row] === code);
+}
+
+// 요청한 월의 행만 순회 (조건은 코드로 먼저 거름)
+function forEachRow(
+  data: CostBinary,
+  months: string[],
+  where: CostFilter,
+  visit: (row: number, month: string) => void
+) {
+  const matches = compileFilter(data, where);
+  if (!matches) {
+    return;
+  }
+  for (const month of months) {
+    const range = monthRange(data, month);
+    if (!range) {
+      continue;
+    }
+    for (let row = range[0]; row < range[1]; row++) {
+      if (matches(row)) {
+        visit(row, month);
+      }
+    }
+  }
+}
+
+// 금액 합계 (원) - 행 객체를 만들지 않고 amounts에서 바로 합산
+export function sumCost(data: CostBinary, months: string[], where: CostFilter = {}): number {
+  let total = 0;
+  forEachRow(data, months, where, row => {
+    total += data.amounts[row];
+  });
+  return total / 100;
+}
+
+// 컬럼 값별 금액 합계 (원, 처음 나온 순서) - 문자열 코드로 합산한 뒤 값만 문자열로 바꿈
+export function sumCostBy(
+  data: CostBinary,
+  months: string[],
+  column: string,
+  where: CostFilter = {}
+): { [value: string]: number } {
+  const columnCodes = data.codes[column];
+  if (!columnCodes) {
+    return {};
+  }
+  const sums = new Float64Array(data.strings.length);
+  const order: number[] = [];
+  const seen = new Uint8Array(data.strings.length);
+  forEachRow(data, months, where, row => {
+    const code = columnCodes[row];
+    if (!seen[code]) {
+      seen[code] = 1;
+      order.push(code);
+    }
+    sums[code] += data.amounts[row];
+  });
+  const result: { [value: string]: number } = {};
+  for (const code of order) {
+    result[data.strings[code]] = sums[code] / 100;
+  }
+  return result;
+}
+
+// 기존 CSV 파싱 결과와 같은 행 객체 목록 (요청한 월에서 조건에 맞는 행만 만듦)
+export function toCostRecords(data: CostBinary, months: string[], where: CostFilter = {}): CostRecord[] {
+  const { codes, strings, amounts } = data;
+  const text = (column: string, row: number) => (codes[column] ? strings[codes[column][row]] : '');
+  const records: CostRecord[] = [];
+  forEachRow(data, months, where, (row, month) => {
+    records.push({
+      브랜드: text('브랜드', row),
+      본부: text('본부', row),
+      팀: text('팀', row),
+      대분류: text('대분류', row),
+      중분류: text('중분류', row),
+      소분류: text('소분류', row),
+      계정과목: text('계정과목', row),
+      금액: amounts[row] / 100,
+      년월: month,
+      비고: text('비고', row),
+    });
+  });
+  return records;
+}
+
+// CSV로 읽은 행 객체에서 같은 합계 (바이너리가 없을 때)
+export function sumCostRecords(records: CostRecord[], months: string[], where: CostFilter = {}): number {
+  return Object.values(sumCostRecordsBy(records, months, '년월', where)).reduce((sum, value) => sum + value, 0);
+}
+
+export function sumCostRecordsBy(
+  records: CostRecord[],
+  months: string[],
+  column: keyof CostRecord,
+  where: CostFilter = {}
+): { [value: string]: number } {
+  const conditions = Object.entries(where) as [keyof CostRecord, string][];
+  const result: { [value: string]: number } = {};
+  for (const record of records) {
+    if (!months.includes(record.년월) || !conditions.every(([key, value]) => record[key] === value)) {
+      continue;
+    }
+    const key = String(record[column]);
+    result[key] = (result[key] || 0) + record.금액;
+  }
+  return result;
+}
@@ -0,0 +1,35 @@
+// python drilldown_tree.py 로 생성되는 브랜드별 드릴다운 트리 (public/data/drilldown/{brand}/) 읽기
+// index.json을 먼저 받고, 펼친 본부의 샤드만 추가로 받음 (형식은 drilldown_tree.py 상단 설명 참고)
+
+export interface DrilldownNode {
+  name: string;
+  monthly: number[];  // index의 months 순서
+  ytd: number[];      // 같은 연도 1월부터의 누계
+  children?: DrilldownNode[];
+}
+
+export interface DrilldownIndex {
+  brand: string;
+  months: string[];
+  monthly: number[];
+  ytd: number[];
+  children: { name: string; monthly: number[]; ytd: number[]; shard: string; rows: number }[];
+}
+
+// 파일이 없으면 null
+export async function fetchDrilldownIndex(brandFileId: string): Promise<DrilldownIndex | null> {
+  const response = await fetch(`/data/drilldown/${brandFileId}/index.json`);
+  if (!response.ok) {
+    return null;
+  }
+  return response.json();
+}
+
+// 본부 서브트리 (샤드 파일명은 브랜드/본부 경로의 해시라 재생성해도 바뀌지 않음)
+export async function fetchDrilldownShard(brandFileId: string, shard: string): Promise<DrilldownNode> {
+  const response = await fetch(`/data/drilldown/${brandFileId}/${shard}`);
+  if (!response.ok) {
+    throw new Error(`드릴다운 샤드를 읽을 수 없습니다: ${shard}`);
+  }
+  return response.json();
+}
@@ -0,0 +1,169 @@
+"""
+미결 월 예측 (연말까지 남은 월 채우기)
+브랜드 × 본부 × 계정 시리즈 전체를 시리즈 × 월 행렬 하나로 만들고
+방법별로 남은 월의 금액을 한 번의 배열 연산으로 계산합니다.
+
+예측 방법 (METHODS):
+    run_rate   올해 월평균 × 남은 월
+    yoy        전년 같은 월 × (올해 누계 / 전년 동기 누계), 전년 동기 누계가 0이면 run_rate
+    trailing   최근 TRAILING_MONTHS개월 평균
+
+출력: public/data/forecast_{brand}.csv  (실적 파티션과 별도 파일, 구분='예측')
+    브랜드ID,본부,대분류,계정과목,년월,금액,방법,구분
+
+사용법:
+    python projection.py                       # 모든 방법
+    python projection.py --method run_rate
+"""
+
+import argparse
+import os
+import re
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from amounts import format_minor
+from cost_analytics import build_matrix
+from cost_facts import DATA_DIR, load_facts
+from publish_data import staged_output
+
+SERIES_KEYS = ['본부', '대분류', '계정과목']
+METHODS = ['run_rate', 'yoy', 'trailing']
+TRAILING_MONTHS = 3
+FORECAST_FLAG = '예측'
+FORECAST_PATTERN = re.compile(r'^forecast_[a-z-]+\.csv$')
+
+def open_months(months):
+    """
+    최신 연도에서 실적이 없는 남은 월 (예: 202511, 202512)
+    """
+    latest = max(months)
+    year, month = int(latest[:4]), int(latest[4:])
+    return [f'{year}{m:02d}' for m in range(month + 1, 13)]
+
+def project(months, matrix, method):
+    """
+    남은 월 예측 행렬
+
+    Args:
+        months: 실적 월 목록 (정렬됨)
+        matrix: 시리즈 × 월 최소 단위 float64 행렬 (브랜드 데이터가 없는 월은 NaN)
+        method: METHODS 중 하나
+
+    Returns:
+        (예측 월 목록, 시리즈 × 예측 월 행렬)
+    """
+    targets = open_months(months)
+    if not targets:
+        return targets, np.empty((matrix.shape[0], 0))
+
+    month_arr = np.array(months)
+    year = targets[0][:4]
+    current = matrix[:, np.char.startswith(month_arr, year)]
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        run_rate = np.nanmean(current, axis=1)
+        trailing = np.nanmean(matrix[:, -TRAILING_MONTHS:], axis=1)
+
+    if method == 'run_rate':
+        base = np.repeat(run_rate[:, None], len(targets), axis=1)
+    elif method == 'trailing':
+        base = np.repeat(trailing[:, None], len(targets), axis=1)
+    elif method == 'yoy':
+        prev_year = str(int(year) - 1)
+        position = {m: i for i, m in enumerate(months)}
+        same_period = [position.get(prev_year + m[4:]) for m in month_arr if m.startswith(year)]
+        prior_targets = [position.get(prev_year + t[4:]) for t in targets]
+
+        def pick(indices):
+            cols = [matrix[:, i] if i is not None else np.full(matrix.shape[0], np.nan) for i in indices]
+            return np.column_stack(cols) if cols else np.empty((matrix.shape[0], 0))
+
+        prior_ytd = np.nansum(pick(same_period), axis=1)
+        current_ytd = np.nansum(current, axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            growth = np.where(prior_ytd != 0, current_ytd / prior_ytd, np.nan)
+        base = pick(prior_targets) * growth[:, None]
+        # 전년 데이터가 없거나 성장률을 구할 수 없으면 run_rate 사용
+        base = np.where(np.isfinite(base), base, run_rate[:, None])
+    else:
+        raise ValueError(f"알 수 없는 예측 방법: {method} (가능: {', '.join(METHODS)})")
+
+    return targets, np.nan_to_num(base)
+
+def build_forecast(facts, methods=METHODS):
+    """
+    방법별 예측 테이블 (long-form, 0인 예측은 제외)
+    예측값은 최소 단위 정수로 반올림한 뒤 파티션과 같은 소수 둘째 자리 문자열로 기록
+    """
+    index, months, matrix = build_matrix(facts, SERIES_KEYS)
+    frames = []
+    for method in methods:
+        targets, forecast = project(months, matrix, method)
+        minor = np.rint(forecast).astype(np.int64)
+        rows, cols = np.nonzero(minor)
+        table = index.iloc[rows].reset_index(drop=True)
+        table['년월'] = np.array(targets, dtype=object)[cols] if len(targets) else []
+        table['금액'] = [format_minor(v) for v in minor[rows, cols]]
+        table['방법'] = method
+        frames.append(table)
+
+    if not frames:
+        return pd.DataFrame(columns=['brand_id'] + SERIES_KEYS + ['년월', '금액', '방법', '구분'])
+    result = pd.concat(frames, ignore_index=True)
+    result['구분'] = FORECAST_FLAG
+    return result
+
+def write_forecast(forecast, output_dir=DATA_DIR):
+    """
+    브랜드별 forecast_{brand}.csv 저장
+
+    Returns:
+        {brand_id: 행 수}
+    """
+    counts = {}
+    for brand_id, group in forecast.groupby('brand_id', sort=True):
+        output_file = os.path.join(output_dir, f'forecast_{brand_id}.csv')
+        group.rename(columns={'brand_id': '브랜드ID'}).to_csv(output_file, index=False, encoding='utf-8-sig')
+        counts[brand_id] = len(group)
+    return counts
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='미결 월 예측')
+    parser.add_argument('--method', choices=METHODS + ['all'], default='all')
+    parser.add_argument('--data-dir', default=DATA_DIR)
+    parser.add_argument('--output-dir', default=DATA_DIR)
+    args = parser.parse_args()
+
+    print("\n" + "="*70)
+    print("🔮 미결 월 예측")
+    print("="*70)
+
+    started = time.perf_counter()
+    facts = load_facts(args.data_dir)
+    if facts.empty:
+        print("❌ 처리할 데이터가 없습니다.")
+        return
+
+    methods = METHODS if args.method == 'all' else [args.method]
+    forecast = build_forecast(facts, methods)
+    if forecast.empty:
+        print("✅ 남은 월이 없습니다 (최신 연도 12월까지 실적 있음).")
+        return
+
+    targets = sorted(forecast['년월'].unique())
+    print(f"📅 예측 월: {', '.join(targets)} / 방법: {', '.join(methods)}")
+    # 빌드 디렉토리에 쓴 뒤 public/data를 한 번에 교체 (publish_data)
+    with staged_output(args.output_dir, managed=FORECAST_PATTERN, snapshot=False) as target:
+        counts = write_forecast(forecast, target)
+    for brand_id, count in counts.items():
+        print(f"   ✅ forecast_{brand_id}.csv ({count:,}행)")
+    print(f"\n⏱️  {time.perf_counter() - started:.2f}초")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,438 @@
+"""
+public/data 원자적 배포 스크립트
+
+변환 결과를 스테이징 디렉토리(.data_releases/.staging-*)에 먼저 모은 뒤
+public/data 디렉토리와 한 번에 맞바꿉니다 (디렉토리 교환, 심볼릭 링크 없음).
+- 현재 public/data 파일의 실제 내용(sha256)과 같은 파일은 하드링크로 재사용
+- 바뀐 파일만 새로 기록
+- 파티션(cost_{brand}_{yyyymm}.csv)이 바뀌거나 빠진 브랜드는 새 릴리스 파티션으로
+  파생 파일을 다시 생성 (어떤 변환기로 갱신해도 CSV와 일치)
+    cost_{brand}.bin            binary_export
+    analytics_{brand}.json      cost_analytics (전체 월 목록이 바뀌면 모든 브랜드)
+    drilldown/{brand}/*.json    drilldown_tree (index.json + 본부 샤드)
+- 대시보드는 항상 이전 릴리스 전체 또는 새 릴리스 전체만 보게 됨
+- 교체된 이전 내용은 .data_releases/<교체 시각>에 KEEP_RELEASES개까지 보관 (git 추적 대상 아님)
+
+public/data는 계속 실제 디렉토리로 남으므로 git에는 내용이 바뀐 데이터 파일만 변경으로 보입니다.
+교환은 Linux renameat2(RENAME_EXCHANGE) / macOS renamex_np(RENAME_SWAP)를 사용하고,
+지원하지 않는 OS/파일시스템에서는 public/data를 건드리지 않고 오류로 중단합니다.
+(예전 방식으로 public/data가 .data_releases를 가리키는 심볼릭 링크라면 첫 배포 때 실제 디렉토리로 바뀜)
+
+public/data에 쓰는 스크립트는 모두 staged_output()으로 빌드 디렉토리에 쓴 뒤 배포합니다.
+(배포된 파일은 이전 릴리스와 하드링크를 공유하므로 제자리에서 고쳐 쓰면 안 됨)
+
+사용법:
+    python publish_data.py   # 재유니 데이터 전체 변환 후 배포
+
+변환 중 원천/출력 합계 대사(fast_convert.check_totals)가 실패하면 배포하지 않고 종료 코드 1로 끝납니다.
+"""
+
+import ctypes
+import ctypes.util
+import hashlib
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+LIVE_DIR = 'public/data'
+RELEASES_DIR = '.data_releases'
+KEEP_RELEASES = 3            # 보관할 이전 릴리스 수
+DATABASE_FILE = 'cost_facts.sqlite'   # 배포 후 갱신할 SQLite 저장소 (sqlite_sink.py)
+
+# 변환기가 관리하는 파일 (전체 변환 시 새 결과에 없으면 삭제)
+MANAGED_PATTERN = re.compile(r'^cost_[a-z-]+(?:_\d{6}\.csv|\.bin)$')
+
+def file_digest(path):
+    """
+    파일 내용의 sha256 해시
+    """
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+def list_files(root):
+    """
+    root 아래 모든 파일의 상대 경로 목록
+    """
+    files = []
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            rel = os.path.relpath(os.path.join(dirpath, filename), root)
+            files.append(rel.replace(os.sep, '/'))
+    return sorted(files)
+
+def _link_or_copy(src, dst):
+    """하드링크 생성 (다른 파일시스템 등으로 실패하면 복사)"""
+    os.makedirs(os.path.dirname(dst), exist_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+def _release_id():
+    return time.strftime('%Y%m%d-%H%M%S') + f'-{os.getpid()}'
+
+def _unique_path(path):
+    candidate, suffix = path, 1
+    while os.path.lexists(candidate):
+        candidate = f'{path}-{suffix}'
+        suffix += 1
+    return candidate
+
+def new_build_dir(releases_dir=RELEASES_DIR):
+    """
+    변환기가 결과를 쓸 임시 빌드 디렉토리 (릴리스와 같은 파일시스템에 생성)
+    """
+    os.makedirs(releases_dir, exist_ok=True)
+    return tempfile.mkdtemp(prefix='.build-', dir=releases_dir)
+
+def _changed_brands(changed):
+    """바뀐 상대 경로 중 파티션 파일의 브랜드 ID 집합"""
+    from cost_facts import PARTITION_PATTERN
+    return {match.group(1) for match in map(PARTITION_PATTERN.match, changed) if match}
+
+def _settle_derived(staging, live_dir, rel, status):
+    """
+    staging에 새로 만든 파생 파일이 현재 파일과 같으면 현재 파일(하드링크)로 되돌림
+    (파생 파일은 임시 파일 후 교체로 쓰므로 현재 파일과 공유하는 하드링크는 건드리지 않음)
+    """
+    path = os.path.join(staging, rel)
+    current = os.path.join(live_dir, rel)
+    if os.path.isfile(current) and file_digest(current) == file_digest(path):
+        os.remove(path)
+        _link_or_copy(current, path)
+        status[rel] = 'reused'
+    else:
+        status[rel] = 'written'
+
+def _drop_derived(staging, rel, status):
+    """파티션이 모두 빠진 브랜드의 파생 파일 제거"""
+    path = os.path.join(staging, rel)
+    if os.path.exists(path):
+        os.remove(path)
+    status.pop(rel, None)
+
+def _rebuild_binaries(staging, live_dir, changed, status):
+    """
+    파티션이 바뀌었거나 바이너리가 없는 브랜드의 cost_{brand}.bin을 staging 파티션으로 다시 생성
+    (파티션이 모두 빠진 브랜드는 바이너리도 뺌, 결과가 현재 파일과 같으면 현재 파일 재사용)
+
+    Args:
+        changed: 새로 기록했거나 뺀 상대 경로 목록
+        status: {상대 경로: 'reused' | 'written'} (갱신됨)
+    """
+    from binary_export import binary_filename, write_brand_binary
+    from cost_facts import list_partitions
+
+    by_brand = {}
+    for partition in list_partitions(staging):
+        by_brand.setdefault(partition[0], []).append(partition)
+    brands = _changed_brands(changed)
+    brands |= {brand_id for brand_id in by_brand if binary_filename(brand_id) not in status}
+
+    for brand_id in sorted(brands):
+        rel = binary_filename(brand_id)
+        if brand_id not in by_brand:
+            _drop_derived(staging, rel, status)
+            continue
+        write_brand_binary(brand_id, by_brand[brand_id], staging)
+        _settle_derived(staging, live_dir, rel, status)
+
+def _rebuild_analytics(staging, live_dir, changed, status):
+    """
+    파티션이 바뀌었거나 통계 파일이 없는 브랜드의 analytics_{brand}.json을 staging 파티션으로 다시 계산
+    (전체 월 목록이 바뀌면 최근 평균/전년 동기 기준이 달라지므로 모든 브랜드를 다시 계산)
+    """
+    from cost_analytics import analytics_filename, compute_analytics, write_analytics
+    from cost_facts import list_partitions, load_facts
+
+    partitions = list_partitions(staging)
+    brand_ids = {brand_id for brand_id, _, _ in partitions}
+    months = sorted({yyyymm for _, yyyymm, _ in partitions})
+    brands = _changed_brands(changed)
+    brands |= {brand_id for brand_id in brand_ids if analytics_filename(brand_id) not in status}
+    if months != sorted({yyyymm for _, yyyymm, _ in list_partitions(live_dir)}):
+        brands |= brand_ids
+
+    for brand_id in sorted(brands - brand_ids):
+        _drop_derived(staging, analytics_filename(brand_id), status)
+    targets = sorted(brands & brand_ids)
+    if not targets:
+        return
+    results = compute_analytics(load_facts(staging, targets), months)
+    for brand_id, _ in write_analytics(results, staging):
+        _settle_derived(staging, live_dir, analytics_filename(brand_id), status)
+
+def _rebuild_drilldown(staging, live_dir, changed, status):
+    """
+    파티션이 바뀌었거나 index.json이 없는 브랜드의 drilldown/{brand}/ 샤드를 staging 파티션으로 다시 생성
+    (없어진 본부의 샤드는 빠지고, 파티션이 모두 빠진 브랜드는 디렉토리째 뺌)
+    """
+    from cost_facts import list_partitions
+    from drilldown_tree import DRILLDOWN_DIR, build_tree, write_shards
+
+    by_brand = {}
+    for partition in list_partitions(staging):
+        by_brand.setdefault(partition[0], []).append(partition)
+    brands = _changed_brands(changed)
+    brands |= {brand_id for brand_id in by_brand if f'{DRILLDOWN_DIR}/{brand_id}/index.json' not in status}
+
+    drilldown_dir = os.path.join(staging, DRILLDOWN_DIR)
+    for brand_id in sorted(brands):
+        prefix = f'{DRILLDOWN_DIR}/{brand_id}/'
+        for rel in [rel for rel in status if rel.startswith(prefix)]:
+            del status[rel]
+        if brand_id not in by_brand:
+            shutil.rmtree(os.path.join(drilldown_dir, brand_id), ignore_errors=True)
+    if os.path.isdir(drilldown_dir) and not os.listdir(drilldown_dir):
+        os.rmdir(drilldown_dir)
+    targets = sorted(brands & set(by_brand))
+    if not targets:
+        return
+    # write_shards는 브랜드 디렉토리를 지우고 새 파일로 쓰므로 현재 파일과 공유하는 하드링크는 건드리지 않음
+    write_shards(build_tree(p for brand_id in targets for p in by_brand[brand_id]), drilldown_dir)
+    for brand_id in targets:
+        for name in sorted(os.listdir(os.path.join(drilldown_dir, brand_id))):
+            _settle_derived(staging, live_dir, f'{DRILLDOWN_DIR}/{brand_id}/{name}', status)
+
+def stage_release(build_dir, live_dir=LIVE_DIR, removed=(), releases_dir=RELEASES_DIR, derived=True):
+    """
+    현재 public/data + 빌드 결과로 새 릴리스 디렉토리 구성
+    (재사용 여부는 현재 파일을 직접 해시해서 판단)
+
+    Args:
+        build_dir: 이번에 새로 생성한 파일이 있는 디렉토리 (public/data 기준 상대 경로)
+        live_dir: 현재 배포된 디렉토리
+        removed: 새 릴리스에서 뺄 상대 경로 목록
+        releases_dir: 릴리스 보관 디렉토리
+        derived: 파티션이 바뀐 브랜드의 파생 파일(바이너리, 통계, 드릴다운 샤드) 다시 생성
+
+    Returns:
+        (스테이징 디렉토리, 통계 dict)
+    """
+    os.makedirs(releases_dir, exist_ok=True)
+    # mkdtemp(0700)가 아닌 일반 권한으로 생성 (교체 후 public/data가 됨)
+    staging = _unique_path(os.path.join(releases_dir, '.staging-' + _release_id()))
+    os.makedirs(staging)
+    live = set(list_files(live_dir)) if os.path.isdir(live_dir) else set()
+    built = set(list_files(build_dir))
+    removed = {str(rel).replace(os.sep, '/') for rel in removed}
+
+    status = {}   # 상대 경로 -> 'reused' | 'written'
+
+    for rel in sorted(live - built):
+        if rel in removed:
+            continue
+        _link_or_copy(os.path.join(live_dir, rel), os.path.join(staging, rel))
+        status[rel] = 'reused'
+
+    for rel in sorted(built):
+        src = os.path.join(build_dir, rel)
+        dst = os.path.join(staging, rel)
+        current = os.path.join(live_dir, rel)
+        if rel in live and file_digest(current) == file_digest(src):
+            # 내용이 같으면 현재 파일을 그대로 재사용
+            _link_or_copy(current, dst)
+            status[rel] = 'reused'
+        else:
+            os.makedirs(os.path.dirname(dst), exist_ok=True)
+            os.replace(src, dst)
+            status[rel] = 'written'
+
+    if derived:
+        changed = [rel for rel, state in status.items() if state == 'written'] + sorted(live - set(status))
+        _rebuild_binaries(staging, live_dir, changed, status)
+        _rebuild_analytics(staging, live_dir, changed, status)
+        _rebuild_drilldown(staging, live_dir, changed, status)
+
+    states = list(status.values())
+    stats = {'reused': states.count('reused'), 'written': states.count('written'),
+             'removed': len(live - set(status))}
+    return staging, stats
+
+def _exchange_function():
+    """
+    두 경로를 원자적으로 맞바꾸는 libc 함수와 플래그 (지원하지 않으면 None)
+    """
+    libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+    if sys.platform.startswith('linux') and hasattr(libc, 'renameat2'):
+        at_fdcwd, rename_exchange = -100, 2
+        renameat2 = libc.renameat2
+        renameat2.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_uint]
+        return lambda a, b: renameat2(at_fdcwd, a, at_fdcwd, b, rename_exchange)
+    if sys.platform == 'darwin' and hasattr(libc, 'renamex_np'):
+        rename_swap = 0x2
+        renamex_np = libc.renamex_np
+        renamex_np.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_uint]
+        return lambda a, b: renamex_np(a, b, rename_swap)
+    return None
+
+def exchange_paths(a, b):
+    """
+    두 디렉토리 항목을 한 번의 시스템 호출로 맞바꾸기 (중간에 어느 쪽도 비지 않음)
+
+    Raises:
+        OSError: OS/파일시스템이 원자적 교환을 지원하지 않을 때 (두 경로 모두 그대로)
+    """
+    exchange = _exchange_function()
+    if exchange is None:
+        raise OSError(f"이 OS({sys.platform})에서는 디렉토리를 원자적으로 교환할 수 없습니다: {b}")
+    if exchange(os.fsencode(a), os.fsencode(b)) != 0:
+        errno = ctypes.get_errno()
+        raise OSError(errno, f"디렉토리 원자적 교환 실패: {os.strerror(errno)}", b)
+
+def switch_live(staging, live_dir=LIVE_DIR, releases_dir=RELEASES_DIR):
+    """
+    staging을 live_dir 자리로 원자적으로 교체하고 이전 내용을 릴리스로 보관
+
+    Returns:
+        이전 내용을 옮긴 릴리스 경로 (처음 배포하거나 예전 심볼릭 링크였으면 None)
+    """
+    if not os.path.lexists(live_dir):
+        os.makedirs(os.path.dirname(os.path.abspath(live_dir)), exist_ok=True)
+        os.rename(staging, live_dir)
+        return None
+
+    exchange_paths(staging, live_dir)
+    # 이제 staging 경로에 이전 내용이 있음
+    if os.path.islink(staging):
+        # 예전 심볼릭 링크 방식: 링크만 지우고 가리키던 릴리스는 보관 목록에 남김
+        os.remove(staging)
+        return None
+    previous = _unique_path(os.path.join(releases_dir, _release_id()))
+    os.rename(staging, previous)
+    return previous
+
+def prune_releases(releases_dir=RELEASES_DIR, keep=KEEP_RELEASES):
+    """
+    오래된 이전 릴리스 삭제 (최근 keep개 유지, 작업 중인 .build-/.staging- 디렉토리 제외)
+    """
+    if not os.path.isdir(releases_dir):
+        return
+    releases = sorted(
+        (entry.path for entry in os.scandir(releases_dir)
+         if entry.is_dir(follow_symlinks=False) and not entry.name.startswith('.')),
+        key=os.path.getmtime,
+        reverse=True,
+    )
+    for path in releases[keep:]:
+        shutil.rmtree(path, ignore_errors=True)
+
+def publish(build_dir, live_dir=LIVE_DIR, removed=(), releases_dir=RELEASES_DIR, snapshot=True,
+            database=None, derived=True):
+    """
+    빌드 결과를 스테이징한 뒤 public/data를 원자적으로 교체
+    (바뀐 파일이 없으면 교체하지 않음,
+     derived=True면 파티션이 바뀐 브랜드의 바이너리 / 통계 / 드릴다운 샤드를 다시 생성,
+     snapshot=True면 배포 후 snapshots.py로 버전 스냅샷 기록,
+     database를 지정하면 sqlite_sink.py로 SQLite 파일 갱신)
+
+    Returns:
+        통계 dict (reused / written / removed / release: 이전 내용을 보관한 릴리스 이름)
+    """
+    staging, stats = stage_release(build_dir, live_dir, removed, releases_dir, derived)
+    shutil.rmtree(build_dir, ignore_errors=True)
+    changed = bool(stats['written'] or stats['removed']) or not os.path.isdir(live_dir)
+    stats['release'] = None
+    if changed:
+        try:
+            previous = switch_live(staging, live_dir, releases_dir)
+        except OSError:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        prune_releases(releases_dir)
+        stats['release'] = os.path.basename(previous) if previous else None
+        print(f"🚀 배포 완료: {live_dir} "
+              f"(재사용 {stats['reused']}개, 기록 {stats['written']}개, 삭제 {stats['removed']}개)")
+    else:
+        shutil.rmtree(staging, ignore_errors=True)
+        print(f"⏭️  바뀐 파일이 없어 배포하지 않았습니다: {live_dir} (파일 {stats['reused']}개)")
+
+    if snapshot and changed:
+        from snapshots import record_snapshot
+        stats['snapshot'] = record_snapshot(live_dir, note=stats['release'] or '')
+
+    if database and (changed or not os.path.exists(database)):
+        from sqlite_sink import build_database
+        stats['database_rows'] = build_database(live_dir, database)
+        print(f"🗄️  SQLite 갱신: {database} ({stats['database_rows']:,}행)")
+    return stats
+
+@contextmanager
+def staged_output(output_dir=LIVE_DIR, managed=None, live_dir=LIVE_DIR, releases_dir=RELEASES_DIR,
+                  **publish_options):
+    """
+    public/data에 쓰는 스크립트용 출력 디렉토리
+
+    output_dir이 live_dir(또는 그 하위 폴더)이면 빌드 디렉토리의 같은 위치를 넘겨주고,
+    블록이 정상적으로 끝나면 publish()로 한 번에 배포합니다.
+    블록에서 예외가 나면 빌드 디렉토리만 지우고 public/data는 그대로 둡니다.
+    그 밖의 디렉토리(--output-dir 지정, 테스트 등)는 그대로 넘겨줍니다.
+
+    Args:
+        managed: output_dir 기준 상대 경로 패턴 (re.Pattern). 이번 빌드에 없으면 새 릴리스에서 뺌
+                 (없으면 기존 파일은 모두 유지)
+        publish_options: publish()의 snapshot / database / derived
+
+    예:
+        with staged_output(DATA_DIR, snapshot=False) as target:
+            write_files(target)
+    """
+    rel = os.path.relpath(os.path.abspath(output_dir), os.path.abspath(live_dir))
+    if rel == os.pardir or rel.startswith(os.pardir + os.sep):
+        os.makedirs(output_dir, exist_ok=True)
+        yield output_dir
+        return
+
+    prefix = '' if rel == os.curdir else rel.replace(os.sep, '/') + '/'
+    build_dir = new_build_dir(releases_dir)
+    try:
+        target = os.path.join(build_dir, prefix)
+        os.makedirs(target, exist_ok=True)
+        yield os.path.normpath(target)
+
+        removed = []
+        if managed is not None and os.path.isdir(live_dir):
+            built = set(list_files(build_dir))
+            removed = [path for path in list_files(live_dir)
+                       if path.startswith(prefix) and managed.match(path[len(prefix):])
+                       and path not in built]
+        publish(build_dir, live_dir, removed, releases_dir, **publish_options)
+    finally:
+        shutil.rmtree(build_dir, ignore_errors=True)
+
+def main():
+    """메인 함수: 재유니 데이터 전체 변환 후 배포"""
+    from fast_convert import ReconciliationError, convert_file
+    from input_streams import find_input
+
+    print("\n" + "="*70)
+    print("🚀 전체 변환 + 원자적 배포 시작")
+    print("="*70)
+
+    try:
+        # 이번 변환 결과에 없는 파티션/바이너리 파일은 새 릴리스에서 제외
+        with staged_output(LIVE_DIR, managed=MANAGED_PATTERN, database=DATABASE_FILE) as build_dir:
+            for csv_file in [find_input(p) for p in ('재유니/2024.csv', '재유니/2025.csv')]:
+                if os.path.exists(csv_file):
+                    print(f"📂 처리 중: {csv_file}")
+                    convert_file(csv_file, build_dir)
+                else:
+                    print(f"\n⚠️  파일을 찾을 수 없습니다: {csv_file}\n")
+
+            for path in sorted(Path('재유니').glob('*_20[0-9][0-9].csv')):
+                shutil.copy2(path, os.path.join(build_dir, path.name))
+            # 대시보드용 브랜드별 바이너리/통계/드릴다운 샤드는 publish()가 새 릴리스 파티션으로 생성
+    except ReconciliationError as e:
+        print(f"\n❌ {e}\n   배포하지 않았습니다 (public/data는 이전 릴리스 유지)")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,25 @@
 """
 엑셀 파일을 직접 읽어서 구조 파악
+
+사용법:
+    python read_excel_direct.py               # 전체 시트 읽기
+    python read_excel_direct.py --workers 4   # 시트를 4개 프로세스로 나눠 읽기
+    python read_excel_direct.py --fast        # 헤더 + 일부 행만
 """
-import pandas as pd
 import json
+import os
+import sys
+
+from column_profiler import profile_frame
+from workbook_reader import (
+    SCHEMA_CACHE_KEY,
+    print_schema,
+    read_workbook,
+    sniff_workbook,
+    workers_option,
+)
 
-def analyze_excel_files():
+def analyze_excel_files(fast=False, workers=None):
     files = ['2024.1-12.XLSX', '2025.1-10.XLSX']
     
     all_info = {}
@@ -14,24 +29,32 @@ def analyze_excel_files():
         print(f"파일: {filename}")
         print('='*80)
         
+        if fast:
+            # 헤더 + 일부 행만 읽고 excel_structure.json 캐시에 저장 (크기/수정 시각/첫 블록 해시 키)
+            try:
+                schema = sniff_workbook(filename)
+                print_schema(schema)
+                all_info[filename] = schema
+            except Exception as e:
+                print(f"\n❌ 오류: {e}")
+            continue
+        
         try:
-            # 엑셀 파일 열기
-            xls = pd.ExcelFile(filename)
+            # 엑셀 파일 열기 (한 번 열어서 모든 시트 파싱)
+            sheets = read_workbook(filename, workers=workers)
             
             file_info = {
                 'sheets': [],
                 'filename': filename
             }
             
-            print(f"\n시트 목록: {xls.sheet_names}")
+            print(f"\n시트 목록: {list(sheets)}")
             
-            for sheet_name in xls.sheet_names:
+            for sheet_name, df in sheets.items():
                 print(f"\n{'─'*80}")
                 print(f"시트: {sheet_name}")
                 print('─'*80)
                 
-                df = pd.read_excel(filename, sheet_name=sheet_name)
-                
                 sheet_info = {
                     'name': sheet_name,
                     'rows': len(df),
@@ -53,13 +76,21 @@ def analyze_excel_files():
                 sample = df.head(5).to_dict('records')
                 sheet_info['sample_data'] = sample
                 
+                # 컬럼별 값 분포 (한 번의 해시 집계, 고유 값이 많으면 근사)
+                profiles = profile_frame(df)
+                sheet_info['column_profile'] = profiles
+                
                 # 브랜드 관련 컬럼 찾기
                 for col in df.columns:
                     if any(keyword in str(col).lower() for keyword in ['브랜드', 'brand', '법인']):
                         unique_vals = df[col].dropna().unique()
+                        profile = profiles[str(col)]
+                        if profile['mode'] == 'exact':
+                            top_values = list(profile['value_counts'].items())
+                        else:
+                            top_values = [(item['value'], item['count']) for item in profile['top']]
                         print(f"\n'{col}' 컬럼의 고유 값:")
-                        for val in unique_vals[:20]:  # 최대 20개
-                            count = len(df[df[col] == val])
+                        for val, count in top_values[:20]:  # 최대 20개
                             print(f"  - {val}: {count}개")
                         sheet_info['brand_column'] = col
                         sheet_info['brands'] = [str(v) for v in unique_vals]
@@ -83,6 +114,19 @@ def analyze_excel_files():
             import traceback
             traceback.print_exc()
     
+    if fast:
+        return all_info
+    
+    # 빠른 모드의 스키마 캐시는 유지
+    if os.path.exists('excel_structure.json'):
+        try:
+            with open('excel_structure.json', 'r', encoding='utf-8') as f:
+                previous = json.load(f)
+            if SCHEMA_CACHE_KEY in previous:
+                all_info[SCHEMA_CACHE_KEY] = previous[SCHEMA_CACHE_KEY]
+        except ValueError:
+            pass
+    
     # JSON 파일로 저장
     with open('excel_structure.json', 'w', encoding='utf-8') as f:
         json.dump(all_info, f, ensure_ascii=False, indent=2, default=str)
@@ -94,5 +138,5 @@ def analyze_excel_files():
     return all_info
 
 if __name__ == "__main__":
-    analyze_excel_files()
+    analyze_excel_files(fast='--fast' in sys.argv, workers=workers_option(sys.argv))
 
@@ -0,0 +1,228 @@
+"""
+public/data 버전 스냅샷 (델타 저장)
+
+배포할 때마다 비용 데이터의 스냅샷을 기록합니다.
+직전 스냅샷과 달라진 (브랜드, 월, 키) 행만 저장하고,
+CHECKPOINT_INTERVAL번마다 전체 스냅샷을 저장해서 복원 시간을 제한합니다.
+사업부(조정) 매핑 변경 등으로 과거 월이 재작성되었을 때 어떤 값이 바뀌었는지 확인할 수 있습니다.
+
+키: (brand_id, 년월, 본부, 대분류, 중분류, 소분류) / 값: 금액 합계
+
+사용법:
+    python snapshots.py record              # 현재 public/data 스냅샷 기록
+    python snapshots.py list                # 스냅샷 목록
+    python snapshots.py show 3 -o out.csv   # 스냅샷 3 복원 (CSV로 저장)
+    python snapshots.py diff 2 5            # 스냅샷 2 → 5 변경 내역
+"""
+
+import argparse
+import csv
+import gzip
+import json
+import os
+import sys
+import time
+from decimal import Decimal
+
+from amounts import format_minor, parse_minor
+from cost_facts import DATA_DIR, list_partitions, read_partition
+
+SNAPSHOT_DIR = 'data_snapshots'
+INDEX_FILE = 'index.json'
+CHECKPOINT_INTERVAL = 10   # 델타 10개마다 전체 스냅샷
+
+KEY_COLUMNS = ['brand_id', '년월', '본부', '대분류', '중분류', '소분류']
+
+def collect_facts(data_dir=DATA_DIR):
+    """
+    public/data 파티션을 {키 튜플: 금액 문자열}로 읽기 (같은 키는 최소 단위 정수로 합산)
+    """
+    totals = {}
+    for brand_id, yyyymm, path in list_partitions(data_dir):
+        for row in read_partition(path):
+            key = (brand_id, yyyymm, row['본부'], row['대분류'], row['중분류'], row['소분류'])
+            totals[key] = totals.get(key, 0) + parse_minor(row['금액'])
+    return {key: format_minor(amount) for key, amount in totals.items()}
+
+def _load_index(snapshot_dir):
+    path = os.path.join(snapshot_dir, INDEX_FILE)
+    if not os.path.exists(path):
+        return []
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def _save_index(snapshot_dir, index):
+    path = os.path.join(snapshot_dir, INDEX_FILE)
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, path)
+
+def _write_payload(snapshot_dir, snapshot_id, payload):
+    path = os.path.join(snapshot_dir, f'{snapshot_id:05d}.json.gz')
+    with gzip.open(path, 'wt', encoding='utf-8') as f:
+        json.dump(payload, f, ensure_ascii=False, separators=(',', ':'))
+
+def _read_payload(snapshot_dir, snapshot_id):
+    path = os.path.join(snapshot_dir, f'{snapshot_id:05d}.json.gz')
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        return json.load(f)
+
+def materialize(snapshot_id, snapshot_dir=SNAPSHOT_DIR):
+    """
+    스냅샷 복원: 가장 가까운 전체 스냅샷에서 시작해 델타를 순서대로 적용
+
+    Returns:
+        {키 튜플: 금액 문자열}
+    """
+    index = _load_index(snapshot_dir)
+    ids = [entry['id'] for entry in index]
+    if snapshot_id not in ids:
+        raise KeyError(f"스냅샷을 찾을 수 없습니다: {snapshot_id}")
+
+    pos = ids.index(snapshot_id)
+    start = pos
+    while index[start]['kind'] != 'full':
+        start -= 1
+
+    facts = {}
+    for entry in index[start:pos + 1]:
+        payload = _read_payload(snapshot_dir, entry['id'])
+        if entry['kind'] == 'full':
+            facts = {tuple(row[:-1]): row[-1] for row in payload['rows']}
+            continue
+        for key in payload['removed']:
+            facts.pop(tuple(key), None)
+        for row in payload['upsert']:
+            facts[tuple(row[:-1])] = row[-1]
+    return facts
+
+def diff_facts(old, new):
+    """
+    두 스냅샷 비교
+
+    Returns:
+        [(키 튜플, 이전 금액 또는 None, 새 금액 또는 None)] (키 순 정렬)
+    """
+    changes = []
+    for key in sorted(set(old) | set(new)):
+        before, after = old.get(key), new.get(key)
+        if before is None or after is None or Decimal(before) != Decimal(after):
+            changes.append((key, before, after))
+    return changes
+
+def record_snapshot(data_dir=DATA_DIR, snapshot_dir=SNAPSHOT_DIR, note=''):
+    """
+    현재 데이터를 스냅샷으로 기록 (직전 스냅샷과 같으면 기록하지 않음)
+
+    Returns:
+        새 스냅샷 ID (변화가 없으면 None)
+    """
+    os.makedirs(snapshot_dir, exist_ok=True)
+    index = _load_index(snapshot_dir)
+    facts = collect_facts(data_dir)
+
+    if index:
+        previous = materialize(index[-1]['id'], snapshot_dir)
+        changes = diff_facts(previous, facts)
+        if not changes:
+            print("⏭️  이전 스냅샷과 같아서 기록하지 않았습니다.")
+            return None
+    else:
+        changes = [(key, None, amount) for key, amount in sorted(facts.items())]
+
+    snapshot_id = index[-1]['id'] + 1 if index else 1
+    deltas_since_full = 0
+    for entry in reversed(index):
+        if entry['kind'] == 'full':
+            break
+        deltas_since_full += 1
+
+    if not index or deltas_since_full + 1 >= CHECKPOINT_INTERVAL:
+        kind = 'full'
+        payload = {'rows': [list(key) + [amount] for key, amount in sorted(facts.items())]}
+    else:
+        kind = 'delta'
+        payload = {
+            'upsert': [list(key) + [after] for key, _, after in changes if after is not None],
+            'removed': [list(key) for key, _, after in changes if after is None],
+        }
+    _write_payload(snapshot_dir, snapshot_id, payload)
+
+    index.append({
+        'id': snapshot_id,
+        'kind': kind,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'rows': len(facts),
+        'changed': len(changes),
+        'note': note,
+    })
+    _save_index(snapshot_dir, index)
+    print(f"📸 스냅샷 {snapshot_id} 기록 ({kind}, 변경 {len(changes):,}행 / 전체 {len(facts):,}행)")
+    return snapshot_id
+
+def _write_rows_csv(path, header, rows):
+    with open(path, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='public/data 버전 스냅샷')
+    parser.add_argument('--snapshot-dir', default=SNAPSHOT_DIR)
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    record = sub.add_parser('record', help='현재 데이터 스냅샷 기록')
+    record.add_argument('--data-dir', default=DATA_DIR)
+    record.add_argument('--note', default='')
+
+    sub.add_parser('list', help='스냅샷 목록')
+
+    show = sub.add_parser('show', help='스냅샷 복원')
+    show.add_argument('id', type=int)
+    show.add_argument('-o', '--output', help='CSV로 저장할 경로')
+
+    diff = sub.add_parser('diff', help='두 스냅샷 비교')
+    diff.add_argument('old', type=int)
+    diff.add_argument('new', type=int)
+    diff.add_argument('-o', '--output', help='CSV로 저장할 경로')
+
+    args = parser.parse_args()
+
+    if args.command == 'record':
+        record_snapshot(args.data_dir, args.snapshot_dir, args.note)
+
+    elif args.command == 'list':
+        for entry in _load_index(args.snapshot_dir):
+            print(f"{entry['id']:>5}  {entry['created']}  {entry['kind']:<5}  "
+                  f"전체 {entry['rows']:>7,}행  변경 {entry['changed']:>7,}행  {entry['note']}")
+
+    elif args.command == 'show':
+        facts = materialize(args.id, args.snapshot_dir)
+        rows = [list(key) + [amount] for key, amount in sorted(facts.items())]
+        if args.output:
+            _write_rows_csv(args.output, KEY_COLUMNS + ['금액'], rows)
+            print(f"✅ {len(rows):,}행 저장: {args.output}")
+        else:
+            writer = csv.writer(sys.stdout)
+            writer.writerow(KEY_COLUMNS + ['금액'])
+            writer.writerows(rows)
+
+    elif args.command == 'diff':
+        changes = diff_facts(materialize(args.old, args.snapshot_dir),
+                             materialize(args.new, args.snapshot_dir))
+        rows = [list(key) + [before or '', after or ''] for key, before, after in changes]
+        header = KEY_COLUMNS + [f'금액_{args.old}', f'금액_{args.new}']
+        if args.output:
+            _write_rows_csv(args.output, header, rows)
+            print(f"✅ 변경 {len(rows):,}행 저장: {args.output}")
+        else:
+            print(f"스냅샷 {args.old} → {args.new}: 변경 {len(rows):,}행")
+            for row in rows[:50]:
+                print("  " + " | ".join(row))
+            if len(rows) > 50:
+                print(f"  ... 외 {len(rows) - 50:,}행 (-o로 전체 저장)")
+
+if __name__ == "__main__":
+    main()
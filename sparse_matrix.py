@@ -0,0 +1,294 @@
+"""
+재유니 피벗 CSV의 희소 행렬 표현
+피벗 입력은 대부분 0이므로 읽는 시점에 0이 아닌 칸만
+(행, 월, 금액) 좌표로 모으고, 행의 차원 값(사업부/본부/대분류/중분류/소분류)은 코드로 저장합니다.
+금액은 최소 단위 int64 (amounts.parse_minor)라서 합계가 정확합니다.
+이후 합계, 월별 추출, 브랜드 필터, 파티션 CSV 쓰기는 모두 0이 아닌 값 개수(nnz)에 비례합니다.
+
+구조 (월 기준 CSR):
+    months       월 목록 (YYYYMM)
+    month_ptr    월 i의 값은 row/amount[month_ptr[i]:month_ptr[i+1]]
+    row, amount  값이 있는 원본 행 번호와 금액(최소 단위 정수) (월 → 행 순서)
+    codes        행별 차원 코드 (n_rows × 5, DIMENSIONS 순서)
+    labels       차원별 코드 → 문자열 목록
+
+    source_totals 원천 행의 월별 합계 (읽는 루프에서 fast_convert.tally_source로 누적, 파티션을 쓰기 전 대사에 사용)
+
+저장: np.savez_compressed (.npz, pickle 없이 다시 읽을 수 있음)
+
+사용법:
+    python sparse_matrix.py                              # 재유니/2024.csv, 2025.csv → *.sparse.npz
+    python sparse_matrix.py 재유니/2025.csv --partitions public/data
+"""
+
+import argparse
+import json
+import sys
+import os
+import time
+
+import numpy as np
+
+import input_streams
+from amounts import format_minor
+from dimensions import brand_label, source_column
+from fast_convert import (BRAND_COLUMNS, CATEGORY1_COL, CATEGORY2_COL, DEPT_COL, MONTH_PATTERN,
+                          GRAND_TOTAL_LABEL, ReconciliationError, _cell_text, check_totals,
+                          empty_month_totals, find_month_columns, is_missing, partition_filename,
+                          read_rows, render_partition, tally_source, write_rendered)
+from publish_data import staged_output
+
+DIMENSIONS = ['사업부', '본부', '대분류', '중분류', '소분류']
+SPARSE_SUFFIX = '.sparse.npz'
+
+class SparseCostMatrix:
+    """
+    (행, 월, 금액) 희소 행렬 + 행 차원 코드
+    """
+
+    def __init__(self, months, month_ptr, row, amount, codes, labels, source_totals=None):
+        self.months = list(months)
+        self.month_ptr = month_ptr
+        self.row = row
+        self.amount = amount
+        self.codes = codes
+        self.labels = labels
+        self.source_totals = source_totals
+
+    @property
+    def nnz(self):
+        return len(self.amount)
+
+    @property
+    def n_rows(self):
+        return len(self.codes)
+
+    @classmethod
+    def from_rows(cls, header, rows, year=None):
+        """
+        피벗 행들에서 0이 아닌 칸만 모아 생성 (총합계/사업부 결측 행 제외)
+        원천 월별 합계(source_totals)도 같은 루프에서 칸을 읽으면서 누적해서 보관
+
+        Args:
+            header: 컬럼명 목록
+            rows: 행 목록 (값 리스트, 한 번만 순회)
+            year: 지정하면 해당 연도의 월 컬럼만 사용
+        """
+        col_index = {col: i for i, col in enumerate(header)}
+        brand_col = next((col for col in BRAND_COLUMNS if col in col_index), None)
+        if brand_col is None:
+            raise KeyError(f"사업부 컬럼을 찾을 수 없습니다: {header}")
+        category3_col = source_column(col_index, '소분류')
+        dim_i = [col_index[brand_col], col_index[DEPT_COL], col_index[CATEGORY1_COL],
+                 col_index[CATEGORY2_COL], col_index[category3_col]]
+
+        month_cols = []
+        for col in find_month_columns(header):
+            match = MONTH_PATTERN.search(str(col))
+            if match and (year is None or match.group(1).startswith(str(year))):
+                month_cols.append((match.group(1), col_index[col]))
+
+        lookups = [{} for _ in DIMENSIONS]
+        codes = []
+        entries = [([], []) for _ in month_cols]
+        source = {yyyymm: empty_month_totals() for yyyymm, _ in month_cols}
+        for row in rows:
+            brand = row[dim_i[0]] if dim_i[0] < len(row) else None
+            is_grand = brand == GRAND_TOTAL_LABEL
+            row_no = None
+            if not is_grand and not is_missing(brand):
+                values = [brand_label(brand)] + \
+                         [_cell_text(row[i]) if i < len(row) else '' for i in dim_i[1:]]
+                codes.append([lookup.setdefault(value, len(lookup)) for lookup, value in zip(lookups, values)])
+                row_no = len(codes) - 1
+
+            # 총합계/사업부 결측 행도 원천 합계에는 반영
+            for (month_rows, month_amounts), (yyyymm, i) in zip(entries, month_cols):
+                if i >= len(row):
+                    continue
+                cell = row[i]
+                if cell == '0' or cell == 0:
+                    continue
+                value = tally_source(source[yyyymm], cell, is_grand)
+                if value and row_no is not None:
+                    month_rows.append(row_no)
+                    month_amounts.append(value)
+
+        month_ptr = np.zeros(len(month_cols) + 1, dtype=np.int64)
+        month_ptr[1:] = np.cumsum([len(month_rows) for month_rows, _ in entries])
+        row_arr = np.fromiter((r for month_rows, _ in entries for r in month_rows),
+                              dtype=np.int32, count=int(month_ptr[-1]))
+        amount_arr = np.fromiter((a for _, month_amounts in entries for a in month_amounts),
+                                 dtype=np.int64, count=int(month_ptr[-1]))
+        labels = [list(lookup) for lookup in lookups]
+        return cls([m for m, _ in month_cols], month_ptr, row_arr, amount_arr,
+                   np.array(codes, dtype=np.int32).reshape(-1, len(DIMENSIONS)), labels, source)
+
+    @classmethod
+    def from_file(cls, path, sheet=None, year=None):
+        """CSV/엑셀 파일에서 생성"""
+        header, rows = read_rows(path, sheet)
+        return cls.from_rows(header, rows, year)
+
+    # -----------------------------------------------------------------------
+    # 저장/읽기
+    # -----------------------------------------------------------------------
+
+    def save(self, path):
+        """np.savez_compressed로 저장"""
+        arrays = {
+            'months': np.array(self.months, dtype=str),
+            'month_ptr': self.month_ptr,
+            'row': self.row,
+            'amount': self.amount,
+            'codes': self.codes,
+        }
+        for i, labels in enumerate(self.labels):
+            arrays[f'labels_{i}'] = np.array(labels, dtype=str)
+        if self.source_totals is not None:
+            arrays['source_totals'] = np.array(json.dumps(self.source_totals))
+        np.savez_compressed(path, **arrays)
+
+    @classmethod
+    def load(cls, path):
+        """save()로 저장한 파일 읽기"""
+        with np.load(path, allow_pickle=False) as data:
+            labels = [data[f'labels_{i}'].tolist() for i in range(len(DIMENSIONS))]
+            totals = json.loads(str(data['source_totals'])) if 'source_totals' in data.files else None
+            return cls(data['months'].tolist(), data['month_ptr'], data['row'],
+                       data['amount'], data['codes'], labels, totals)
+
+    # -----------------------------------------------------------------------
+    # O(nnz) 연산
+    # -----------------------------------------------------------------------
+
+    def month_index(self):
+        """값마다의 월 번호 (row/amount와 같은 길이)"""
+        return np.repeat(np.arange(len(self.months)), np.diff(self.month_ptr))
+
+    def month_slice(self, yyyymm):
+        """
+        한 달의 (행 번호, 금액) 배열
+        """
+        i = self.months.index(yyyymm)
+        start, end = self.month_ptr[i], self.month_ptr[i + 1]
+        return self.row[start:end], self.amount[start:end]
+
+    def totals(self, by='month'):
+        """
+        합계 (최소 단위 정수)
+
+        Args:
+            by: 'month' (월별 배열) 또는 차원 이름 (예: '사업부' → {값: 합계})
+        """
+        if by == 'month':
+            index, size = self.month_index(), len(self.months)
+        else:
+            dim = DIMENSIONS.index(by)
+            index, size = self.codes[self.row, dim], len(self.labels[dim])
+        sums = np.zeros(size, dtype=np.int64)
+        np.add.at(sums, index, self.amount)
+        if by == 'month':
+            return sums
+        return dict(zip(self.labels[dim], sums.tolist()))
+
+    def filter(self, mask):
+        """
+        값 단위 마스크(길이 nnz)로 걸러낸 새 행렬 (행 코드/라벨은 공유)
+        """
+        month_ptr = np.zeros_like(self.month_ptr)
+        month_ptr[1:] = np.cumsum(np.bincount(self.month_index()[mask], minlength=len(self.months)))
+        # 걸러낸 행렬은 원천 전체와 합계가 다르므로 source_totals를 넘기지 않음
+        return SparseCostMatrix(self.months, month_ptr, self.row[mask], self.amount[mask],
+                                self.codes, self.labels)
+
+    def brand(self, brand):
+        """사업부 하나만 남긴 행렬 (별칭 가능, 예: Discovery)"""
+        brand = brand_label(brand)
+        if brand not in self.labels[0]:
+            return self.filter(np.zeros(self.nnz, dtype=bool))
+        code = self.labels[0].index(brand)
+        return self.filter(self.codes[self.row, 0] == code)
+
+    def write_partitions(self, output_dir, verbose=True, check=True):
+        """
+        cost_{brand}_{yyyymm}.csv 파티션 쓰기 (fast_convert.convert_rows와 같은 파일)
+        check=True이고 source_totals가 있으면 파일을 쓰기 전에 행렬의 월별 합계(totals)와 대사
+
+        Returns:
+            저장한 파일 경로 목록
+
+        Raises:
+            ReconciliationError: 허용 오차를 넘는 차이나 금액 변환 실패 칸이 있을 때 (파일은 쓰지 않음)
+        """
+        rendered = {}
+        for yyyymm in self.months:
+            rows, amounts = self.month_slice(yyyymm)
+            if not len(rows):
+                continue
+            brand_codes = self.codes[rows, 0]
+            order = np.argsort(brand_codes, kind='stable')
+            bounds = np.flatnonzero(np.diff(brand_codes[order])) + 1
+
+            for group in np.split(order, bounds):
+                brand = self.labels[0][brand_codes[group[0]]]
+                result_rows = []
+                for r, value in zip(rows[group].tolist(), amounts[group].tolist()):
+                    _, dept, category1, category2, category3 = (
+                        labels[c] for labels, c in zip(self.labels, self.codes[r].tolist()))
+                    result_rows.append([brand, dept, dept, category1, category2, category3,
+                                        category3, format_minor(value), yyyymm, ''])
+
+                filename = partition_filename(brand, yyyymm)
+                rendered[os.path.join(output_dir, filename)] = render_partition(result_rows)
+                if verbose:
+                    print(f"   ✅ {brand}: {filename} ({len(result_rows)}개 행)")
+
+        if check and self.source_totals is not None:
+            check_totals(self.source_totals, dict(zip(self.months, self.totals('month').tolist())), verbose)
+
+        os.makedirs(output_dir, exist_ok=True)
+        write_rendered(rendered.items())
+        return list(rendered)
+
+def sparse_path(path):
+    """입력 파일 옆 저장 경로 (예: 재유니/2025.csv, 재유니/2025.csv.gz → 재유니/2025.sparse.npz)"""
+    archive = input_streams.split_member(path)[0]
+    name = os.path.splitext(input_streams.inner_name(path))[0]
+    return os.path.join(os.path.dirname(archive), name + SPARSE_SUFFIX)
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='피벗 입력 → 희소 행렬(.npz)')
+    parser.add_argument('files', nargs='*', default=['재유니/2024.csv', '재유니/2025.csv'])
+    parser.add_argument('--sheet', help='엑셀 입력의 시트 이름')
+    parser.add_argument('--partitions', metavar='DIR', help='희소 행렬에서 파티션 CSV도 쓰기')
+    args = parser.parse_args()
+
+    matrices = []
+    for path in args.files:
+        if not input_streams.exists(path):
+            print(f"⚠️  파일을 찾을 수 없습니다: {path}")
+            continue
+        started = time.perf_counter()
+        matrix = SparseCostMatrix.from_file(path, args.sheet)
+        output = sparse_path(path)
+        matrix.save(output)
+        cells = matrix.n_rows * len(matrix.months)
+        print(f"📂 {path}: {matrix.n_rows:,}행 × {len(matrix.months)}개월, 값 {matrix.nnz:,}개 "
+              f"(밀도 {matrix.nnz / max(cells, 1):.1%}) → {output} "
+              f"({(time.perf_counter() - started) * 1000:.0f}ms)")
+        matrices.append(matrix)
+
+    if args.partitions and matrices:
+        # public/data면 빌드 디렉토리에 쓴 뒤 한 번에 교체 (publish_data)
+        try:
+            with staged_output(args.partitions) as output_dir:
+                for matrix in matrices:
+                    matrix.write_partitions(output_dir, verbose=False)
+        except ReconciliationError as e:
+            print(f"❌ {e}\n   파티션을 쓰지 않았습니다")
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+비용 데이터 SQLite 저장소
+public/data 파티션을 정규화된 SQLite 파일 하나로 저장해서
+서버 없이 브랜드/연도를 가로지르는 쿼리를 바로 실행할 수 있게 합니다.
+
+스키마:
+    dim_brand / dim_dept(본부) / dim_cat1(대분류) / dim_cat2(중분류) / dim_cat3(소분류)
+        (id INTEGER PRIMARY KEY, name TEXT UNIQUE)
+    fact_cost (brand_id, yyyymm, dept_id, cat1_id, cat2_id, cat3_id, amount)
+        amount = 최소 단위 정수 (amounts.parse_minor)
+    인덱스: (brand_id, yyyymm, amount), (brand_id, cat1_id, yyyymm, amount)  -- 합계 쿼리용 커버링 인덱스
+    v_cost: 차원 이름을 붙이고 금액을 원 단위로 보여주는 뷰
+    차원 id는 dimensions.json의 대리 키 (DB를 다시 만들어도, 연도가 달라도 같은 라벨은 같은 id)
+
+새 파일에 한 트랜잭션으로 일괄 입력한 뒤 인덱스를 만들고 기존 파일과 교체합니다.
+
+사용법:
+    python sqlite_sink.py build                       # public/data → cost_facts.sqlite
+    python sqlite_sink.py query "SELECT * FROM v_cost WHERE brand = 'mlb' LIMIT 5"
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+import time
+
+from amounts import parse_minor
+from cost_facts import DATA_DIR, list_partitions, read_partition
+from dimensions import DIMENSIONS_FILE, DimensionStore
+
+DATABASE_FILE = 'cost_facts.sqlite'
+BATCH_SIZE = 50000
+
+# 차원 테이블 -> 파티션 컬럼
+DIMENSION_TABLES = {
+    'dim_dept': '본부',
+    'dim_cat1': '대분류',
+    'dim_cat2': '중분류',
+    'dim_cat3': '소분류',
+}
+
+SCHEMA = """
+CREATE TABLE dim_brand (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE);
+CREATE TABLE dim_dept  (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE);
+CREATE TABLE dim_cat1  (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE);
+CREATE TABLE dim_cat2  (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE);
+CREATE TABLE dim_cat3  (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE);
+CREATE TABLE fact_cost (
+    brand_id INTEGER NOT NULL REFERENCES dim_brand(id),
+    yyyymm   INTEGER NOT NULL,
+    dept_id  INTEGER NOT NULL REFERENCES dim_dept(id),
+    cat1_id  INTEGER NOT NULL REFERENCES dim_cat1(id),
+    cat2_id  INTEGER NOT NULL REFERENCES dim_cat2(id),
+    cat3_id  INTEGER NOT NULL REFERENCES dim_cat3(id),
+    amount   INTEGER NOT NULL
+);
+CREATE VIEW v_cost AS
+SELECT b.name AS brand, f.yyyymm, d.name AS 본부, c1.name AS 대분류, c2.name AS 중분류,
+       c3.name AS 소분류, f.amount / 100.0 AS 금액
+FROM fact_cost f
+JOIN dim_brand b ON b.id = f.brand_id
+JOIN dim_dept d ON d.id = f.dept_id
+JOIN dim_cat1 c1 ON c1.id = f.cat1_id
+JOIN dim_cat2 c2 ON c2.id = f.cat2_id
+JOIN dim_cat3 c3 ON c3.id = f.cat3_id;
+"""
+
+INDEXES = """
+CREATE INDEX idx_fact_brand_month ON fact_cost (brand_id, yyyymm, amount);
+CREATE INDEX idx_fact_brand_cat1_month ON fact_cost (brand_id, cat1_id, yyyymm, amount);
+"""
+
+def _fact_rows(partitions, store):
+    """
+    파티션 행 → fact_cost 행 (차원 값은 store의 대리 키로 변환)
+    """
+    for brand_id, yyyymm, path in partitions:
+        brand_key = store.key('브랜드', brand_id)
+        for row in read_partition(path):
+            dims = [store.key(col, row[col]) for col in DIMENSION_TABLES.values()]
+            yield (brand_key, int(yyyymm), *dims, parse_minor(row['금액']))
+
+def build_database(data_dir=DATA_DIR, db_path=DATABASE_FILE, dimensions_file=DIMENSIONS_FILE):
+    """
+    파티션 전체로 SQLite 파일을 새로 만들고 기존 파일과 교체
+    (새 라벨이 있으면 dimensions_file에 키 추가)
+
+    Returns:
+        입력한 fact 행 수
+    """
+    tmp_path = db_path + '.tmp'
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    conn = sqlite3.connect(tmp_path, isolation_level=None)
+    try:
+        # 새 파일을 한 번에 만드는 작업이므로 저널/동기화 없이 입력 (실패하면 임시 파일만 버림)
+        conn.execute('PRAGMA journal_mode = OFF')
+        conn.execute('PRAGMA synchronous = OFF')
+        conn.executescript(SCHEMA)
+
+        store = DimensionStore.load(dimensions_file)
+        rows = _fact_rows(list_partitions(data_dir), store)
+        count = 0
+        conn.execute('BEGIN')
+        while True:
+            batch = [row for _, row in zip(range(BATCH_SIZE), rows)]
+            if not batch:
+                break
+            conn.executemany('INSERT INTO fact_cost VALUES (?, ?, ?, ?, ?, ?, ?)', batch)
+            count += len(batch)
+        for table, dimension in [('dim_brand', '브랜드'), *DIMENSION_TABLES.items()]:
+            conn.executemany(f'INSERT INTO {table} (id, name) VALUES (?, ?)', store.labels(dimension))
+        conn.execute('COMMIT')
+
+        # 입력 후 인덱스 생성이 행마다 인덱스를 갱신하는 것보다 빠름
+        conn.executescript(INDEXES)
+        conn.execute('ANALYZE')
+    finally:
+        conn.close()
+
+    os.replace(tmp_path, db_path)
+    store.save(dimensions_file)
+    return count
+
+def run_query(db_path, sql):
+    """
+    읽기 전용으로 쿼리 실행
+
+    Returns:
+        (컬럼 이름 목록, 행 목록)
+    """
+    conn = sqlite3.connect(f'file:{db_path}?mode=ro', uri=True)
+    try:
+        cursor = conn.execute(sql)
+        columns = [desc[0] for desc in cursor.description or []]
+        return columns, cursor.fetchall()
+    finally:
+        conn.close()
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='비용 데이터 SQLite 저장소')
+    parser.add_argument('--db', default=DATABASE_FILE)
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    build = sub.add_parser('build', help='public/data 파티션으로 DB 생성')
+    build.add_argument('--data-dir', default=DATA_DIR)
+
+    query = sub.add_parser('query', help='SQL 실행')
+    query.add_argument('sql')
+
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        started = time.perf_counter()
+        count = build_database(args.data_dir, args.db)
+        size_kb = os.path.getsize(args.db) / 1024
+        print(f"✅ {args.db}: {count:,}행 ({size_kb:,.0f}KB, {time.perf_counter() - started:.2f}초)")
+
+    elif args.command == 'query':
+        if not os.path.exists(args.db):
+            print(f"❌ DB 파일이 없습니다: {args.db} (먼저 build 실행)")
+            sys.exit(1)
+        started = time.perf_counter()
+        columns, rows = run_query(args.db, args.sql)
+        elapsed = (time.perf_counter() - started) * 1000
+        print(" | ".join(columns))
+        for row in rows:
+            print(" | ".join('' if v is None else str(v) for v in row))
+        print(f"\n({len(rows):,}행, {elapsed:.1f}ms)")
+
+if __name__ == "__main__":
+    main()
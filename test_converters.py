@@ -0,0 +1,141 @@
+"""
+변환 스크립트 회귀 테스트 (pytest)
+같은 입력이면 어떤 변환 경로를 거쳐도 public/data 파티션이 바이트 단위로 같아야
+publish_data / watch_data의 내용 해시 재사용이 동작합니다.
+
+사용법:
+    python -m pytest -q test_converters.py
+"""
+
+import csv
+import os
+
+import pytest
+
+import convert_new_data
+import fast_convert
+from amounts import parse_minor
+
+SOURCE_FILES = [('재유니/2024.csv', 2024), ('재유니/2025.csv', 2025)]
+
+def read_tree(root):
+    """디렉토리의 {파일명: 바이트}"""
+    result = {}
+    for name in sorted(os.listdir(root)):
+        with open(os.path.join(root, name), 'rb') as f:
+            result[name] = f.read()
+    return result
+
+@pytest.mark.parametrize('csv_file,year', SOURCE_FILES)
+def test_fast_convert_matches_convert_new_data(tmp_path, csv_file, year):
+    if not os.path.exists(csv_file):
+        pytest.skip(f"입력 파일 없음: {csv_file}")
+    legacy_dir, fast_dir = tmp_path / 'legacy', tmp_path / 'fast'
+
+    convert_new_data.convert_csv_data(csv_file, year, str(legacy_dir))
+    fast_convert.convert_file(csv_file, str(fast_dir), verbose=False)
+
+    legacy, fast = read_tree(legacy_dir), read_tree(fast_dir)
+    assert legacy.keys() == fast.keys()
+    differing = [name for name in legacy if legacy[name] != fast[name]]
+    assert not differing, f"내용이 다른 파티션: {differing[:5]}"
+
+SAMPLE_HEADER = ['사업부(조정)', '부서명', '대분류', '중분류', 'Cost Elem desc', '합계 : 202501', '합계 : 202502']
+
+def test_reconciliation_matches_sample(tmp_path):
+    rows = [['MLB', 'MD', '인건비', '급여', '급여_정규직', '1,000.50', '0'],
+            ['MLB Kids', 'MD', '인건비', '급여', '급여_정규직', '20', ' - '],
+            ['총합계', '', '', '', '', '1,020.50', '0']]
+    written = fast_convert.convert_rows(SAMPLE_HEADER, rows, str(tmp_path), verbose=False)
+
+    assert sorted(os.path.basename(p) for p in written) == ['cost_kids_202501.csv', 'cost_mlb_202501.csv']
+    total = 0
+    for path in written:
+        with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+            total += sum(parse_minor(row['금액']) for row in csv.DictReader(f))
+    assert total == 102050
+
+def test_month_columns_after_2025(tmp_path):
+    header = SAMPLE_HEADER[:5] + [' 합계 : 202512 ', '합계 : 202601', '총합계']
+    rows = [['MLB', 'MD', '인건비', '급여', '급여_정규직', '10', '20', '30']]
+    written = fast_convert.convert_rows(header, rows, str(tmp_path), verbose=False)
+
+    assert fast_convert.find_month_columns(header) == [' 합계 : 202512 ', '합계 : 202601']
+    assert sorted(os.path.basename(p) for p in written) == ['cost_mlb_202512.csv', 'cost_mlb_202601.csv']
+
+@pytest.mark.parametrize('row', [
+    ['', 'MD', '인건비', '급여', '급여_정규직', '500', '0'],          # 사업부 결측 (출력에서 빠짐)
+    ['MLB', 'MD', '인건비', '급여', '급여_정규직', '12a.00', '0'],   # 금액으로 읽을 수 없는 칸
+])
+def test_reconciliation_failure_writes_nothing(tmp_path, row):
+    rows = [['MLB', 'MD', '인건비', '급여', '급여_정규직', '1,000', '0'], row]
+
+    with pytest.raises(fast_convert.ReconciliationError):
+        fast_convert.convert_rows(SAMPLE_HEADER, rows, str(tmp_path / 'out'), verbose=False)
+    assert not (tmp_path / 'out').exists()
+
+def write_large_source(path, n_rows=20000):
+    """따옴표 안 줄바꿈, 쉼표 금액, 0/빈 칸을 섞은 큰 피벗 CSV"""
+    import csv
+    import random
+
+    rng = random.Random(7)
+    brands = ['MLB', 'MLB Kids', 'DX', '공통']
+    months = [f'합계 : 2025{m:02d}' for m in range(1, 13)]
+    with open(path, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(SAMPLE_HEADER[:5] + months)
+        for i in range(n_rows):
+            cells = []
+            for _ in months:
+                pick = rng.random()
+                cells.append('0' if pick < 0.3 else '' if pick < 0.4 else f'{rng.randint(-10**7, 10**9) / 100:,.2f}')
+            note = f'계정\n{i % 50}' if i % 97 == 0 else f'계정_{i % 50}'
+            writer.writerow([brands[i % 4], f'부서{i % 13}', '대분류', f'중분류{i % 7}', note] + cells)
+
+def test_chunk_parallel_matches_fast_convert(tmp_path, monkeypatch):
+    import chunk_parallel
+
+    source = tmp_path / 'large.csv'
+    write_large_source(source)
+    monkeypatch.setattr(chunk_parallel, 'MIN_CHUNK_BYTES', 1 << 16)
+    before = set(os.listdir('/dev/shm')) if os.path.isdir('/dev/shm') else set()
+
+    fast_convert.convert_file(str(source), str(tmp_path / 'fast'), verbose=False)
+    chunk_parallel.convert_parallel(str(source), str(tmp_path / 'chunk'), workers=4, verbose=False)
+
+    fast, chunk = read_tree(tmp_path / 'fast'), read_tree(tmp_path / 'chunk')
+    assert fast.keys() == chunk.keys() and len(fast) == 48
+    assert [name for name in fast if fast[name] != chunk[name]] == []
+    if os.path.isdir('/dev/shm'):
+        assert set(os.listdir('/dev/shm')) <= before
+
+def test_batch_conflicting_partitions_fail(tmp_path):
+    import batch_convert
+
+    header = ','.join(SAMPLE_HEADER) + '\n'
+    (tmp_path / 'a.csv').write_text(header + 'MLB,MD,인건비,급여,급여_정규직,100,0\n', encoding='utf-8-sig')
+    (tmp_path / 'b.csv').write_text(header + 'MLB,MD,인건비,급여,급여_정규직,200,0\n', encoding='utf-8-sig')
+    (tmp_path / 'c.csv').write_text(header + 'DX,MD,인건비,급여,급여_정규직,0,300\n', encoding='utf-8-sig')
+    output = tmp_path / 'out'
+    output.mkdir()
+    jobs = [{'input': str(tmp_path / name), 'year': None, 'output': str(output),
+             'destination': str(output), 'target': str(tmp_path / name[0])} for name in ('a.csv', 'b.csv', 'c.csv')]
+    for job in jobs:
+        os.makedirs(job['target'])
+
+    results = batch_convert.run_batch(jobs, workers=1)
+    conflicts = batch_convert.collect_outputs(jobs, results)
+
+    assert conflicts == [(str(output), 'cost_mlb_202501.csv')]
+    assert [r['status'] for r in results] == ['error', 'error', 'ok']
+    assert os.listdir(output) == []
+
+def test_batch_rejects_excel_ledger(tmp_path):
+    import batch_convert
+
+    jobs_file = tmp_path / 'jobs.json'
+    jobs_file.write_text('[{"input": "2024.1-12.XLSX", "year": 2024}, {"input": "재유니/2025.csv"}]', encoding='utf-8')
+
+    with pytest.raises(ValueError, match='excel_data_cleaner'):
+        batch_convert.load_jobs(jobs_file=str(jobs_file))
@@ -1,10 +1,15 @@
-import pandas as pd
 import sys
 
 print("Python version:", sys.version)
 print("\nChecking Excel files...")
 
 files = ['2024.1-12.XLSX', '2025.1-10.XLSX']
+fast = '--fast' in sys.argv  # 헤더 + 일부 행만 읽기
+
+if fast:
+    from workbook_reader import print_schema, sniff_workbook
+else:
+    import pandas as pd
 
 for f in files:
     try:
@@ -12,6 +17,10 @@ for f in files:
         print(f"File: {f}")
         print('='*60)
         
+        if fast:
+            print_schema(sniff_workbook(f))
+            continue
+        
         xls = pd.ExcelFile(f)
         print(f"Sheets: {xls.sheet_names}")
         
@@ -0,0 +1,88 @@
+"""
+publish_data 배포 테스트 (pytest)
+
+사용법:
+    python -m pytest -q test_publish_data.py
+"""
+
+import os
+import re
+
+import publish_data
+from publish_data import publish, staged_output
+
+def write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+def read(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+def test_publish_swaps_real_directory_and_compares_live_bytes(tmp_path):
+    live, releases = str(tmp_path / 'data'), str(tmp_path / 'releases')
+    write(os.path.join(live, 'cost_mlb_202401.csv'), 'a')
+    write(os.path.join(live, 'cost_mlb_202402.csv'), 'b')
+
+    # 배포된 파일을 밖에서 고쳐도 (매니페스트가 아니라) 실제 내용으로 비교
+    write(os.path.join(live, 'cost_mlb_202402.csv'), 'changed')
+    build = publish_data.new_build_dir(releases)
+    write(os.path.join(build, 'cost_mlb_202401.csv'), 'a')
+    write(os.path.join(build, 'cost_mlb_202402.csv'), 'b')
+    stats = publish(build, live, releases_dir=releases, snapshot=False, derived=False)
+
+    assert stats['written'] == 1 and stats['reused'] == 1
+    assert os.path.isdir(live) and not os.path.islink(live)
+    assert read(os.path.join(live, 'cost_mlb_202402.csv')) == 'b'
+    assert sorted(os.listdir(live)) == ['cost_mlb_202401.csv', 'cost_mlb_202402.csv']
+    # 이전 내용은 릴리스 보관 디렉토리로
+    previous = os.path.join(releases, stats['release'])
+    assert read(os.path.join(previous, 'cost_mlb_202402.csv')) == 'changed'
+
+def test_staged_output_publishes_only_on_success(tmp_path):
+    live, releases = str(tmp_path / 'data'), str(tmp_path / 'releases')
+    write(os.path.join(live, 'analytics_mlb.json'), 'old')
+    write(os.path.join(live, 'analytics_kids.json'), 'old')
+    pattern = re.compile(r'^analytics_[a-z-]+\.json$')
+
+    try:
+        with staged_output(live, managed=pattern, live_dir=live, releases_dir=releases,
+                           snapshot=False) as target:
+            write(os.path.join(target, 'analytics_mlb.json'), 'half')
+            raise RuntimeError('중단')
+    except RuntimeError:
+        pass
+    assert read(os.path.join(live, 'analytics_mlb.json')) == 'old'
+
+    with staged_output(live, managed=pattern, live_dir=live, releases_dir=releases,
+                       snapshot=False) as target:
+        assert target != live
+        write(os.path.join(target, 'analytics_mlb.json'), 'new')
+    assert read(os.path.join(live, 'analytics_mlb.json')) == 'new'
+    assert not os.path.exists(os.path.join(live, 'analytics_kids.json'))
+
+def test_publish_rebuilds_binary_for_changed_partitions(tmp_path):
+    from binary_export import binary_filename, decode_brand
+
+    live, releases = str(tmp_path / 'data'), str(tmp_path / 'releases')
+    header = '브랜드,본부,팀,대분류,중분류,소분류,계정과목,금액,년월,비고\n'
+    write(os.path.join(live, 'cost_mlb_202401.csv'), header + 'MLB,MD,MD,인건비,급여,급여,급여,100.00,202401,\n')
+    # 바이너리가 없는 브랜드는 빈 빌드를 배포해도 생성
+    publish(publish_data.new_build_dir(releases), live, releases_dir=releases, snapshot=False)
+    assert os.path.exists(os.path.join(live, binary_filename('mlb')))
+
+    # 바이너리를 만들지 않는 변환기로 파티션만 바꿔도 바이너리가 따라옴 (0원 행/공백 제외)
+    build = publish_data.new_build_dir(releases)
+    write(os.path.join(build, 'cost_mlb_202401.csv'),
+          header + 'MLB, MD ,MD,인건비,급여,급여,급여,250.50,202401,\nMLB,MD,MD,인건비,급여,급여,급여,0.00,202401,\n')
+    publish(build, live, releases_dir=releases, snapshot=False)
+    with open(os.path.join(live, binary_filename('mlb')), 'rb') as f:
+        columns, months, offsets, amounts, codes, strings = decode_brand(f.read())
+    assert months == ['202401'] and amounts.tolist() == [25050]
+    assert strings[codes['본부'][0]] == 'MD'
+
+    # 파티션이 모두 빠지면 바이너리도 삭제
+    build = publish_data.new_build_dir(releases)
+    publish(build, live, removed=['cost_mlb_202401.csv'], releases_dir=releases, snapshot=False)
+    assert os.listdir(live) == []
@@ -0,0 +1,249 @@
+"""
+재유니 폴더를 감시하다가 변경된 파일만 다시 변환하는 스크립트
+- 2024.csv / 2025.csv: 바뀐 브랜드/월 파티션만 cost_{brand}_{yyyymm}.csv로 재생성
+  (2025.csv.gz / .zst / .zip 처럼 압축된 파일도 풀지 않고 바로 읽음)
+  바뀐 브랜드의 대시보드용 바이너리 cost_{brand}.bin은 배포할 때 publish_data가 다시 생성
+  변환하면서 누적한 원천 파일 합계와 출력 합계를 파티션을 쓰기 전에 대사 (convert_new_data)
+- 인원수_YYYY.csv / 실판매출_YYYY.csv: public/data로 그대로 복사
+변경분은 항상 빌드 디렉토리에 쓴 뒤 publish_data로 public/data를 한 번에 교체합니다.
+
+사용법:
+    python watch_data.py            # 감시 시작 (Ctrl+C로 종료)
+    python watch_data.py --initial  # 시작할 때 전체 변환 후 감시
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import shutil
+import sys
+import time
+
+import pandas as pd
+
+from convert_new_data import (
+    convert_csv_data,
+    find_month_columns,
+    partition_filename,
+    read_source_csv,
+)
+from dimensions import source_column
+from fast_convert import MONTH_PATTERN, ReconciliationError
+from publish_data import new_build_dir, publish
+
+WATCH_DIR = '재유니'
+OUTPUT_DIR = 'public/data'
+POLL_INTERVAL = 1.0     # 폴링 주기 (초)
+DEBOUNCE_SECONDS = 2.0  # 마지막 쓰기 이후 이 시간 동안 변화가 없어야 변환
+
+# 연도별 비용 피벗 (예: 2024.csv, 2024.csv.gz)
+SOURCE_PATTERN = re.compile(r'^(20\d{2})\.csv(?:\.gz|\.zst|\.zip)?$')
+# 대시보드가 그대로 읽는 보조 파일
+COPY_PATTERN = re.compile(r'^(인원수|실판매출)_20\d{2}\.csv$')
+
+def scan_inputs(watch_dir):
+    """
+    감시 대상 파일의 (수정시각, 크기) 스냅샷
+    """
+    snapshot = {}
+    if not os.path.isdir(watch_dir):
+        return snapshot
+    for entry in os.scandir(watch_dir):
+        if not entry.is_file():
+            continue
+        if SOURCE_PATTERN.match(entry.name) or COPY_PATTERN.match(entry.name):
+            stat = entry.stat()
+            snapshot[entry.path] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+def partition_fingerprints(df):
+    """
+    (사업부, YYYYMM) 파티션별 내용 해시 계산
+
+    Returns:
+        {(사업부, YYYYMM): 해시 문자열}
+    """
+    brand_col = source_column(df.columns, '브랜드')
+    category3_col = source_column(df.columns, '소분류')
+    dim_cols = ['부서명', '대분류', '중분류', category3_col]
+
+    fingerprints = {}
+    for month_col in find_month_columns(df.columns):
+        month_match = MONTH_PATTERN.search(str(month_col))
+        if not month_match:
+            continue
+        yyyymm = month_match.group(1)
+
+        for brand, brand_df in df.groupby(brand_col, sort=False):
+            if brand in ['총합계', 'nan']:
+                continue
+            row_hashes = pd.util.hash_pandas_object(brand_df[dim_cols + [month_col]], index=False)
+            digest = hashlib.blake2b(row_hashes.values.tobytes(), digest_size=16).hexdigest()
+            fingerprints[(brand, yyyymm)] = digest
+    return fingerprints
+
+class DataWatcher:
+    """
+    재유니 폴더 폴링 + 디바운스 + 파티션 단위 재변환
+
+    읽어 둔 데이터프레임과 파티션 해시를 메모리에 유지하므로
+    변경이 생길 때마다 pandas import나 전체 재변환 비용을 다시 치르지 않음
+    """
+
+    def __init__(self, watch_dir=WATCH_DIR, output_dir=OUTPUT_DIR, debounce=DEBOUNCE_SECONDS):
+        self.watch_dir = watch_dir
+        self.output_dir = output_dir
+        self.debounce = debounce
+        self.snapshot = {}
+        self.fingerprints = {}  # 파일 경로 -> {(사업부, YYYYMM): 해시}
+        self.pending = {}       # 파일 경로 -> 마지막으로 변화를 본 시각
+
+    def prime(self, convert=False):
+        """
+        현재 파일 상태를 기준점으로 기록 (convert=True면 전체 변환도 수행)
+        """
+        self.snapshot = scan_inputs(self.watch_dir)
+        for path in sorted(self.snapshot):
+            if convert:
+                self.process(path, full=True)
+            elif SOURCE_PATTERN.match(os.path.basename(path)):
+                self.fingerprints[path] = partition_fingerprints(read_source_csv(path))
+        print(f"👀 감시 대상 {len(self.snapshot)}개 파일: {self.watch_dir}/")
+
+    def poll(self):
+        """
+        파일 변화를 확인하고, 디바운스 시간이 지난 파일만 처리
+
+        Returns:
+            처리한 파일 경로 목록
+        """
+        now = time.monotonic()
+        current = scan_inputs(self.watch_dir)
+
+        for path, state in current.items():
+            if self.snapshot.get(path) != state:
+                self.pending[path] = now
+        for path in set(self.snapshot) - set(current):
+            print(f"⚠️  파일이 삭제되었습니다 (기존 출력은 유지): {path}")
+            self.pending.pop(path, None)
+            self.fingerprints.pop(path, None)
+        self.snapshot = current
+
+        processed = []
+        for path, changed_at in list(self.pending.items()):
+            if now - changed_at < self.debounce:
+                continue
+            try:
+                self.process(path)
+            except ReconciliationError as e:
+                # 같은 내용으로 다시 시도해도 결과가 같으므로 파일이 다시 바뀔 때까지 대기
+                print(f"❌ 원천/출력 합계 불일치로 배포하지 않았습니다: {path}\n{e}")
+                del self.pending[path]
+                continue
+            except Exception as e:
+                # 쓰기 도중인 파일 등은 다음 주기에 다시 시도
+                print(f"❌ 처리 실패, 재시도 예정: {path} ({e})")
+                self.pending[path] = now
+                continue
+            del self.pending[path]
+            processed.append(path)
+        return processed
+
+    def process(self, path, full=False):
+        """
+        변경된 파일 하나를 처리 (빌드 디렉토리에 쓴 뒤 output_dir을 원자적으로 교체)
+        """
+        name = os.path.basename(path)
+        started = time.perf_counter()
+        target_dir = new_build_dir()
+
+        try:
+            stale = self._convert(path, name, target_dir, full)
+        except Exception:
+            shutil.rmtree(target_dir, ignore_errors=True)
+            raise
+
+        if stale is None:
+            shutil.rmtree(target_dir, ignore_errors=True)
+        else:
+            publish(target_dir, self.output_dir, removed=stale)
+
+        if stale is not None:
+            elapsed = time.perf_counter() - started
+            print(f"✅ {name}: 처리 완료 ({elapsed:.2f}초)")
+
+    def _convert(self, path, name, target_dir, full):
+        """
+        target_dir에 변경분을 기록하고, 삭제해야 할 파일명 목록을 반환
+        (변화가 없으면 None)
+        """
+        if COPY_PATTERN.match(name):
+            os.makedirs(target_dir, exist_ok=True)
+            shutil.copy2(path, os.path.join(target_dir, name))
+            print(f"📋 복사 완료: {name}")
+            return []
+
+        year = int(SOURCE_PATTERN.match(name).group(1))
+        df = read_source_csv(path)
+        new_fps = partition_fingerprints(df)
+        old_fps = {} if full else self.fingerprints.get(path, {})
+
+        changed = {key for key, digest in new_fps.items() if old_fps.get(key) != digest}
+        removed = set(old_fps) - set(new_fps)
+
+        if not changed and not removed and not full:
+            self.fingerprints[path] = new_fps
+            print(f"⏭️  내용 변화 없음: {name}")
+            return None
+
+        written = convert_csv_data(path, year, target_dir, df=df,
+                                   partitions=None if full else changed)
+
+        # 값이 모두 0이 되었거나 사라진 파티션은 이전 파일 삭제
+        written_names = {os.path.basename(p) for p in written}
+        stale = []
+        for brand, yyyymm in changed | removed:
+            filename = partition_filename(brand, yyyymm)
+            filepath = os.path.join(self.output_dir, filename)
+            if filename not in written_names and os.path.exists(filepath):
+                stale.append(filename)
+                print(f"   🗑️  삭제: {filename}")
+
+        self.fingerprints[path] = new_fps
+        print(f"   {len(changed | removed)}개 파티션 갱신")
+        return stale
+
+    def run(self, interval=POLL_INTERVAL):
+        """
+        Ctrl+C로 종료할 때까지 폴링
+        """
+        while True:
+            self.poll()
+            time.sleep(interval)
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='재유니 폴더 감시 및 증분 변환')
+    parser.add_argument('--watch-dir', default=WATCH_DIR)
+    parser.add_argument('--output-dir', default=OUTPUT_DIR)
+    parser.add_argument('--interval', type=float, default=POLL_INTERVAL, help='폴링 주기 (초)')
+    parser.add_argument('--debounce', type=float, default=DEBOUNCE_SECONDS, help='디바운스 시간 (초)')
+    parser.add_argument('--initial', action='store_true', help='시작할 때 전체 변환')
+    args = parser.parse_args()
+
+    print("\n" + "="*70)
+    print("🚀 데이터 감시 모드 시작 (Ctrl+C로 종료)")
+    print("="*70 + "\n")
+
+    watcher = DataWatcher(args.watch_dir, args.output_dir, args.debounce)
+    watcher.prime(convert=args.initial)
+
+    try:
+        watcher.run(args.interval)
+    except KeyboardInterrupt:
+        print("\n\n감시를 종료합니다.")
+        sys.exit(0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+"""
+엑셀 워크북 리더
+- read_workbook: 파일을 한 번만 열고, 그 핸들에서 필요한 시트를 모두 읽습니다.
+  (시트마다 pd.read_excel(파일명)을 호출하면 압축 해제/파싱을 시트 수만큼 반복함)
+  호출 스크립트의 --workers N 으로 시트를 여러 프로세스에 나눠 읽을 수 있습니다.
+- sniff_workbook: 헤더와 앞부분 몇 행만 읽어서 컬럼/타입/월 컬럼을 빠르게 파악합니다.
+  결과는 excel_structure.json에 (크기, 수정 시각, 첫 블록 해시) 키로 캐시하고
+  같은 파일의 이전 항목과 SCHEMA_CACHE_LIMIT개를 넘는 오래된 항목은 지웁니다.
+"""
+
+import csv
+import datetime
+import hashlib
+import io
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+# 워커 프로세스별 워크북 핸들 (initializer에서 한 번만 생성)
+_worker_xls = None
+
+def _init_worker(data):
+    import pandas as pd
+
+    global _worker_xls
+    _worker_xls = pd.ExcelFile(io.BytesIO(data))
+
+def _parse_sheet(sheet_name):
+    return _worker_xls.parse(sheet_name)
+
+def read_workbook(path, sheet_names=None, workers=None):
+    """
+    워크북을 한 번 열어서 요청한 시트를 모두 데이터프레임으로 읽기
+
+    Args:
+        path: 엑셀 파일 경로
+        sheet_names: 읽을 시트 이름 목록 (없으면 전체 시트)
+        workers: 시트를 나눠 읽을 프로세스 수 (None/1이면 현재 프로세스에서 순서대로)
+
+    Returns:
+        {시트 이름: 데이터프레임} (워크북의 시트 순서 유지)
+    """
+    import pandas as pd
+
+    with pd.ExcelFile(path) as xls:
+        names = list(xls.sheet_names) if sheet_names is None else list(sheet_names)
+        if not workers or workers <= 1 or len(names) <= 1:
+            return {name: xls.parse(name) for name in names}
+
+    # 병렬 모드: 파일은 한 번만 읽고, 워커마다 메모리의 바이트로 핸들을 하나씩 생성
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    max_workers = min(workers, len(names), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                             initargs=(data,)) as pool:
+        frames = list(pool.map(_parse_sheet, names))
+    return dict(zip(names, frames))
+
+def workers_option(argv):
+    """명령줄의 --workers N (없으면 None: 현재 프로세스에서 순서대로 읽음)"""
+    if '--workers' not in argv:
+        return None
+    return int(argv[argv.index('--workers') + 1])
+
+# ---------------------------------------------------------------------------
+# 빠른 구조 확인 (헤더 + 일부 행만 읽기)
+# ---------------------------------------------------------------------------
+
+SNIFF_SAMPLE_ROWS = 20
+SCHEMA_CACHE_FILE = 'excel_structure.json'
+SCHEMA_CACHE_KEY = 'schema_cache'
+SCHEMA_CACHE_LIMIT = 32          # 캐시에 남길 최대 항목 수 (오래된 것부터 삭제)
+SIGNATURE_BLOCK_BYTES = 1 << 20  # 캐시 키에 해시할 파일 앞부분 크기
+CSV_ENCODINGS = ('utf-8-sig', 'cp949', 'euc-kr')
+
+# "202401", "합계 : 202401", " 합계 : 202510 " 형태의 월 컬럼
+MONTH_COLUMN_PATTERN = re.compile(r'^\D*(20\d{2})(0[1-9]|1[0-2])\D*$')
+NUMERIC_TEXT_PATTERN = re.compile(r'^-?[\d,]+(\.\d+)?$')
+
+def file_signature(path):
+    """
+    스키마 캐시 키: 파일 크기, 수정 시각(ns), 앞부분 SIGNATURE_BLOCK_BYTES의 sha256
+    (큰 워크북 전체를 해시하지 않고도 바뀐 파일을 구분)
+    """
+    stat = os.stat(path)
+    with open(path, 'rb') as f:
+        head = hashlib.sha256(f.read(SIGNATURE_BLOCK_BYTES)).hexdigest()
+    return f'{stat.st_size}:{stat.st_mtime_ns}:{head}'
+
+def infer_type(values):
+    """
+    샘플 값으로 컬럼 타입 추정 (empty / int / float / numeric_text / datetime / bool / string / mixed)
+    """
+    kinds = set()
+    for value in values:
+        if value is None or (isinstance(value, str) and not value.strip()):
+            continue
+        if isinstance(value, bool):
+            kinds.add('bool')
+        elif isinstance(value, int):
+            kinds.add('int')
+        elif isinstance(value, float):
+            kinds.add('float')
+        elif isinstance(value, (datetime.date, datetime.datetime)):
+            kinds.add('datetime')
+        elif NUMERIC_TEXT_PATTERN.match(str(value).strip()):
+            kinds.add('numeric_text')
+        else:
+            kinds.add('string')
+
+    if not kinds:
+        return 'empty'
+    if kinds == {'int', 'float'}:
+        return 'float'
+    if len(kinds) == 1:
+        return kinds.pop()
+    if kinds <= {'int', 'float', 'numeric_text'}:
+        return 'numeric_text'
+    return 'mixed'
+
+def unique_columns(header):
+    """
+    헤더 이름 정리 (pandas와 같은 규칙: 빈 이름은 'Unnamed: i', 중복은 '이름.1', '이름.2' ...)
+    """
+    columns, seen = [], set()
+    for i, col in enumerate(header):
+        name = f'Unnamed: {i}' if col is None or not str(col).strip() else str(col)
+        candidate, suffix = name, 0
+        while candidate in seen:
+            suffix += 1
+            candidate = f'{name}.{suffix}'
+        seen.add(candidate)
+        columns.append(candidate)
+    return columns
+
+def _sniff_rows(header, rows):
+    columns = unique_columns(header)
+    types = {}
+    month_columns = []
+    for i, col in enumerate(columns):
+        types[col] = infer_type(row[i] if i < len(row) else None for row in rows)
+        month_match = MONTH_COLUMN_PATTERN.match(col.strip())
+        if month_match:
+            month_columns.append({'column': col, 'yyyymm': month_match.group(1) + month_match.group(2)})
+    return {
+        'columns': columns,
+        'types': types,
+        'month_columns': month_columns,
+        'sample_data': [dict(zip(columns, row)) for row in rows],
+    }
+
+def _sniff_excel(path, sample_rows):
+    from openpyxl import load_workbook
+
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        sheets = []
+        for ws in wb.worksheets:
+            rows = ws.iter_rows(max_row=sample_rows + 1, values_only=True)
+            header = next(rows, ())
+            info = _sniff_rows(header, [tuple(row) for row in rows])
+            # read_only 모드의 max_row는 시트 dimension 정보 (파일에 없으면 None)
+            info['rows_estimate'] = ws.max_row - 1 if ws.max_row else None
+            sheets.append({'name': ws.title, **info})
+        return sheets
+    finally:
+        wb.close()
+
+def _sniff_csv(path, sample_rows):
+    for encoding in CSV_ENCODINGS:
+        try:
+            with open(path, 'r', encoding=encoding, newline='') as f:
+                reader = csv.reader(f)
+                header = next(reader, [])
+                rows = [tuple(row) for _, row in zip(range(sample_rows), reader)]
+            break
+        except UnicodeDecodeError:
+            continue
+    else:
+        raise ValueError(f"{path}: 인코딩을 알 수 없습니다 (시도: {', '.join(CSV_ENCODINGS)})")
+    info = _sniff_rows(header, rows)
+    info['rows_estimate'] = None
+    return [{'name': os.path.basename(path), **info}]
+
+def sniff_workbook(path, sample_rows=SNIFF_SAMPLE_ROWS, cache_file=SCHEMA_CACHE_FILE):
+    """
+    헤더 행과 앞부분 sample_rows개 행만 읽어서 시트 구조 파악
+    (결과는 cache_file에 file_signature 기준으로 캐시)
+
+    Returns:
+        {'filename', 'signature', 'sample_rows', 'cached', 'sheets': [{name, columns, types, month_columns, ...}]}
+
+    Raises:
+        ValueError: CSV를 어떤 인코딩으로도 읽을 수 없을 때
+    """
+    signature = file_signature(path)
+
+    cache_data = {}
+    if cache_file and os.path.exists(cache_file):
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                cache_data = json.load(f)
+        except (OSError, ValueError):
+            cache_data = {}
+    cache = cache_data.get(SCHEMA_CACHE_KEY, {})
+
+    cached = cache.get(signature)
+    if cached and cached.get('sample_rows') == sample_rows:
+        return {**cached, 'filename': path, 'cached': True}
+
+    if path.lower().endswith('.csv'):
+        sheets = _sniff_csv(path, sample_rows)
+    else:
+        sheets = _sniff_excel(path, sample_rows)
+
+    schema = {'filename': path, 'signature': signature, 'sample_rows': sample_rows, 'sheets': sheets}
+
+    if cache_file:
+        # 같은 파일의 이전 버전 항목은 삭제하고, 최근 SCHEMA_CACHE_LIMIT개만 유지
+        cache = {key: entry for key, entry in cache.items()
+                 if isinstance(entry, dict) and entry.get('filename') != path}
+        cache[signature] = schema
+        cache_data[SCHEMA_CACHE_KEY] = dict(list(cache.items())[-SCHEMA_CACHE_LIMIT:])
+        tmp = cache_file + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(cache_data, f, ensure_ascii=False, indent=2, default=str)
+        os.replace(tmp, cache_file)
+
+    return {**schema, 'cached': False}
+
+def print_schema(schema, sample_rows=3):
+    """
+    sniff_workbook 결과 출력
+    """
+    source = '캐시' if schema.get('cached') else '샘플링'
+    print(f"📑 시트 목록: {[sheet['name'] for sheet in schema['sheets']]} ({source})\n")
+    for sheet in schema['sheets']:
+        print(f"--- 시트: {sheet['name']} ---")
+        if sheet.get('rows_estimate') is not None:
+            print(f"행 수(추정): {sheet['rows_estimate']}")
+        print(f"컬럼 ({len(sheet['columns'])}개):")
+        for col in sheet['columns']:
+            print(f"  - {col} [{sheet['types'][col]}]")
+        months = [m['yyyymm'] for m in sheet['month_columns']]
+        print(f"월 컬럼 ({len(months)}개): {months}")
+        if sample_rows:
+            print(f"처음 {sample_rows}행:")
+            for row in sheet['sample_data'][:sample_rows]:
+                print(f"  {row}")
+        print()